@@ -27,7 +27,7 @@ from PyQt5.QtGui import QIcon, QPixmap, QFont, QColor, QPalette
 #from PyQt5.QtWebEngineWidgets import QWebEngineView
 from PyQt5.QtSvg import QSvgWidget, QSvgRenderer
 import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import time
 import random
 import webbrowser
@@ -38,16 +38,34 @@ from urllib3.util.retry import Retry
 import deezer
 import spotipy
 import re
+import unicodedata
 from fuzzywuzzy import fuzz
 from datetime import datetime, timedelta
 from time import time_ns
 import threading
+from functools import lru_cache
+from collections import Counter, ChainMap
+from array import array
+import heapq
+from bisect import bisect_left
 from email.utils import parsedate_to_datetime
 import secrets
 
 CONFIG_FILE = "app_config.json"
 SYNC_CONFIG_FILE = "sync_config.json"
 CACHE_FILE = "playlist_cache.json"
+LIBRARY_INDEX_FILE = "library_index_{section_id}.json"
+LIBRARY_INDEX_PAGE_SIZE = 1000
+PLAYLIST_PAGE_SIZE = 200  # playlist items fetched per request by the playlist editor
+LIBRARY_INDEX_REFRESH_INTERVAL = 300  # seconds before a delta refresh is worth repeating
+MATCH_MEMO_FILE = "match_memo.json"
+EXACT_MATCH_DURATION_TOLERANCE = 3000  # ms a source track may differ from its library copy
+REVIEW_CANDIDATE_COUNT = 5  # candidates kept per track in the end-of-import review queue
+MATCH_WORKERS = 8  # tracks matched concurrently during an import
+PLEX_MAX_REQUESTS = 4  # default in-flight request limit per Plex server ("plex_max_requests" in app_config.json)
+PLEX_REQUEST_TIMEOUT = 30  # seconds before a single Plex request is abandoned
+PLEX_POOL_HEADROOM = 4  # pooled connections kept beyond the matcher concurrency (index builds, UI calls)
+SECTION_AFFINITY_BONUS = 1.0  # score bonus for the selected section when matching spans several ("match_sections")
 SPOTIFY_LOGGED_IN = False
 SPOTIFY_USER_INFO = {}
 OAUTH_SERVER = None
@@ -88,6 +106,28 @@ class PlaylistCache:
         self.cache_data["last_updated"][playlist_id] = datetime.now().isoformat()
         self.save_cache()
     
+    def set_playlist_summaries(self, playlists):
+        """Cache track counts for every playlist from the /playlists listing, saving once"""
+        now = datetime.now().isoformat()
+        for playlist in playlists:
+            track_count = getattr(playlist, 'leafCount', None)
+            if track_count is None:
+                continue
+            playlist_id = str(playlist.ratingKey)
+            updated_at = playlist.updatedAt.isoformat() if getattr(playlist, 'updatedAt', None) else None
+            cached = self.cache_data["playlists"].get(playlist_id) or {}
+            # Cached tracks stay valid only while the playlist is unchanged on the server
+            tracks_data = cached.get("tracks_data") if updated_at and cached.get("updated_at") == updated_at else None
+            self.cache_data["playlists"][playlist_id] = {
+                "track_count": track_count,
+                "tracks_data": tracks_data,
+                "duration": getattr(playlist, 'duration', None),
+                "updated_at": updated_at,
+                "cached_at": now
+            }
+            self.cache_data["last_updated"][playlist_id] = now
+        self.save_cache()
+    
     def is_cached(self, playlist_id):
         return playlist_id in self.cache_data["playlists"]
     
@@ -126,7 +166,10 @@ def initialize_config():
             "token": "",
             "last_section": None,
             "auto_backup": True,
-            "backup_interval": 24
+            "backup_interval": 24,
+            "match_workers": MATCH_WORKERS,
+            "plex_max_requests": PLEX_MAX_REQUESTS,
+            "match_sections": []
         }
         try:
             with open(CONFIG_FILE, 'w') as config_file:
@@ -164,6 +207,14 @@ def initialize_config():
         except Exception as e:
             logging.error(f"Failed to create {CACHE_FILE}: {str(e)}")
 
+def get_config_value(key, default=None):
+    """Read a single setting from the app config, falling back to default"""
+    try:
+        with open(CONFIG_FILE, 'r') as config_file:
+            return json.load(config_file).get(key, default)
+    except Exception:
+        return default
+
 def setup_logging():
     # Use a directory where we're sure to have write permissions
     log_dir = tempfile.gettempdir()
@@ -204,6 +255,2311 @@ def setup_logging():
         )
         logging.warning("Logging to console only due to file access issues")
 
+# TEXT NORMALIZATION - shared by every matcher; patterns are compiled once and each
+# distinct string is cleaned once thanks to the LRU memo on every function below
+NORMALIZATION_CACHE_SIZE = 65536
+
+VERSION_WORDS = r'remaster|remastered|remix|mix|edit|version|acoustic|live|unplugged|demo|deluxe|anniversary|edition|stereo|mono|explicit|clean|radio|single|album'
+ARTIST_VERSION_WORDS = r'remaster|remastered|remix|mix|edit|version|deluxe|anniversary|edition'
+PRESERVED_VERSION_WORDS = r'remix|mix|edit|version|remaster|acoustic|live|unplugged|demo'
+
+# "2015 Remaster - Van Halen" / "Van Halen - 2015 Remaster"
+ARTIST_REMASTER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'^\d{4}\s*remaster\s*-\s*',
+    r'^\d{4}\s*remastered\s*-\s*',
+    r'^\s*remaster\s*-\s*',
+    r'^\s*remastered\s*-\s*',
+    r'\s*-\s*\d{4}\s*remaster$',
+    r'\s*-\s*\d{4}\s*remastered$',
+    r'\s*-\s*remaster$',
+    r'\s*-\s*remastered$',
+))
+ARTIST_VERSION_PATTERNS = (
+    re.compile(rf'\s*\([^)]*(?:{ARTIST_VERSION_WORDS})[^)]*\)', re.IGNORECASE),
+    re.compile(rf'\s*\[[^\]]*(?:{ARTIST_VERSION_WORDS})[^\]]*\]', re.IGNORECASE),
+)
+ARTIST_FEAT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\s*\bfeat\.?\s+.+$',      # feat. Artist (everything after)
+    r'\s*\bft\.?\s+.+$',        # ft. Artist (everything after) - not the end of "Daft Punk"
+    r'\s*\bfeaturing\s+.+$',    # featuring Artist (everything after)
+    r'\s*\bwith\s+.+$',         # with Artist (everything after)
+    r',\s*(?:feat\.?|ft\.?|featuring|with)\s+.+$',  # , feat. Artist
+))
+
+# Featured artists in brackets, e.g. "(feat. Artist)", "[with Artist]"
+BRACKETED_FEAT_PATTERNS = (
+    re.compile(r'\s*\((?:feat\.?|featuring|ft\.?|with|f\.)\s+[^)]+\)', re.IGNORECASE),
+    re.compile(r'\s*\[(?:feat\.?|featuring|ft\.?|with)\s+[^\]]+\]', re.IGNORECASE),
+)
+# Featured artists without brackets - everything after the keyword goes
+TRAILING_FEAT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\s+feat\.?\s+.*$',
+    r'\s+featuring\s+.*$',
+    r'\s+ft\.?\s+.*$',
+    r'\s+with\s+.*$',
+    r'\s+f\.\s+.*$',
+    r',\s*feat\.?\s+.*$',
+    r',\s*featuring\s+.*$',
+    r',\s*ft\.?\s+.*$',
+    r',\s*with\s+.*$',
+))
+# Featured artists at the end of the title, stopping at dashes and brackets
+CAREFUL_FEAT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\s+feat\.?\s+[^-\(\[\n]+$',
+    r'\s+featuring\s+[^-\(\[\n]+$',
+    r'\s+ft\.?\s+[^-\(\[\n]+$',
+    r'\s+with\s+[^-\(\[\n]+$',
+    r'\s+f\.\s+[^-\(\[\n]+$',
+))
+PRESERVED_VERSION_PATTERNS = (
+    re.compile(rf'\([^)]*(?:{PRESERVED_VERSION_WORDS})[^)]*\)', re.IGNORECASE),
+    re.compile(rf'\[[^\]]*(?:{PRESERVED_VERSION_WORDS})[^\]]*\]', re.IGNORECASE),
+)
+VERSION_TAG_PATTERNS = (
+    re.compile(rf'\s*\([^)]*(?:{VERSION_WORDS})[^)]*\)', re.IGNORECASE),
+    re.compile(rf'\s*\[[^\]]*(?:{VERSION_WORDS})[^\]]*\]', re.IGNORECASE),
+)
+SEMICOLON_VERSION_PATTERN = re.compile(
+    r'\s*;\s*(?:\d{4}\s+)?(?:remaster|remastered)(?:\s+\d{4})?.*$|\s*;\s*(?:\d{4}\s+)?(?:remastered\s+)?(?:edition|version).*$',
+    re.IGNORECASE)
+DASH_VERSION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\s*-\s*(?:\d{4}\s+)?(?:remaster|remastered)(?:\s+\d{4})?.*$',  # - Remastered, - 2021 Remaster
+    r'\s*-\s*(?:\d{4}\s+)?(?:remastered\s+)?(?:edition|version).*$',  # - Edition, - 2021 Edition
+    r'\s*-\s*(?:deluxe|anniversary|special)\s*(?:edition|version)?.*$',  # - Deluxe, - Anniversary Edition
+    r'\s*-\s*(?:stereo|mono).*$',
+    r'\s*-\s*(?:explicit|clean).*$',
+    r'\s*-\s*(?:radio|single|album)\s*(?:edit|version)?.*$',  # - Radio Edit, - Single Version
+    r'\s*-\s*live(?:\s+at\s+[^-]*)?.*$',  # - Live, - Live at Venue
+    r'\s*-\s*acoustic.*$',
+    r'\s*-\s*unplugged.*$',
+    r'\s*-\s*demo.*$',
+))
+SORT_FEAT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\(feat\.?\s+[^)]+\)',
+    r'\(ft\.?\s+[^)]+\)',
+    r'\(featuring\s+[^)]+\)',
+    r'\(with\s+[^)]+\)',
+    r'feat\.?\s+.+$',
+    r'ft\.?\s+.+$',
+    r'featuring\s+.+$',
+))
+BRACKET_PATTERN = re.compile(r'[()\[\]]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# Matching keys: apostrophes vanish, typographic punctuation and letters NFKD can't
+# decompose fold to ASCII (casefold already turns ß into ss)
+MATCH_KEY_TRANSLATION = str.maketrans({
+    "'": None, '`': None, '´': None, '\u2018': None, '\u2019': None, '\u02bc': None,
+    '\u2010': '-', '\u2011': '-', '\u2012': '-', '\u2013': '-', '\u2014': '-', '\u2212': '-',
+    '\u201c': '"', '\u201d': '"', '\u2026': '...',
+    'ø': 'o', 'đ': 'd', 'ð': 'd', 'ł': 'l', 'ħ': 'h', 'ı': 'i', 'æ': 'ae', 'œ': 'oe', 'þ': 'th',
+})
+
+
+class CombiningMarkTable(dict):
+    """str.translate table dropping combining marks, filled in per character on first sight"""
+    def __missing__(self, codepoint):
+        self[codepoint] = None if unicodedata.combining(chr(codepoint)) else codepoint
+        return self[codepoint]
+
+
+COMBINING_MARK_TRANSLATION = CombiningMarkTable()
+
+
+def apply_patterns(text, patterns):
+    for pattern in patterns:
+        text = pattern.sub('', text)
+    return text
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def clean_artist_name(artist):
+    """Clean artist name for better matching - removes remaster info, years, and featured artists"""
+    if not artist:
+        return ""
+    cleaned = apply_patterns(artist, ARTIST_REMASTER_PATTERNS)
+    cleaned = apply_patterns(cleaned, ARTIST_VERSION_PATTERNS)
+    cleaned = apply_patterns(cleaned, ARTIST_FEAT_PATTERNS)
+    cleaned = WHITESPACE_PATTERN.sub(' ', cleaned).strip()
+    cleaned = cleaned.strip(' -,&()[]')
+    # If we removed too much and left nothing meaningful, return original
+    if len(cleaned.strip()) < 1:
+        return artist
+    return cleaned
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def clean_track_title(title):
+    """Clean track title for sorting - strips featured artists"""
+    if not title:
+        return ""
+    cleaned = apply_patterns(title, SORT_FEAT_PATTERNS)
+    cleaned = WHITESPACE_PATTERN.sub(' ', cleaned)
+    return cleaned.strip(' -()[]')
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def remove_featured_artists(title):
+    """Remove featured artist information to focus search on main track title"""
+    cleaned_title = apply_patterns(title, BRACKETED_FEAT_PATTERNS)
+    cleaned_title = apply_patterns(cleaned_title, CAREFUL_FEAT_PATTERNS)
+    cleaned_title = WHITESPACE_PATTERN.sub(' ', cleaned_title).strip()
+    cleaned_title = cleaned_title.rstrip(' -,&')
+    # If we removed too much and left nothing meaningful, return original
+    if len(cleaned_title.strip()) < 2:
+        return title
+    return cleaned_title
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def remove_featured_artists_aggressive(title):
+    """Aggressively remove featured artist information, preserving remix info in parentheses"""
+    # Park remix/version tags behind placeholders so the feat patterns can't eat them
+    preserved_versions = []
+    temp_title = title
+    for i, pattern in enumerate(PRESERVED_VERSION_PATTERNS):
+        for match in pattern.findall(temp_title):
+            placeholder = f"__PRESERVED_VERSION_{i}_{len(preserved_versions)}__"
+            preserved_versions.append(match)
+            temp_title = temp_title.replace(match, placeholder)
+
+    cleaned_title = apply_patterns(temp_title, BRACKETED_FEAT_PATTERNS)
+    cleaned_title = apply_patterns(cleaned_title, TRAILING_FEAT_PATTERNS)
+
+    for i, version in enumerate(preserved_versions):
+        for j in range(len(PRESERVED_VERSION_PATTERNS)):
+            placeholder = f"__PRESERVED_VERSION_{j}_{i}__"
+            if placeholder in cleaned_title:
+                cleaned_title = cleaned_title.replace(placeholder, version)
+                break
+
+    cleaned_title = WHITESPACE_PATTERN.sub(' ', cleaned_title).strip()
+    cleaned_title = cleaned_title.rstrip(' -,&')
+    if len(cleaned_title.strip()) < 2:
+        return title
+    return cleaned_title
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def clean_title_for_search(title, keep_version_tags=False):
+    """Clean title for search by removing featured artists and version information.
+
+    keep_version_tags leaves bracketed version tags such as "(Live)" in place and always
+    applies the dash version patterns - the converter relies on this for version filtering.
+    """
+    if not title:
+        return ""
+
+    cleaned = title
+
+    # Remove " - " and everything after it, but keep anything from the first bracket onward
+    # (handles titles like "Accidentally In Love - From "Shrek 2" Soundtrack")
+    dash_already_processed = False
+    dash_index = cleaned.find(' - ')
+    if dash_index != -1:
+        bracket_match = BRACKET_PATTERN.search(cleaned, dash_index)
+        if bracket_match:
+            cleaned = cleaned[:dash_index] + ' ' + cleaned[bracket_match.start():]
+            dash_already_processed = True
+        else:
+            cleaned = cleaned[:dash_index]
+
+    if not keep_version_tags:
+        cleaned = apply_patterns(cleaned, VERSION_TAG_PATTERNS)
+
+    # Semicolon-separated version info like "; 2017 Remaster"
+    cleaned = SEMICOLON_VERSION_PATTERN.sub('', cleaned)
+
+    # "Song Title - Remastered", "Track Name - 2021 Remaster", ...
+    if keep_version_tags or not dash_already_processed:
+        cleaned = apply_patterns(cleaned, DASH_VERSION_PATTERNS)
+
+    cleaned = apply_patterns(cleaned, BRACKETED_FEAT_PATTERNS)
+    cleaned = apply_patterns(cleaned, TRAILING_FEAT_PATTERNS)
+
+    cleaned = WHITESPACE_PATTERN.sub(' ', cleaned).strip()
+    cleaned = cleaned.rstrip(' -,&')
+
+    # If we removed too much and left nothing meaningful, return original
+    if len(cleaned.strip()) < 2:
+        return title
+    return cleaned
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def normalize_title(title):
+    """Matching key for near-exact comparisons - casefolded, accents and apostrophes dropped, spacing collapsed.
+
+    "Glósóli", "GLOSOLI" and "Ｇｌｏｓｏｌｉ" all give "glosoli"; ASCII titles skip the Unicode tables.
+    """
+    normalized = title.casefold()
+    if normalized.isascii():
+        normalized = normalized.replace("'", '').replace('`', '')
+    else:
+        normalized = normalized.translate(MATCH_KEY_TRANSLATION)
+        normalized = unicodedata.normalize('NFKD', normalized).translate(COMBINING_MARK_TRANSLATION)
+    return ' '.join(normalized.split())
+
+
+# Artist aliases: "The Killers" is "Killers", "Simon & Garfunkel" is "Simon and Garfunkel",
+# and a credit like "Daft Punk feat. Pharrell Williams" also names each of its artists.
+# Commas, '&' and 'and' only separate artists the library already knows ("Earth, Wind & Fire"
+# and "Belle and Sebastian" are bands), see LibraryIndex.credited_aliases
+ARTIST_AND_PATTERN = re.compile(r'\s*[&+]\s*')
+ARTIST_CREDIT_SPLIT_PATTERN = re.compile(r'\s*(?:\bx\b|\bvs\.?|\bfeat\.?|\bft\.?|\bfeaturing\b|\bwith\b)\s*')
+ARTIST_LIST_SPLIT_PATTERN = re.compile(r'\s*(?:[,;/]|\band\b)\s*')
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def artist_alias_key(name):
+    """Matching key of an artist name - normalized, "&"/"+" read as "and", no leading 'The'"""
+    key = ' '.join(ARTIST_AND_PATTERN.sub(' and ', normalize_title(name or "")).split())
+    return key[4:] if key.startswith('the ') else key
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def artist_credit_aliases(name):
+    """Alias keys of the artists joined by feat./ft./with/x/vs. in a credit (empty for a single artist)"""
+    parts = (artist_alias_key(part) for part in ARTIST_CREDIT_SPLIT_PATTERN.split(normalize_title(name or "")))
+    aliases = tuple(dict.fromkeys(part for part in parts if part))
+    return aliases if len(aliases) > 1 else ()
+
+
+def fuzzy_title_match(search_title, plex_title):
+    """Fuzzy matching for titles to handle common variations like apostrophes, spacing, etc."""
+    if not search_title or not plex_title:
+        return False
+
+    search_normalized = normalize_title(search_title)
+    plex_normalized = normalize_title(plex_title)
+
+    if search_normalized == plex_normalized:
+        return True
+    if search_normalized in plex_normalized or plex_normalized in search_normalized:
+        return True
+    # High threshold for title matching within artist
+    return scoring_backend().ratio(search_normalized, plex_normalized, score_cutoff=85) >= 85
+
+
+# NEAR MATCHES - bounded edit distance between normalized titles of the same artist
+NEAR_MATCH_MIN_LENGTH = 6  # shorter titles only ever match exactly
+NEAR_MATCH_LONG_TITLE = 12  # titles this long may differ by two edits instead of one
+NEAR_MATCH_MIN_WORD = 4  # a changed word shorter than this is another word (she/he), not a typo
+DIGITS_PATTERN = re.compile(r'\d+')
+ROMAN_NUMERAL_PATTERN = re.compile(r'm{0,3}(cm|cd|d?c{0,3})(xc|xl|l?x{0,3})(ix|iv|v?i{0,3})')
+
+
+def near_match_max_edits(title_key):
+    """Edits the near-match tier tolerates for a normalized title"""
+    if len(title_key) < NEAR_MATCH_MIN_LENGTH:
+        return 0
+    return 1 if len(title_key) < NEAR_MATCH_LONG_TITLE else 2
+
+def near_title_match(title_key, other_key, max_edits):
+    """Whether other_key reads as a misspelling of title_key rather than a different title.
+
+    The edits have to stay inside one word of titles with the same word count, and that word
+    must not be a number, a roman numeral ("Part I"/"Part II"), a short word ("She"/"He")
+    or another form of the same word ("Love"/"Lover").
+    """
+    words = title_key.split()
+    other_words = other_key.split()
+    if len(words) != len(other_words):
+        return False
+    changed = [(word, other) for word, other in zip(words, other_words) if word != other]
+    if len(changed) != 1:
+        return False
+    word, other = changed[0]
+    if min(len(word), len(other)) < NEAR_MATCH_MIN_WORD:
+        return False
+    if DIGITS_PATTERN.search(word) or DIGITS_PATTERN.search(other):
+        return False
+    if ROMAN_NUMERAL_PATTERN.fullmatch(word) or ROMAN_NUMERAL_PATTERN.fullmatch(other):
+        return False
+    if word.startswith(other) or other.startswith(word):
+        return False
+    return bounded_edit_distance(word, other, max_edits) <= max_edits
+
+
+@lru_cache(maxsize=None)
+def edit_distance_backend():
+    """rapidfuzz's bounded Levenshtein distance when installed, else None"""
+    try:
+        from rapidfuzz.distance import Levenshtein
+        return Levenshtein.distance
+    except ImportError:
+        return None
+
+
+def bounded_edit_distance(a, b, max_distance):
+    """Levenshtein distance of a and b, or max_distance + 1 as soon as it is certainly larger"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    distance = edit_distance_backend()
+    if distance is not None:
+        return distance(a, b, score_cutoff=max_distance)
+    # Banded dynamic programming: cells further than max_distance from the diagonal can't stay in bounds
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i] + [max_distance + 1] * len(b)
+        for j in range(max(1, i - max_distance), min(len(b), i + max_distance) + 1):
+            cost = 0 if char_a == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return min(previous[-1], max_distance + 1)
+
+
+# BATCH SCORING - score every source/Plex pair of a playlist in bulk
+SORT_MATCH_THRESHOLD = 60
+SORT_MEMO_THRESHOLD = 85  # sort matches below this are used but not memoized
+# rapidfuzz never scores a pair more than half a point below fuzzywuzzy for the same
+# preprocessing, so anything this far under the threshold can't pass the exact rescore
+BULK_SCORE_MARGIN = 2
+BULK_SCORE_ROW_BLOCK = 512
+LATIN1_TRANSLATION = dict.fromkeys(range(128, 256))
+NON_ALNUM_PATTERN = re.compile(r'(?ui)\W')
+
+
+def fuzzywuzzy_full_process(text):
+    """Same preprocessing fuzzywuzzy applies inside token_set_ratio (force_ascii=True)"""
+    return NON_ALNUM_PATTERN.sub(' ', text.translate(LATIN1_TRANSLATION)).lower().strip()
+
+
+def sort_pair_score(title, artist, has_artist, plex_title, plex_artist):
+    """Exact playlist-sorting score for one pair - 70/30 title/artist, or title only"""
+    title_score = max(
+        fuzz.ratio(title, plex_title),
+        fuzz.partial_ratio(title, plex_title),
+        fuzz.token_set_ratio(title, plex_title)
+    )
+    if not has_artist:
+        return title_score
+    artist_score = fuzz.token_set_ratio(artist, plex_artist) if plex_artist is not None else 0
+    return (title_score * 0.7) + (artist_score * 0.3)
+
+
+def score_sort_candidates(sources, targets, threshold=SORT_MATCH_THRESHOLD):
+    """Return, for every source, the (target index, score) pairs scoring above threshold.
+
+    sources are (title, artist, has_artist) and targets (title, artist or None), all already
+    cleaned and lowercased. With rapidfuzz/numpy installed the full score matrix is computed
+    in C and only pairs near or above the threshold are rescored exactly; otherwise every
+    pair is scored with fuzzywuzzy.
+    """
+    try:
+        return bulk_sort_candidates(sources, targets, threshold)
+    except ImportError:
+        pass
+    candidates = []
+    for title, artist, has_artist in sources:
+        row = []
+        for j, (plex_title, plex_artist) in enumerate(targets):
+            score = sort_pair_score(title, artist, has_artist, plex_title, plex_artist)
+            if score > threshold:
+                row.append((j, score))
+        candidates.append(row)
+    return candidates
+
+
+def assign_one_to_one(candidates):
+    """Pick non-conflicting source -> target pairs, best scores first (max-heap greedy).
+
+    candidates[i] holds the (target index, score) pairs of source i. Ties go to the earlier
+    source and then the earlier target, so a lone best match is never stolen by a later row.
+    Returns {source index: (target index, score)}.
+    """
+    # Each row only keeps its best remaining pair on the heap; a row whose pair lost its
+    # target moves on to its next best, which gives the same result as sorting every pair
+    ranked = [sorted(row, key=lambda pair: (-pair[1], pair[0])) for row in candidates]
+    heap = [(-row[0][1], i, row[0][0], 0) for i, row in enumerate(ranked) if row]
+    heapq.heapify(heap)
+    assignment = {}
+    used_targets = set()
+    while heap:
+        negative_score, i, j, position = heapq.heappop(heap)
+        if j not in used_targets:
+            assignment[i] = (j, -negative_score)
+            used_targets.add(j)
+            continue
+        position += 1
+        if position < len(ranked[i]):
+            next_j, next_score = ranked[i][position]
+            heapq.heappush(heap, (-next_score, i, next_j, position))
+    return assignment
+
+
+def bulk_sort_candidates(sources, targets, threshold):
+    from rapidfuzz import fuzz as rapid_fuzz, process as rapid_process
+    import numpy as np
+
+    plex_titles = [plex_title for plex_title, _ in targets]
+    plex_artists = [fuzzywuzzy_full_process(plex_artist) if plex_artist is not None else "" for _, plex_artist in targets]
+    plex_titles_processed = [fuzzywuzzy_full_process(plex_title) for plex_title in plex_titles]
+    candidates = []
+    for start in range(0, len(sources), BULK_SCORE_ROW_BLOCK):
+        block = sources[start:start + BULK_SCORE_ROW_BLOCK]
+        titles = [title for title, _, _ in block]
+        title_matrix = np.maximum.reduce([
+            rapid_process.cdist(titles, plex_titles, scorer=rapid_fuzz.ratio, workers=-1),
+            rapid_process.cdist(titles, plex_titles, scorer=rapid_fuzz.partial_ratio, workers=-1),
+            rapid_process.cdist([fuzzywuzzy_full_process(title) for title in titles], plex_titles_processed,
+                                scorer=rapid_fuzz.token_set_ratio, workers=-1),
+        ])
+        artist_matrix = rapid_process.cdist([fuzzywuzzy_full_process(artist) for _, artist, _ in block], plex_artists,
+                                            scorer=rapid_fuzz.token_set_ratio, workers=-1)
+        has_artist = np.array([flag for _, _, flag in block], dtype=bool)[:, None]
+        approx = np.where(has_artist, title_matrix * 0.7 + artist_matrix * 0.3, title_matrix)
+        for offset, row_scores in enumerate(approx):
+            title, artist, source_has_artist = block[offset]
+            row = []
+            for j in np.flatnonzero(row_scores > threshold - BULK_SCORE_MARGIN):
+                plex_title, plex_artist = targets[j]
+                score = sort_pair_score(title, artist, source_has_artist, plex_title, plex_artist)
+                if score > threshold:
+                    row.append((int(j), score))
+            candidates.append(row)
+    return candidates
+
+
+# SCORING BACKEND - fuzzywuzzy scores with a score_cutoff, so hopeless pairs exit early
+class ScoringBackend:
+    """fuzzywuzzy's ratio, partial_ratio and token_set_ratio taking rapidfuzz-style score cutoffs.
+
+    A pair scoring below score_cutoff scores 0. With rapidfuzz installed its C scorer, given the
+    cutoff so it can stop early, rules out pairs that can't reach it (it never scores more than
+    half a point below fuzzywuzzy) and only the rest are scored by fuzzywuzzy - scores and match
+    decisions are the same with or without rapidfuzz.
+    """
+    def __init__(self):
+        try:
+            from rapidfuzz import fuzz as rapid_fuzz, process as rapid_process
+        except ImportError:
+            rapid_fuzz = rapid_process = None
+        self.rapid_fuzz = rapid_fuzz
+        self.rapid_process = rapid_process
+        self.name = 'rapidfuzz' if rapid_fuzz is not None else 'fuzzywuzzy'
+
+    def prefilter(self, scorer, score_cutoff):
+        """(rapidfuzz scorer, processor, cutoff) ruling out pairs below score_cutoff, or None"""
+        if self.rapid_fuzz is None or score_cutoff - BULK_SCORE_MARGIN <= 0:
+            return None
+        # fuzzywuzzy's token_set_ratio preprocesses, its ratio and partial_ratio don't
+        processor = fuzzywuzzy_full_process if scorer == 'token_set_ratio' else None
+        return getattr(self.rapid_fuzz, scorer), processor, score_cutoff - BULK_SCORE_MARGIN
+
+    def score(self, scorer, a, b, score_cutoff=0):
+        prefilter = self.prefilter(scorer, score_cutoff)
+        if prefilter is not None:
+            rapid_scorer, processor, rapid_cutoff = prefilter
+            if not rapid_scorer(a, b, processor=processor, score_cutoff=rapid_cutoff):
+                return 0
+        score = getattr(fuzz, scorer)(a, b)
+        return score if score >= score_cutoff else 0
+
+    def ratio(self, a, b, score_cutoff=0):
+        return self.score('ratio', a, b, score_cutoff)
+
+    def partial_ratio(self, a, b, score_cutoff=0):
+        return self.score('partial_ratio', a, b, score_cutoff)
+
+    def token_set_ratio(self, a, b, score_cutoff=0):
+        return self.score('token_set_ratio', a, b, score_cutoff)
+
+    def extract(self, query, choices, scorer='token_set_ratio', score_cutoff=0, limit=None):
+        """(choice, score, index) of every choice scoring at least score_cutoff, best first"""
+        indexes = range(len(choices))
+        prefilter = self.prefilter(scorer, score_cutoff)
+        if prefilter is not None:
+            rapid_scorer, processor, rapid_cutoff = prefilter
+            indexes = sorted(index for _, _, index in self.rapid_process.extract(
+                query, choices, scorer=rapid_scorer, processor=processor, score_cutoff=rapid_cutoff, limit=None))
+        exact_scorer = getattr(fuzz, scorer)
+        results = []
+        for index in indexes:
+            score = exact_scorer(query, choices[index])
+            if score >= score_cutoff:
+                results.append((choices[index], score, index))
+        results.sort(key=lambda result: result[1], reverse=True)
+        return results[:limit] if limit else results
+
+
+@lru_cache(maxsize=None)
+def scoring_backend():
+    """The shared ScoringBackend"""
+    backend = ScoringBackend()
+    logging.info(f"Fuzzy scoring backend: {backend.name}")
+    return backend
+
+
+# LIBRARY INDEX - local copy of a music section so matching doesn't query Plex per track
+def row_version_profiles(title):
+    """VersionProfiles of a library title and of the title without featured artists"""
+    profile = compute_version_profile(title)
+    clean_title = remove_featured_artists_aggressive(title)
+    return profile, profile if clean_title == title else compute_version_profile(clean_title)
+
+
+class IndexedArtist:
+    """Stand-in for a plexapi Artist backed by the library index"""
+    def __init__(self, library_index, rating_key, title):
+        self.library_index = library_index
+        self.ratingKey = rating_key
+        self.title = title
+
+    def tracks(self):
+        return self.library_index.tracks_for_artist(self.ratingKey)
+
+    def albums(self):
+        return self.library_index.albums_for_artist(self.ratingKey)
+
+    def __repr__(self):
+        return f"<IndexedArtist:{self.ratingKey}:{self.title}>"
+
+
+class IndexedAlbum:
+    """Stand-in for a plexapi Album backed by the library index"""
+    def __init__(self, library_index, rating_key, title):
+        self.library_index = library_index
+        self.ratingKey = rating_key
+        self.title = title
+
+    def tracks(self):
+        return self.library_index.tracks_for_album(self.ratingKey)
+
+    def __repr__(self):
+        return f"<IndexedAlbum:{self.ratingKey}:{self.title}>"
+
+
+class IndexedTrack:
+    """Stand-in for a plexapi Track backed by a library index row"""
+    def __init__(self, library_index, row):
+        self.library_index = library_index
+        self.row = row
+        self.ratingKey = row['ratingKey']
+        self.title = row['title']
+        self.originalTitle = row['original_title'] or None
+        self.duration = row['duration'] or None
+        self.index = row['index'] or None
+        self.file = row['file']
+        self.librarySectionID = library_index.section_id
+        self.versions = row.get('versions')  # (title, title without featured artists) VersionProfiles
+
+    def artist(self):
+        return self.library_index.get_artist(self.row['artist_key'])
+
+    def album(self):
+        return self.library_index.get_album(self.row['album_key'])
+
+    def __repr__(self):
+        return f"<IndexedTrack:{self.ratingKey}:{self.title}>"
+
+
+class TrigramIndex:
+    """Character-trigram inverted index returning fuzzy candidates without scanning every entry"""
+    def __init__(self):
+        self.postings = {}   # trigram -> array of doc ids
+        self.doc_keys = []   # doc id -> key
+        self.doc_sizes = []  # doc id -> number of distinct trigrams
+        self.doc_ids = {}    # key -> live doc id
+
+    def __len__(self):
+        return len(self.doc_ids)
+
+    @staticmethod
+    def trigrams(text):
+        normalized = normalize_title(text) if text else ""
+        if not normalized:
+            return set()
+        padded = f"  {normalized} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def add(self, key, text):
+        grams = self.trigrams(text)
+        doc_id = len(self.doc_keys)
+        self.doc_keys.append(key)
+        self.doc_sizes.append(len(grams))
+        self.doc_ids[key] = doc_id
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting is None:
+                posting = self.postings[gram] = array('I')
+            posting.append(doc_id)
+
+    def remove(self, key):
+        # The old doc id stays in the postings but is skipped at query time
+        self.doc_ids.pop(key, None)
+
+    def scores(self, text, min_similarity=0.3):
+        """Dice similarity of every entry sharing enough trigrams with text, keyed by entry key"""
+        grams = self.trigrams(text)
+        if not grams:
+            return {}
+        counts = Counter()
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting:
+                counts.update(posting)
+        results = {}
+        query_size = len(grams)
+        for doc_id, shared in counts.items():
+            similarity = 2.0 * shared / (query_size + self.doc_sizes[doc_id])
+            if similarity < min_similarity:
+                continue
+            key = self.doc_keys[doc_id]
+            if self.doc_ids.get(key) == doc_id:
+                results[key] = similarity
+        return results
+
+    def search(self, text, limit=50, min_similarity=0.3):
+        """Top-N (key, similarity) pairs for text"""
+        return heapq.nlargest(limit, self.scores(text, min_similarity).items(), key=lambda item: item[1])
+
+
+class LibraryIndex:
+    """On-disk index of every track in a music section, built from the paged /all listing"""
+    VERSION = 1
+    FIELDS = ('ratingKey', 'title', 'original_title', 'album_artist', 'album', 'duration',
+              'file', 'artist_key', 'album_key', 'index', 'added_at', 'updated_at')
+
+    def __init__(self, section_id, server_id=None):
+        self.section_id = str(section_id)
+        self.server_id = server_id
+        self.rows = {}
+        self.built_at = None
+        self.refreshed_at = None
+        self.lock = threading.RLock()
+        self.title_trigrams = None
+        self.artist_trigrams = None
+        self.rebuild_lookups()
+
+    @property
+    def path(self):
+        return LIBRARY_INDEX_FILE.format(section_id=self.section_id)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def load(self):
+        """Load the index from disk, returns False if missing or built for another server"""
+        try:
+            if not os.path.exists(self.path):
+                return False
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.VERSION or list(data.get('fields', [])) != list(self.FIELDS):
+                logging.info(f"Library index {self.path} has an old format - it will be rebuilt")
+                return False
+            if self.server_id and data.get('server_id') != self.server_id:
+                logging.info(f"Library index {self.path} belongs to another server - it will be rebuilt")
+                return False
+            with self.lock:
+                self.rows = {values[0]: dict(zip(self.FIELDS, values)) for values in data.get('rows', [])}
+                self.built_at = data.get('built_at')
+                self.refreshed_at = None
+                self.title_trigrams = None
+                self.artist_trigrams = None
+                self.rebuild_lookups()
+            logging.info(f"Library index loaded for section {self.section_id}: {len(self.rows)} tracks")
+            return True
+        except Exception as e:
+            logging.error(f"Error loading library index: {str(e)}")
+            return False
+
+    def save(self):
+        try:
+            with self.lock:
+                data = {
+                    "version": self.VERSION,
+                    "server_id": self.server_id,
+                    "section_id": self.section_id,
+                    "built_at": self.built_at,
+                    "fields": list(self.FIELDS),
+                    "rows": [[row[field] for field in self.FIELDS] for row in self.rows.values()]
+                }
+            # Write beside the index and swap it in, so an interrupted save never leaves a truncated file
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+            logging.info(f"Library index saved for section {self.section_id}: {len(self.rows)} tracks")
+        except Exception as e:
+            logging.error(f"Error saving library index: {str(e)}")
+
+    def build(self, plex_server, progress_callback=None):
+        """Fetch every track in the section page by page and replace the index"""
+        start_time = time.time()
+        rows = self.fetch_rows(plex_server, progress_callback=progress_callback)
+        with self.lock:
+            self.rows = {row['ratingKey']: row for row in rows}
+            self.built_at = int(time.time())
+            self.refreshed_at = self.built_at
+            self.title_trigrams = None
+            self.artist_trigrams = None
+            self.rebuild_lookups()
+        self.save()
+        logging.info(f"Built library index for section {self.section_id} with {len(rows)} tracks in {time.time() - start_time:.1f}s")
+
+    def refresh(self, plex_server):
+        """Apply library changes since the last build/refresh instead of rebuilding everything"""
+        start_time = time.time()
+        watermark = self.watermark
+        if watermark is None:
+            self.build(plex_server)
+            return
+        # Plex timestamps only have second precision, so re-read anything touched in the watermark second
+        changed = {}
+        for field in ('updatedAt', 'addedAt'):
+            for row in self.fetch_rows(plex_server, filters=f"&{field}>>={watermark - 1}"):
+                changed[row['ratingKey']] = row
+        with self.lock:
+            self.rows.update(changed)
+            removed = self.find_removed(plex_server)
+            for rating_key in removed:
+                self.rows.pop(rating_key, None)
+            self.refreshed_at = int(time.time())
+            if changed or removed:
+                self.rebuild_lookups()
+                self.update_trigram_index(changed.values(), removed)
+        if changed or removed:
+            self.save()
+        logging.info(f"Refreshed library index for section {self.section_id}: {len(changed)} changed, "
+                     f"{len(removed)} removed in {time.time() - start_time:.1f}s")
+        return removed
+
+    def refresh_if_stale(self, plex_server, max_age=None):
+        """Delta-refresh the index unless it was refreshed within max_age seconds"""
+        max_age = LIBRARY_INDEX_REFRESH_INTERVAL if max_age is None else max_age
+        with self.lock:
+            if self.refreshed_at and time.time() - self.refreshed_at < max_age:
+                return []
+            try:
+                return self.refresh(plex_server) or []
+            except Exception as e:
+                logging.warning(f"Library index refresh failed, using the existing index: {e}")
+                return []
+
+    @property
+    def watermark(self):
+        """Newest addedAt/updatedAt timestamp seen in the index"""
+        if not self.rows:
+            return None
+        return max(max(row['updated_at'], row['added_at']) for row in self.rows.values())
+
+    def find_removed(self, plex_server):
+        """Find deleted tracks by comparing ratingKey sets, skipped when the counts already agree"""
+        data = plex_server.query(f"/library/sections/{self.section_id}/all?type=10"
+                                 f"&X-Plex-Container-Start=0&X-Plex-Container-Size=0")
+        total = int(data.attrib.get('totalSize', data.attrib.get('size', 0)) or 0)
+        if total == len(self.rows):
+            return []
+        server_keys = set()
+        start = 0
+        while start < total:
+            # Only the ratingKey is needed here; servers that ignore includeFields just send full rows
+            data = plex_server.query(f"/library/sections/{self.section_id}/all?type=10&includeFields=ratingKey"
+                                     f"&X-Plex-Container-Start={start}&X-Plex-Container-Size={LIBRARY_INDEX_PAGE_SIZE * 10}")
+            page = [int(elem.attrib['ratingKey']) for elem in data if elem.tag == 'Track' and 'ratingKey' in elem.attrib]
+            if not page:
+                break
+            server_keys.update(page)
+            start += len(page)
+        return [rating_key for rating_key in self.rows if rating_key not in server_keys]
+
+    def fetch_rows(self, plex_server, filters="", progress_callback=None):
+        """Page through /library/sections/{id}/all for tracks, optionally with extra filters"""
+        rows = []
+        start = 0
+        total = None
+        while total is None or start < total:
+            key = (f"/library/sections/{self.section_id}/all?type=10{filters}"
+                   f"&X-Plex-Container-Start={start}&X-Plex-Container-Size={LIBRARY_INDEX_PAGE_SIZE}")
+            data = plex_server.query(key)
+            if total is None:
+                total = int(data.attrib.get('totalSize', data.attrib.get('size', 0)) or 0)
+            page = [self.row_from_element(elem) for elem in data if elem.tag == 'Track']
+            if not page:
+                break
+            rows.extend(page)
+            start += len(page)
+            if progress_callback and total:
+                progress_callback(min(start, total), total)
+        return rows
+
+    @staticmethod
+    def row_from_element(elem):
+        """Convert a <Track> element from the section listing into an index row"""
+        attrib = elem.attrib
+        part = elem.find('Media/Part')
+        return {
+            'ratingKey': int(attrib.get('ratingKey')),
+            'title': attrib.get('title', ''),
+            'original_title': attrib.get('originalTitle', ''),
+            'album_artist': attrib.get('grandparentTitle', ''),
+            'album': attrib.get('parentTitle', ''),
+            'duration': int(attrib.get('duration', 0) or 0),
+            'file': part.attrib.get('file', '') if part is not None else '',
+            'artist_key': int(attrib.get('grandparentRatingKey', 0) or 0),
+            'album_key': int(attrib.get('parentRatingKey', 0) or 0),
+            'index': int(attrib.get('index', 0) or 0),
+            'added_at': int(attrib.get('addedAt', 0) or 0),
+            'updated_at': int(attrib.get('updatedAt', 0) or 0),
+        }
+
+    def rebuild_lookups(self):
+        """Rebuild the in-memory artist/album lookups from the rows"""
+        with self.lock:
+            self.artists = {}
+            self.albums = {}
+            self.artist_tracks = {}
+            self.artist_albums = {}
+            self.album_tracks = {}
+            self.artist_name_tracks = {}  # lowercased album/track artist -> track ratingKeys
+            self.exact_keys = {}  # (normalized title, normalized artist) -> track ratingKeys
+            self.artist_title_keys = {}  # normalized artist -> its normalized titles, for near matches
+            self.artist_aliases = {}  # artist_alias_key -> album artist ratingKeys, see resolve_artist_keys
+            self.credit_aliases = {}  # ... of the track artists credited, leading to their album artists
+            credits = {}  # track artist credit -> album artist ratingKeys
+            ordered = sorted(self.rows.values(), key=lambda r: (r['album_key'], r['index'], r['ratingKey']))
+            for row in ordered:
+                if 'versions' not in row:
+                    # Version tags parsed once per row (not saved - rows from disk or a refresh get them here)
+                    row['versions'] = row_version_profiles(row['title'] or "")
+                artist_key = row['artist_key']
+                album_key = row['album_key']
+                self.artists.setdefault(artist_key, row['album_artist'])
+                self.albums.setdefault(album_key, row['album'])
+                self.artist_tracks.setdefault(artist_key, []).append(row['ratingKey'])
+                self.album_tracks.setdefault(album_key, []).append(row['ratingKey'])
+                artist_albums = self.artist_albums.setdefault(artist_key, [])
+                if not artist_albums or artist_albums[-1] != album_key:
+                    artist_albums.append(album_key)
+                for name in {row['album_artist'].lower(), (row['original_title'] or "").lower()}:
+                    if name:
+                        self.artist_name_tracks.setdefault(name, []).append(row['ratingKey'])
+                alias = artist_alias_key(row['album_artist'])
+                if alias:
+                    self.artist_aliases.setdefault(alias, {})[artist_key] = True
+                if row['original_title']:
+                    credits.setdefault(row['original_title'], {})[artist_key] = True
+                if row['title']:
+                    title_key = normalize_title(row['title'])
+                    for name in {row['album_artist'], row['original_title'] or ""}:
+                        if name:
+                            exact_key = (title_key, normalize_title(clean_artist_name(name)))
+                            keys = self.exact_keys.setdefault(exact_key, [])
+                            if not keys or keys[-1] != row['ratingKey']:
+                                keys.append(row['ratingKey'])
+                            self.artist_title_keys.setdefault(exact_key[1], {})[title_key] = True
+            # Track artist credits (compilations, collaborations) lead to the album artist too - once
+            # every album artist is known, so list-style credits can be checked against them
+            for credit, artist_keys in credits.items():
+                for alias in (artist_alias_key(credit),) + self.credited_aliases(credit):
+                    if alias:
+                        self.credit_aliases.setdefault(alias, {}).update(artist_keys)
+            self.artist_search_names = [(key, normalize_title(title)) for key, title in self.artists.items() if title]
+            self.title_search_names = [(row['ratingKey'], normalize_title(row['title'])) for row in ordered if row['title']]
+
+    def search_artists(self, name):
+        """Artists answering to a name, like searchArtists(title=...).
+
+        An album artist in the alias table resolves directly; otherwise a case- and
+        accent-insensitive 'contains' search runs, followed by the album artists of tracks
+        crediting the name and the artists of a collaboration credit.
+        """
+        needle = normalize_title(name or "")
+        if not needle:
+            return []
+        alias = artist_alias_key(name)
+        keys = dict(self.artist_aliases.get(alias, {}))
+        if not keys:
+            matches = [(key, lowered) for key, lowered in self.artist_search_names if needle in lowered]
+            # Exact names first, then the closest (shortest) names
+            matches.sort(key=lambda m: (m[1] != needle, len(m[1])))
+            keys = dict.fromkeys(key for key, _ in matches)
+            keys.update(self.credit_aliases.get(alias, {}))
+            for credited in self.credited_aliases(name):
+                keys.update(self.resolve_alias(credited))
+        return [IndexedArtist(self, key, self.artists[key]) for key in keys]
+
+    def credited_aliases(self, name):
+        """Alias keys of the artists in a credit: split at feat./with/x/vs., and at commas or
+        '&'/'and' only when every part is an album artist of this library"""
+        aliases = []
+        for part in artist_credit_aliases(name) or (artist_alias_key(name),):
+            listed = [artist_alias_key(alias) for alias in ARTIST_LIST_SPLIT_PATTERN.split(part) if alias]
+            if len(listed) > 1 and all(alias in self.artist_aliases for alias in listed):
+                aliases.extend(listed)
+            else:
+                aliases.append(part)
+        aliases = tuple(dict.fromkeys(alias for alias in aliases if alias))
+        return aliases if len(aliases) > 1 else ()
+
+    def resolve_alias(self, alias):
+        """Album artists answering to an alias key: artists of that name first, then those crediting it"""
+        keys = dict(self.artist_aliases.get(alias, {}))
+        keys.update(self.credit_aliases.get(alias, {}))
+        return keys
+
+    def resolve_artist_keys(self, name):
+        """Album artist ratingKeys for a name from the alias tables - the whole name, else its credited artists"""
+        keys = self.resolve_alias(artist_alias_key(name))
+        if not keys:
+            for alias in self.credited_aliases(name):
+                keys.update(self.resolve_alias(alias))
+        return list(keys)
+
+    def has_artist(self, name):
+        """Whether the alias table knows the artist - dict lookups only, no scan"""
+        return bool(self.resolve_artist_keys(name))
+
+    def tiered_match(self, title, artist, duration_ms=None, tolerance_ms=EXACT_MATCH_DURATION_TOLERANCE):
+        """(track, tier) for an unambiguous cheap hit, or (None, None) when fuzzy scoring has to decide.
+
+        Tier 'exact' is a dict lookup on normalized title and artist; tier 'near' allows a few
+        edits inside one word of the title within the same artist (see near_title_match) and
+        must pass the version check. With a duration only tracks within tolerance count. More
+        than one candidate is never a hit.
+        """
+        if not title or not artist:
+            return None, None
+        title_key = normalize_title(title)
+        artist_key = normalize_title(clean_artist_name(artist))
+        with self.lock:
+            matches = self.within_duration(self.exact_keys.get((title_key, artist_key), []), duration_ms, tolerance_ms)
+            if matches:
+                # The same title twice (album and compilation copies) - let scoring pick
+                return (self.get_track(matches[0]), 'exact') if len(matches) == 1 else (None, None)
+            
+            max_edits = near_match_max_edits(title_key)
+            if not max_edits:
+                return None, None
+            near = []
+            for other_key in self.artist_title_keys.get(artist_key, ()):
+                if other_key != title_key and near_title_match(title_key, other_key, max_edits):
+                    near.extend(self.exact_keys[(other_key, artist_key)])
+            near = self.within_duration(list(dict.fromkeys(near)), duration_ms, tolerance_ms)
+            # A near hit skips scoring and confirmation, so it has to pass the version check here
+            near = [rating_key for rating_key in near if is_acceptable_version_match(title, self.rows[rating_key]['title'])]
+            return (self.get_track(near[0]), 'near') if len(near) == 1 else (None, None)
+
+    def within_duration(self, rating_keys, duration_ms, tolerance_ms):
+        """The rating keys whose track length is within tolerance of duration_ms (all of them without one)"""
+        if not duration_ms:
+            return list(rating_keys)
+        return [rating_key for rating_key in rating_keys
+                if self.rows[rating_key]['duration'] and abs(self.rows[rating_key]['duration'] - duration_ms) <= tolerance_ms]
+
+    def search_tracks(self, title):
+        """Case- and accent-insensitive 'contains' search over track titles, like searchTracks(title=...)"""
+        needle = normalize_title(title or "")
+        if not needle:
+            return []
+        return [IndexedTrack(self, self.rows[key]) for key, lowered in self.title_search_names if needle in lowered]
+
+    def ensure_trigram_index(self):
+        """Build the title/artist trigram indexes on first use"""
+        with self.lock:
+            if self.title_trigrams is not None:
+                return
+            start_time = time.time()
+            self.title_trigrams = TrigramIndex()
+            self.artist_trigrams = TrigramIndex()
+            self.update_trigram_index(self.rows.values(), [])
+            logging.info(f"Built trigram index for section {self.section_id} in {time.time() - start_time:.1f}s")
+
+    def update_trigram_index(self, rows, removed_keys):
+        """Keep an already built trigram index in step with refreshed rows"""
+        if self.title_trigrams is None:
+            return
+        for rating_key in removed_keys:
+            self.title_trigrams.remove(rating_key)
+        for row in rows:
+            self.title_trigrams.remove(row['ratingKey'])
+            self.title_trigrams.add(row['ratingKey'], row['title'])
+            for name in (row['album_artist'], row['original_title']):
+                lowered = name.lower() if name else ""
+                if lowered and lowered not in self.artist_trigrams.doc_ids:
+                    self.artist_trigrams.add(lowered, name)
+
+    def fuzzy_search(self, title="", artist="", limit=50):
+        """Best fuzzy title/artist candidates from the trigram index, weighted 70/30 like the matchers"""
+        candidates = self.fuzzy_scores(title, artist)
+        best = heapq.nlargest(limit, candidates.items(), key=lambda item: item[1])
+        return [IndexedTrack(self, self.rows[rating_key]) for rating_key, _ in best]
+
+    def fuzzy_scores(self, title="", artist=""):
+        """Trigram similarity of every candidate row for fuzzy_search, keyed by ratingKey"""
+        self.ensure_trigram_index()
+        title_scores = self.title_trigrams.scores(title) if title else {}
+        artist_scores = self.artist_trigrams.scores(artist) if artist else {}
+
+        def row_artist_score(row):
+            return max(artist_scores.get(row['album_artist'].lower(), 0.0),
+                       artist_scores.get((row['original_title'] or "").lower(), 0.0))
+
+        candidates = {}
+        if title:
+            for rating_key, score in title_scores.items():
+                row = self.rows.get(rating_key)
+                if row:
+                    candidates[rating_key] = score * 0.7 + row_artist_score(row) * 0.3 if artist else score
+        elif artist:
+            best_names = heapq.nlargest(20, artist_scores, key=artist_scores.get)
+            for rating_key in self.tracks_keys_for_artist_names(best_names):
+                candidates[rating_key] = row_artist_score(self.rows[rating_key])
+        return candidates
+
+    def tracks_keys_for_artist_names(self, names):
+        keys = {}
+        for name in names:
+            for rating_key in self.artist_name_tracks.get(name, []):
+                keys[rating_key] = True
+        return list(keys)
+
+    def get_artist(self, artist_key):
+        if artist_key not in self.artists:
+            return None
+        return IndexedArtist(self, artist_key, self.artists[artist_key])
+
+    def get_album(self, album_key):
+        if album_key not in self.albums:
+            return None
+        return IndexedAlbum(self, album_key, self.albums[album_key])
+
+    def get_track(self, rating_key):
+        row = self.rows.get(rating_key)
+        return IndexedTrack(self, row) if row else None
+
+    def tracks_for_artist(self, artist_key):
+        return [IndexedTrack(self, self.rows[key]) for key in self.artist_tracks.get(artist_key, [])]
+
+    def albums_for_artist(self, artist_key):
+        return [IndexedAlbum(self, key, self.albums[key]) for key in self.artist_albums.get(artist_key, [])]
+
+    def tracks_for_album(self, album_key):
+        return [IndexedTrack(self, self.rows[key]) for key in self.album_tracks.get(album_key, [])]
+
+
+LIBRARY_INDEXES = {}
+LIBRARY_INDEXES_LOCK = threading.Lock()
+
+def get_library_index(plex_server, section_id, progress_callback=None, refresh=False):
+    """Return the shared index for a section, loading it from disk or building it on first use.
+
+    With refresh=True an index loaded from disk is brought up to date with a delta refresh.
+    """
+    server_id = getattr(plex_server, 'machineIdentifier', None)
+    with LIBRARY_INDEXES_LOCK:
+        key = (server_id, str(section_id))
+        library_index = LIBRARY_INDEXES.get(key)
+        if library_index is None:
+            library_index = LibraryIndex(section_id, server_id)
+            LIBRARY_INDEXES[key] = library_index
+    with library_index.lock:
+        if library_index.built_at is None and not library_index.load():
+            library_index.build(plex_server, progress_callback=progress_callback)
+        elif refresh:
+            library_index.refresh_if_stale(plex_server)
+    return library_index
+
+MATCH_SECTION_IDS = {}
+MATCH_SECTION_IDS_LOCK = threading.Lock()
+
+def match_section_ids(plex_server, section_id):
+    """The selected section followed by the music sections matched together with it.
+
+    "match_sections" in app_config.json lists section keys to search alongside the selected
+    one, or "all" for every music section on the server. The answer is cached per server and
+    section until clear_match_section_ids(); a failed lookup falls back to the cached answer
+    instead of switching engines.
+    """
+    key = (getattr(plex_server, 'machineIdentifier', None), str(section_id))
+    with MATCH_SECTION_IDS_LOCK:
+        cached = MATCH_SECTION_IDS.get(key)
+    if cached is not None:
+        return cached
+    section_ids = [str(section_id)]
+    extra_sections = get_config_value("match_sections", [])
+    try:
+        if extra_sections == "all":
+            extra_sections = [section.key for section in plex_server.library.sections() if section.type == 'artist']
+        for extra_id in extra_sections or []:
+            if str(extra_id) not in section_ids:
+                section_ids.append(str(extra_id))
+    except Exception as e:
+        logging.warning(f"Error reading the music sections to match across: {e}")
+        return tuple(section_ids[:1])
+    with MATCH_SECTION_IDS_LOCK:
+        return MATCH_SECTION_IDS.setdefault(key, tuple(section_ids))
+
+def clear_match_section_ids():
+    """Forget the resolved section lists, e.g. after connecting to another server"""
+    with MATCH_SECTION_IDS_LOCK:
+        MATCH_SECTION_IDS.clear()
+
+def get_library_indexes(plex_server, section_ids, progress_callback=None, refresh=False):
+    """Index over one or more sections, each section loaded, built or refreshed in parallel.
+
+    A single section gives its LibraryIndex, several a MultiSectionIndex. Sections that fail are
+    left out with a warning; an error is raised only if none of them could be loaded.
+    """
+    if len(section_ids) == 1:
+        return get_library_index(plex_server, section_ids[0], progress_callback, refresh)
+    indexes = {}
+    errors = []
+    with ThreadPoolExecutor(max_workers=len(section_ids)) as executor:
+        futures = {executor.submit(get_library_index, plex_server, section_id, progress_callback, refresh): section_id
+                   for section_id in section_ids}
+        for future in as_completed(futures):
+            try:
+                indexes[futures[future]] = future.result()
+            except Exception as e:
+                logging.warning(f"Library index for section {futures[future]} unavailable: {e}")
+                errors.append(e)
+    if not indexes:
+        raise errors[0]
+    return MultiSectionIndex([indexes[section_id] for section_id in section_ids if section_id in indexes])
+
+
+class MultiSectionIndex:
+    """Several sections' LibraryIndexes searched as one, the selected section first.
+
+    Ties keep section order, so a recording that is in both a FLAC and an MP3 section
+    resolves to the copy in the selected section.
+    """
+    def __init__(self, indexes):
+        self.indexes = indexes
+        self.section_id = indexes[0].section_id
+
+    def __len__(self):
+        return sum(len(index) for index in self.indexes)
+
+    @property
+    def rows(self):
+        return ChainMap(*(index.rows for index in self.indexes))
+
+    def get_track(self, rating_key):
+        for index in self.indexes:
+            if rating_key in index.rows:
+                return index.get_track(rating_key)
+        return None
+
+    def search_artists(self, name):
+        # Each section's best artists first, the selected section's ahead on the same position
+        matches = [(position, rank, artist) for rank, index in enumerate(self.indexes)
+                   for position, artist in enumerate(index.search_artists(name))]
+        return [artist for _, _, artist in sorted(matches, key=lambda match: match[:2])]
+
+    def has_artist(self, name):
+        return any(index.has_artist(name) for index in self.indexes)
+
+    def search_tracks(self, title):
+        return [track for index in self.indexes for track in index.search_tracks(title)]
+
+    def tiered_match(self, title, artist, duration_ms=None, tolerance_ms=EXACT_MATCH_DURATION_TOLERANCE):
+        """The first section's exact hit, else the first section's near hit"""
+        near_hit = None
+        for index in self.indexes:
+            plex_track, tier = index.tiered_match(title, artist, duration_ms, tolerance_ms)
+            if tier == 'exact':
+                return plex_track, tier
+            if tier == 'near' and near_hit is None:
+                near_hit = plex_track
+        return (near_hit, 'near') if near_hit is not None else (None, None)
+
+    def ensure_trigram_index(self):
+        for index in self.indexes:
+            index.ensure_trigram_index()
+
+    def fuzzy_search(self, title="", artist="", limit=50):
+        scored = []
+        for rank, index in enumerate(self.indexes):
+            scored.extend((score, -rank, rating_key, index) for rating_key, score in index.fuzzy_scores(title, artist).items())
+        best = heapq.nlargest(limit, scored, key=lambda item: item[:2])
+        return [index.get_track(rating_key) for _, _, rating_key, index in best]
+
+def resolve_indexed_tracks(plex_server, tracks):
+    """Swap IndexedTrack placeholders for real plexapi tracks using batched metadata requests"""
+    rating_keys = [track.ratingKey for track in tracks if isinstance(track, IndexedTrack)]
+    if not rating_keys:
+        return list(tracks)
+    fetched = {}
+    for start in range(0, len(rating_keys), 200):
+        chunk = rating_keys[start:start + 200]
+        try:
+            items = plex_server.fetchItems(f"/library/metadata/{','.join(str(key) for key in chunk)}")
+            for item in items:
+                fetched[item.ratingKey] = item
+        except Exception as e:
+            logging.error(f"Error fetching matched tracks from Plex: {str(e)}")
+    resolved = []
+    for track in tracks:
+        if isinstance(track, IndexedTrack):
+            if track.ratingKey in fetched:
+                resolved.append(fetched[track.ratingKey])
+            else:
+                logging.warning(f"Track '{track.title}' (ratingKey {track.ratingKey}) is no longer in Plex - skipping")
+        else:
+            resolved.append(track)
+    return resolved
+
+
+# FILTERED SEARCHES - ask Plex for the few tracks of an artist/album whose title could match,
+# instead of downloading the whole discography and filtering it here
+TRACK_LIBTYPE = 10
+TITLE_FILTER_WORD_PATTERN = re.compile(r'[a-z0-9]{3,}')
+
+def title_filter_word(title):
+    """Longest plain word of the cleaned title, sent to Plex as a 'title contains' filter"""
+    words = TITLE_FILTER_WORD_PATTERN.findall(clean_title_for_search(title or "").lower())
+    return max(words, key=len) if words else None
+
+def search_tracks_filtered(library_section, title, artist_key=None, album_key=None):
+    """Tracks of one artist or album whose title contains the title's longest word.
+
+    Returns None when the title has no usable word to filter on.
+    """
+    word = title_filter_word(title)
+    if not word:
+        return None
+    params = {'type': TRACK_LIBTYPE, 'title': word}
+    if artist_key is not None:
+        params['artist.id'] = artist_key
+    if album_key is not None:
+        params['album.id'] = album_key
+    return library_section.fetchItems(f"/library/sections/{library_section.key}/all?{urllib.parse.urlencode(params)}")
+
+def candidate_tracks(library_section, title, artist_obj=None, album_obj=None):
+    """Tracks of an artist or album that could be `title`, for the caller's fuzzy title check.
+
+    Index-backed artists/albums are listed from memory; Plex ones are asked for a filtered
+    list, falling back to the full listing when no filtered track passes fuzzy_title_match
+    (e.g. spelling or accents differ and the filter only caught other tracks).
+    """
+    owner = album_obj if album_obj is not None else artist_obj
+    if isinstance(owner, (IndexedArtist, IndexedAlbum)) or not title:
+        return owner.tracks()
+    try:
+        if album_obj is not None:
+            tracks = search_tracks_filtered(library_section, title, album_key=album_obj.ratingKey)
+        else:
+            tracks = search_tracks_filtered(library_section, title, artist_key=artist_obj.ratingKey)
+        if any(fuzzy_title_match(title, track.title) for track in tracks):
+            logging.debug(f"Filtered search for '{title}' in '{owner.title}' returned {len(tracks)} tracks")
+            return tracks
+        logging.debug(f"Filtered search for '{title}' in '{owner.title}' found no close title, listing all tracks")
+    except Exception as e:
+        logging.warning(f"Filtered track search failed for '{title}' in '{owner.title}', listing all tracks: {e}")
+    return owner.tracks()
+
+class CataloguePlan:
+    """Per-run cache of artist searches, discographies and album track lists.
+
+    plan() walks the whole source playlist first so every distinct artist and album
+    is fetched once, however many of its tracks the playlist contains. Plex artists with
+    a single playlist track are not prefetched - a filtered search for that one title is
+    cheaper than their whole discography.
+    """
+
+    def __init__(self, library_section, search_artists, request_budget=None):
+        self.library_section = library_section
+        self.search_artists_func = search_artists
+        # Only needed when the catalogue comes from Plex rather than the library index
+        self.request_budget = request_budget
+        # Shared by the match workers - each cache holds a Future per key, see cached()
+        self.lock = threading.Lock()
+        self.artist_results = {}  # lowercased artist name -> matching artist objects
+        self.artist_tracks = {}  # artist ratingKey -> tracks
+        self.artist_albums = {}  # artist ratingKey -> albums
+        self.album_tracks = {}  # album ratingKey -> tracks
+        self.whole_artists = set()  # artist ratingKeys worth listing in full
+
+    def plan(self, tracks, parse_track_info):
+        """Group the source tracks by artist and album and fetch each group's catalogue once"""
+        groups = {}
+        for track in tracks:
+            title, artist, album = parse_track_info(track)
+            if not artist or not artist.strip():
+                continue
+            albums = groups.setdefault(artist.lower().strip(), {})
+            album_key = album.lower().strip() if album and album != 'Unknown Album' else ''
+            albums[album_key] = albums.get(album_key, 0) + 1
+
+        for artist_key, albums in groups.items():
+            try:
+                artist_results = self.search_artists(artist_key)
+                for artist_obj in artist_results[:3]:
+                    if sum(albums.values()) > 1 or isinstance(artist_obj, IndexedArtist):
+                        self.whole_artists.add(artist_obj.ratingKey)
+                        self.tracks_for_artist(artist_obj)
+                source_albums = [album_key for album_key in albums if album_key]
+                for artist_obj in artist_results[:2] if source_albums else []:
+                    self.prefetch_albums(artist_obj, source_albums)
+            except Exception as e:
+                logging.warning(f"Error prefetching catalogue for artist '{artist_key}': {e}")
+
+        logging.info(f"Catalogue plan: {sum(len(albums) for albums in groups.values())} artist/album groups "
+                     f"across {len(groups)} artists from {len(tracks)} tracks")
+
+    def prefetch_albums(self, artist_obj, source_albums):
+        """Fetch the track lists of the artist's albums that the source playlist names"""
+        artist_albums = self.albums_for_artist(artist_obj)
+        album_titles = [artist_album.title.lower() for artist_album in artist_albums]
+        wanted = set()
+        for source_album in source_albums:
+            # Same cutoff the match loop uses to pick albums to search
+            for _, _, i in scoring_backend().extract(source_album, album_titles, score_cutoff=70):
+                wanted.add(i)
+        for i in sorted(wanted):
+            self.tracks_for_album(artist_albums[i])
+
+    def search_artists(self, artist):
+        key = (artist or "").lower().strip()
+        return self.cached(self.artist_results, key,
+                           lambda: self.search_artists_func(self.library_section, artist), budget=False)
+
+    def tracks_for_artist(self, artist_obj, title=None):
+        """Whole discography, or with title just the candidates for it if the artist wasn't planned"""
+        if title is not None and artist_obj.ratingKey not in self.whole_artists:
+            with self.lock:
+                pending = self.artist_tracks.get(artist_obj.ratingKey)
+            if pending is None:
+                return self.fetch(lambda: candidate_tracks(self.library_section, title, artist_obj))
+            return pending.result()
+        return self.cached(self.artist_tracks, artist_obj.ratingKey, artist_obj.tracks)
+
+    def albums_for_artist(self, artist_obj):
+        return self.cached(self.artist_albums, artist_obj.ratingKey, artist_obj.albums)
+
+    def tracks_for_album(self, album_obj):
+        return self.cached(self.album_tracks, album_obj.ratingKey, album_obj.tracks)
+
+    def cached(self, cache, key, method, budget=True):
+        """method()'s result under cache[key], computed once however many match workers ask at the same time.
+
+        The first caller of a missing key does the fetch; the others wait on its Future. A failed
+        fetch is not cached, so the next caller tries again.
+        """
+        with self.lock:
+            pending = cache.get(key)
+            owner = pending is None
+            if owner:
+                pending = cache[key] = Future()
+        if owner:
+            try:
+                pending.set_result(self.fetch(method) if budget else method())
+            except Exception as e:
+                with self.lock:
+                    del cache[key]
+                pending.set_exception(e)
+        return pending.result()
+
+    def fetch(self, method):
+        if self.request_budget is None:
+            return method()
+        with self.request_budget:
+            return method()
+
+
+# MATCH MEMO - accepted source track -> Plex ratingKey matches, reused across sync/import/sort
+class MatchMemo:
+    def __init__(self):
+        self.memo_data = {"matches": {}, "version": "1.0"}
+        self.lock = threading.RLock()
+        self.dirty = False
+        self.load_memo()
+
+    def load_memo(self):
+        try:
+            if os.path.exists(MATCH_MEMO_FILE):
+                with open(MATCH_MEMO_FILE, 'r', encoding='utf-8') as f:
+                    self.memo_data = json.load(f)
+                logging.info("Match memo loaded successfully")
+        except Exception as e:
+            logging.error(f"Error loading match memo: {str(e)}")
+            self.memo_data = {"matches": {}, "version": "1.0"}
+
+    def save_memo(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            try:
+                with open(MATCH_MEMO_FILE, 'w', encoding='utf-8') as f:
+                    json.dump(self.memo_data, f, separators=(',', ':'))
+                self.dirty = False
+                logging.info("Match memo saved successfully")
+            except Exception as e:
+                logging.error(f"Error saving match memo: {str(e)}")
+
+    @staticmethod
+    def source_keys(track):
+        """Stable identifiers of a source track: service track ID and ISRC when known"""
+        if not isinstance(track, dict):
+            return []
+        keys = []
+        if track.get('service') and track.get('id'):
+            keys.append(f"{track['service']}:{track['id']}")
+        if track.get('isrc'):
+            keys.append(f"isrc:{str(track['isrc']).upper()}")
+        return keys
+
+    def lookup(self, server_id, track, section_ids=None, library_index=None):
+        """ratingKey of an earlier accepted match for this track, or None.
+
+        With section_ids only matches in those sections count. Entries whose ratingKey is
+        no longer in the library index are dropped.
+        """
+        with self.lock:
+            server_matches = self.memo_data["matches"].get(server_id, {})
+            for key in self.source_keys(track):
+                entry = server_matches.get(key)
+                if not entry:
+                    continue
+                if section_ids is not None and entry.get('section_id') not in section_ids:
+                    continue
+                if library_index is not None and entry['rating_key'] not in library_index.rows:
+                    logging.info(f"Forgetting memoized match for '{entry.get('title')}' - ratingKey {entry['rating_key']} is gone")
+                    self.forget_rating_key(server_id, entry['rating_key'])
+                    continue
+                return entry['rating_key']
+        return None
+
+    def lookup_track(self, plex_server, track, section_ids, library_index=None):
+        """Memoized match as a track object (index row or Plex item), or None"""
+        server_id = getattr(plex_server, 'machineIdentifier', None)
+        rating_key = self.lookup(server_id, track, section_ids, library_index)
+        if rating_key is None:
+            return None
+        if library_index is not None:
+            return library_index.get_track(rating_key)
+        try:
+            return plex_server.fetchItem(rating_key)
+        except Exception:
+            self.forget_rating_key(server_id, rating_key)
+            return None
+
+    def remember(self, server_id, track, plex_track, section_id=None):
+        keys = self.source_keys(track)
+        rating_key = getattr(plex_track, 'ratingKey', None)
+        if not keys or rating_key is None:
+            return
+        if section_id is None:
+            section_id = getattr(plex_track, 'librarySectionID', None)
+        entry = {
+            "rating_key": int(rating_key),
+            "section_id": str(section_id) if section_id is not None else None,
+            "title": getattr(plex_track, 'title', ''),
+            "matched_at": datetime.now().isoformat()
+        }
+        with self.lock:
+            server_matches = self.memo_data["matches"].setdefault(server_id, {})
+            for key in keys:
+                if server_matches.get(key, {}).get('rating_key') != entry['rating_key']:
+                    server_matches[key] = entry
+                    self.dirty = True
+
+    def forget_rating_key(self, server_id, rating_key):
+        with self.lock:
+            server_matches = self.memo_data["matches"].get(server_id, {})
+            for key in [key for key, entry in server_matches.items() if entry['rating_key'] == rating_key]:
+                del server_matches[key]
+                self.dirty = True
+
+
+def source_track_record(service, track_id, title, artist, album=''):
+    """Source playlist track with the service ID needed to memoize its match"""
+    return {
+        'title': title,
+        'artist': artist,
+        'album': album,
+        'display': f"{title} - {artist}",
+        'service': service,
+        'id': str(track_id) if track_id is not None else None
+    }
+
+
+MATCH_MEMO = None
+MATCH_MEMO_LOCK = threading.Lock()
+
+def get_match_memo():
+    """Shared match memo, loaded from disk on first use"""
+    global MATCH_MEMO
+    with MATCH_MEMO_LOCK:
+        if MATCH_MEMO is None:
+            MATCH_MEMO = MatchMemo()
+        return MATCH_MEMO
+
+
+# PLEX REQUEST BUDGET - caps concurrent requests per server while tracks are matched in parallel
+PLEX_REQUEST_BUDGETS = {}
+PLEX_REQUEST_BUDGETS_LOCK = threading.Lock()
+
+def get_plex_request_budget(plex_server):
+    """Semaphore shared by every worker talking to this Plex server"""
+    server_id = getattr(plex_server, 'machineIdentifier', None) or id(plex_server)
+    with PLEX_REQUEST_BUDGETS_LOCK:
+        budget = PLEX_REQUEST_BUDGETS.get(server_id)
+        if budget is None:
+            try:
+                limit = max(1, int(get_config_value("plex_max_requests", PLEX_MAX_REQUESTS)))
+            except (TypeError, ValueError):
+                limit = PLEX_MAX_REQUESTS
+            budget = PLEX_REQUEST_BUDGETS[server_id] = threading.BoundedSemaphore(limit)
+            logging.info(f"Plex request budget for {server_id}: {limit} in flight")
+        return budget
+
+# PLEX CLIENT - one pooled HTTP session shared by the PlexServer and every helper that talks to
+# Plex directly, so worker threads reuse kept-alive connections instead of opening their own
+PLEX_SESSION = None
+PLEX_SESSION_LOCK = threading.Lock()
+
+def plex_pool_size():
+    """Connections to keep open per Plex host, sized for the configured concurrency"""
+    try:
+        workers = max(1, int(get_config_value("match_workers", MATCH_WORKERS)))
+    except (TypeError, ValueError):
+        workers = MATCH_WORKERS
+    try:
+        in_flight = max(1, int(get_config_value("plex_max_requests", PLEX_MAX_REQUESTS)))
+    except (TypeError, ValueError):
+        in_flight = PLEX_MAX_REQUESTS
+    return max(workers, in_flight) + PLEX_POOL_HEADROOM
+
+def get_plex_session():
+    """Shared keep-alive session with a retry policy for all Plex traffic"""
+    global PLEX_SESSION
+    with PLEX_SESSION_LOCK:
+        if PLEX_SESSION is None:
+            session = requests.Session()
+            session.headers['Connection'] = 'keep-alive'
+            # Connection errors (nothing reached Plex) are retried for any method; read errors and
+            # error statuses only for reads, since playlist adds, moves and uploads are PUT/POST
+            # and would be applied twice
+            retry_strategy = Retry(
+                total=3,
+                connect=3,
+                read=2,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "HEAD", "OPTIONS"],
+                raise_on_status=False,
+                respect_retry_after_header=True
+            )
+            pool_size = plex_pool_size()
+            adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            PLEX_SESSION = session
+            logging.info(f"Plex HTTP session: {pool_size} pooled connections per host")
+        return PLEX_SESSION
+
+def connect_plex_server(base_url, token):
+    """PlexServer bound to the shared session and request timeout"""
+    return PlexServer(base_url, token, session=get_plex_session(), timeout=PLEX_REQUEST_TIMEOUT)
+
+def plex_post(url, **kwargs):
+    """POST to Plex through the shared session"""
+    kwargs.setdefault('timeout', PLEX_REQUEST_TIMEOUT)
+    return get_plex_session().post(url, **kwargs)
+
+# PLAYLIST EDITS - turn an edited playlist order into the fewest per-item Plex removes and moves,
+# so saving costs follow the number of changes rather than the playlist length
+def longest_increasing_run(values):
+    """Positions of one longest strictly increasing subsequence of values"""
+    tails = []  # tails[k]: smallest value ending an increasing run of length k + 1
+    tail_positions = []
+    previous = [-1] * len(values)
+    for position, value in enumerate(values):
+        k = bisect_left(tails, value)
+        if k == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[k] = value
+            tail_positions[k] = position
+        previous[position] = tail_positions[k - 1] if k else -1
+    run = []
+    position = tail_positions[-1] if tail_positions else -1
+    while position != -1:
+        run.append(position)
+        position = previous[position]
+    return run[::-1]
+
+def plan_playlist_moves(original_ids, edited_ids):
+    """Removed ids plus (item_id, after_id) moves that turn original_ids into edited_ids.
+
+    Items on a longest increasing run of original positions are already in the right relative
+    order and stay put; every other item is moved after its new predecessor (after_id None is
+    the top), front to back so each predecessor is already in place.
+    """
+    kept = set(edited_ids)
+    removed = [item_id for item_id in original_ids if item_id not in kept]
+    original_positions = {item_id: position for position, item_id in enumerate(original_ids)}
+    run = longest_increasing_run([original_positions[item_id] for item_id in edited_ids])
+    staying = {edited_ids[position] for position in run}
+    moves = []
+    for position, item_id in enumerate(edited_ids):
+        if item_id not in staying:
+            moves.append((item_id, edited_ids[position - 1] if position else None))
+    return removed, moves
+
+def apply_playlist_moves(playlist, removed, moves):
+    """Apply a plan_playlist_moves edit script through Plex's per-item endpoints"""
+    # playlistItemIDs are sent as-is; plexapi's removeItems/moveItem refetch the playlist to look each one up
+    server = playlist._server
+    for item_id in removed:
+        server.query(f"{playlist.key}/items/{item_id}", method=server._session.delete)
+    for item_id, after_id in moves:
+        key = f"{playlist.key}/items/{item_id}/move"
+        if after_id is not None:
+            key += f"?after={after_id}"
+        server.query(key, method=server._session.put)
+
+# MATCHING ENGINE - one matcher for sync, import, sort and merge. The workflows differ only in
+# their MatchStrategy; engines are shared per server/section, so the library index, match memo
+# and Plex-side normalization cache one workflow warms are reused by the others
+CLEAN_SOURCE_VERSION_TAGS = (
+    'remaster', 'remastered', 'remastered version', 'remastered edition',
+    'stereo', 'mono', 'original', 'album version', 'single version',
+    'explicit', 'clean', 'radio edit', 'radio version'
+)
+# Soundtrack and compilation variants (common after dash removal)
+SOUNDTRACK_VERSION_TAGS = (
+    'soundtrack', 'from', 'motion picture', 'movie', 'film',
+    'ost', 'original soundtrack', 'original motion picture soundtrack'
+)
+REMIX_TERMS = ('remix', 'mix', 'version', 'edit', 'extended', 'radio', 'club', 'dance', 'house', 'vocal', 'instrumental')
+VERSION_INFO_PATTERNS = (
+    re.compile(r'\(([^)]+)\)'),  # Content in parentheses
+    re.compile(r'\[([^\]]+)\]'),  # Content in brackets
+)
+ACOUSTIC_PLAYLIST_TERMS = ('acoustic', 'unplugged', 'mtv unplugged')
+VERSION_PENALTIES = (
+    ('live', -5.0),         # Live versions get penalty but are still available
+    ('concert', -5.0),
+    ('tour', -5.0),
+    ('demo', -3.0),         # Demo versions get penalty
+)
+ACOUSTIC_VERSION_PENALTIES = (
+    ('acoustic', -2.0),
+    ('unplugged', -3.0),
+)
+VERSION_BONUSES = (
+    ('remaster', 3.0),      # Highest preference
+    ('remastered', 3.0),
+    ('remastered edition', 3.5),
+    ('remastered version', 3.5),
+    ('2021 remaster', 4.0), # Recent remasters get slight extra bonus
+    ('2020 remaster', 4.0),
+    ('2019 remaster', 4.0),
+    ('deluxe', 1.0),        # Lower preference
+    ('deluxe edition', 1.0),
+    ('expanded', 1.0),
+    ('anniversary', 2.0),   # Medium preference
+)
+MAX_VERSION_BONUS = max(3.0, max(value for _, value in VERSION_BONUSES))  # 3.0 is "unplugged" in an acoustic playlist
+LIBRARY_WIDE_SEARCH_LOG = "library_wide_searches.log"
+
+
+# Version flags - a title's bracketed version info reduced to bits, so filtering candidates
+# is integer comparisons instead of re-parsing every Plex title for every source track
+VERSION_HAS_EXTRAS = 1  # has bracketed version info
+VERSION_LIVE = 2
+VERSION_REMIX = 4
+VERSION_CLEAN_OK = 8  # every bracket is allowed next to a clean source title
+VERSION_SOUNDTRACK_OK = 16  # the same, counting soundtrack/compilation tags as allowed
+VERSION_ALLOWED_FLAGS = (
+    (VERSION_CLEAN_OK, CLEAN_SOURCE_VERSION_TAGS),
+    (VERSION_SOUNDTRACK_OK, CLEAN_SOURCE_VERSION_TAGS + SOUNDTRACK_VERSION_TAGS),
+)
+VERSION_FLAG_FOR_TAGS = {allowed_versions: flag for flag, allowed_versions in VERSION_ALLOWED_FLAGS}
+
+
+class VersionProfile:
+    """Version info of one title, parsed once: flag bits, remix tags and preference bonuses"""
+    __slots__ = ('flags', 'remixes', 'bonus', 'acoustic_bonus')
+
+    def __init__(self, flags, remixes=(), bonus=0.0, acoustic_bonus=0.0):
+        self.flags = flags
+        self.remixes = remixes
+        self.bonus = bonus  # get_version_preference_bonus in a regular playlist
+        self.acoustic_bonus = acoustic_bonus  # ... in an acoustic/unplugged themed playlist
+
+
+PLAIN_VERSION_PROFILE = VersionProfile(VERSION_CLEAN_OK | VERSION_SOUNDTRACK_OK)
+
+
+def extract_version_info(title):
+    """Version information from parentheses and brackets in a track title"""
+    extras = []
+    for pattern in VERSION_INFO_PATTERNS:
+        extras.extend(pattern.findall(title))
+    return extras
+
+
+def compute_version_profile(title):
+    """Parse a title's version tags and keywords into a VersionProfile"""
+    extras = [extra.lower() for extra in extract_version_info(title)]
+    flags = 0
+    remixes = ()
+    if extras:
+        flags |= VERSION_HAS_EXTRAS
+        if any('live' in extra for extra in extras):
+            flags |= VERSION_LIVE
+        remixes = tuple(extra for extra in extras if any(term in extra for term in REMIX_TERMS))
+        if remixes:
+            flags |= VERSION_REMIX
+    for flag, allowed_versions in VERSION_ALLOWED_FLAGS:
+        if all(any(allowed in extra.strip() for allowed in allowed_versions) for extra in extras):
+            flags |= flag
+    
+    title_lower = title.lower()
+    bonus = max([value for keyword, value in VERSION_BONUSES if keyword in title_lower], default=0.0)
+    penalty = min([value for keyword, value in VERSION_PENALTIES if keyword in title_lower], default=0.0)
+    acoustic_penalty = min([value for keyword, value in ACOUSTIC_VERSION_PENALTIES if keyword in title_lower], default=0.0)
+    if 'acoustic' in title_lower:
+        acoustic_bonus = 2.0
+    elif 'unplugged' in title_lower:
+        acoustic_bonus = 3.0
+    else:
+        acoustic_bonus = bonus + penalty
+    
+    if flags == PLAIN_VERSION_PROFILE.flags and not bonus and not penalty and not acoustic_penalty and not acoustic_bonus:
+        return PLAIN_VERSION_PROFILE
+    return VersionProfile(flags, remixes, bonus + min(penalty, acoustic_penalty), acoustic_bonus)
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def version_profile(title):
+    """Memoized compute_version_profile for source titles and tracks outside the library index"""
+    return compute_version_profile(title)
+
+
+def track_version_profile(plex_track, featured_removed=False):
+    """Version profile of a Plex track's title (or of it without featured artists).
+
+    Library index tracks carry theirs precomputed; anything else is parsed once per title.
+    """
+    versions = getattr(plex_track, 'versions', None)
+    if versions is not None:
+        return versions[featured_removed]
+    title = plex_track.title or ""
+    return version_profile(remove_featured_artists_aggressive(title) if featured_removed else title)
+
+
+def is_acceptable_version_match(source_title, plex_title, allowed_versions=CLEAN_SOURCE_VERSION_TAGS, plex_profile=None):
+    """
+    Check if a Plex track version is acceptable for matching against a source track.
+    A clean source only takes the explicitly allowed versions; a source with version info
+    must agree with the Plex track on live/non-live and on its remix (85% similarity).
+    plex_profile is the Plex title's precomputed VersionProfile, if the caller has it.
+    """
+    source = version_profile(source_title)
+    plex = plex_profile if plex_profile is not None else version_profile(plex_title)
+    
+    if not source.flags & VERSION_HAS_EXTRAS:
+        if not plex.flags & VERSION_HAS_EXTRAS:
+            return True
+        allowed_flag = VERSION_FLAG_FOR_TAGS.get(allowed_versions)
+        if allowed_flag is not None:
+            allowed = plex.flags & allowed_flag
+        else:
+            allowed = all(any(tag in extra.lower() for tag in allowed_versions) for extra in extract_version_info(plex_title))
+        if not allowed:
+            logging.debug(f"Rejecting version: '{plex_title}' for clean source: '{source_title}'")
+        return bool(allowed)
+    
+    # Don't match live to non-live or vice versa
+    if (source.flags ^ plex.flags) & VERSION_LIVE:
+        logging.debug(f"Rejecting live/non-live mismatch: '{source_title}' vs '{plex_title}'")
+        return False
+    
+    if not (source.flags | plex.flags) & VERSION_REMIX:
+        return True
+    if (source.flags ^ plex.flags) & VERSION_REMIX:
+        logging.debug(f"Remix mismatch: source has {source.remixes}, plex has {plex.remixes}")
+        return False
+    
+    best_similarity = max(fuzz.ratio(source_remix, plex_remix) for source_remix in source.remixes for plex_remix in plex.remixes)
+    if best_similarity < 85:
+        logging.debug(f"Remix versions incompatible: only {best_similarity}% similarity (need 85%)")
+        return False
+    return True
+
+
+def get_version_preference_bonus(title, playlist_name='', profile=None):
+    """
+    Small score adjustment preferring remastered versions over live, demo and acoustic ones.
+    In an acoustic/unplugged themed playlist those versions get a bonus instead.
+    """
+    if profile is None:
+        profile = version_profile(title)
+    if any(term in playlist_name for term in ACOUSTIC_PLAYLIST_TERMS):
+        return profile.acoustic_bonus
+    return profile.bonus
+
+
+def log_library_wide_search(title, artist, reason):
+    """Log tracks that cause library-wide searches to a separate file for easy identification"""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    log_entry = f"[{timestamp}] LIBRARY-WIDE SEARCH: '{title}' by '{artist}' - Reason: {reason}\n"
+    try:
+        with open(LIBRARY_WIDE_SEARCH_LOG, 'a', encoding='utf-8') as f:
+            f.write(log_entry)
+    except Exception as e:
+        logging.warning(f"Failed to write to library search log: {e}")
+
+
+class MatchStrategy:
+    """Scoring rules of one workflow; this base class is the sync matcher.
+
+    MatchingEngine gathers the candidates and keeps the caches - a strategy only decides
+    how a candidate scores and which scores are good enough.
+    """
+    name = 'sync'
+    accept_threshold = 70
+    min_artist_score = 50  # candidates by a clearly different artist are dropped
+    title_search_fallback = True  # library-wide title search when the artist search finds nothing
+    allowed_versions = CLEAN_SOURCE_VERSION_TAGS
+
+    def score(self, engine, title, artist, album, plex_track, playlist_name=''):
+        """(final score, combined score) of one candidate, or None to drop it"""
+        plex_title = plex_track.title or ""
+        plex_profile = track_version_profile(plex_track)
+        if not is_acceptable_version_match(title, plex_title, self.allowed_versions, plex_profile):
+            logging.debug(f"Skipping version mismatch: '{title}' vs '{plex_title}'")
+            return None
+        
+        backend = scoring_backend()
+        plex_artist = engine.plex_artist(plex_track) or ""
+        artist_score = backend.token_set_ratio(artist.lower(), plex_artist.lower(), self.min_artist_score) if artist and plex_artist else 0
+        if artist and artist_score < self.min_artist_score:
+            logging.debug(f"Skipping due to low artist match: '{artist}' vs '{plex_artist}' (score under {self.min_artist_score})")
+            return None
+        
+        title_cutoff = self.title_cutoff(artist_score)
+        title_score = backend.token_set_ratio(title.lower(), plex_title.lower(), title_cutoff)
+        if title_score < title_cutoff:
+            return None
+        
+        combined_score = (title_score * 0.7) + (artist_score * 0.3)
+        return combined_score + get_version_preference_bonus(plex_title, playlist_name, plex_profile), combined_score
+
+    def score_floor(self):
+        """Combined score below which a candidate can't change the outcome of a match"""
+        return self.accept_threshold
+
+    def title_cutoff(self, artist_score):
+        """Lowest title score that can still lift the 70/30 combined score to score_floor()"""
+        return (self.score_floor() - artist_score * 0.3) / 0.7 - 0.01
+
+    def accepts(self, title, combined_score):
+        return combined_score >= self.accept_threshold
+
+
+class MergeMatchStrategy(MatchStrategy):
+    """M3U merge: artist-first only, never a library-wide search"""
+    name = 'merge'
+    min_artist_score = 0
+    title_search_fallback = False
+
+
+class ImportMatchStrategy(MatchStrategy):
+    """Streaming playlist import: featured-artist aware, album bonus, stricter short titles.
+
+    Scores of confident_score and up are accepted outright, confirm_score and up go to the user.
+    """
+    name = 'import'
+    accept_threshold = 60
+    short_title_threshold = 90
+    confident_score = 80
+    confirm_score = 60
+    max_bonus = MAX_VERSION_BONUS + 5.0 + SECTION_AFFINITY_BONUS  # version preference, album_bonus and section affinity
+    title_search_fallback = False
+    allowed_versions = CLEAN_SOURCE_VERSION_TAGS + SOUNDTRACK_VERSION_TAGS
+
+    def is_short_title(self, title):
+        return len(title.strip()) <= 4
+
+    def score_floor(self):
+        # The best final score decides whether to ask the user, and bonuses can lift a candidate to confirm_score
+        return min(self.accept_threshold, self.confirm_score - self.max_bonus)
+
+    def score(self, engine, title, artist, album, plex_track, playlist_name=''):
+        plex_title = plex_track.title or ""
+        
+        # Clean featured artists from BOTH source and Plex titles, and dashes from the source
+        clean_source_title = remove_featured_artists_aggressive(title)
+        clean_plex_title = remove_featured_artists_aggressive(plex_title)
+        dash_cleaned_source = clean_title_for_search(title, keep_version_tags=True)
+        logging.debug(f"Comparing: '{dash_cleaned_source}' vs '{clean_plex_title}' (original: '{title}' vs '{plex_title}')")
+        
+        if not is_acceptable_version_match(dash_cleaned_source, clean_plex_title, self.allowed_versions,
+                                           track_version_profile(plex_track, featured_removed=True)):
+            logging.debug(f"Skipping version mismatch: '{dash_cleaned_source}' vs '{clean_plex_title}'")
+            return None
+        
+        backend = scoring_backend()
+        plex_artist = (engine.plex_artist(plex_track) or "") if artist else ""
+        artist_score = backend.token_set_ratio(artist.lower(), plex_artist.lower(), self.min_artist_score) if plex_artist else 0
+        if artist and artist_score < self.min_artist_score:
+            logging.debug(f"Skipping due to low artist match: '{artist}' vs '{plex_artist}' (score under {self.min_artist_score})")
+            return None
+        
+        # Short titles need exact or near-exact matches
+        title_cutoff = max(self.title_cutoff(artist_score), 95) if self.is_short_title(title) else self.title_cutoff(artist_score)
+        # Use the better of the cleaned and the original title comparison
+        title_score = backend.token_set_ratio(dash_cleaned_source.lower(), clean_plex_title.lower(), title_cutoff)
+        title_score = max(title_score, backend.token_set_ratio(title.lower(), plex_title.lower(), max(title_cutoff, title_score)))
+        if title_score < title_cutoff:
+            return None
+        
+        if title_score == 100 and artist_score >= 90:
+            logging.info(f"EXACT MATCH FOUND: '{dash_cleaned_source}' by '{artist}' -> '{clean_plex_title}' by '{plex_artist}' (title: {title_score}, artist: {artist_score})")
+        elif dash_cleaned_source.lower() == clean_plex_title.lower():
+            logging.info(f"PERFECT CLEAN TITLE MATCH: '{dash_cleaned_source}' -> '{clean_plex_title}' (after dash removal and cleaning)")
+        
+        combined_score = (title_score * 0.7) + (artist_score * 0.3)
+        
+        # Source is clean but Plex has featured artists - penalize heavily unless the clean titles are identical
+        source_has_feat = title != clean_source_title
+        plex_has_feat = plex_title != clean_plex_title
+        if not source_has_feat and plex_has_feat and dash_cleaned_source.lower() != clean_plex_title.lower():
+            combined_score -= 25
+            logging.debug(f"Applied featured artist penalty: -25 points (new score: {combined_score})")
+        
+        # Short titles also need a closer artist
+        if self.is_short_title(title):
+            if artist and artist_score < 70:
+                logging.debug(f"Skipping short title due to insufficient artist match: '{artist}' vs '{plex_artist}' (score: {artist_score})")
+                return None
+        
+        preference_bonus = get_version_preference_bonus(plex_title, playlist_name, track_version_profile(plex_track))
+        return combined_score + preference_bonus + self.album_bonus(album, plex_track), combined_score
+
+    def album_bonus(self, album, plex_track):
+        """Prefer the source album, then the artist's own albums over compilations"""
+        if not album or album == 'Unknown Album':
+            return 0
+        plex_album = plex_track.album() if hasattr(plex_track, 'album') else None
+        if not plex_album:
+            return 0
+        album_similarity = scoring_backend().token_set_ratio(album.lower(), plex_album.title.lower(), 60)
+        if album_similarity >= 80:
+            return 5.0
+        if album_similarity >= 60:
+            return 2.0
+        return 0.5
+
+    def accepts(self, title, combined_score):
+        return combined_score >= (self.short_title_threshold if self.is_short_title(title) else self.accept_threshold)
+
+
+class SortMatchStrategy(MatchStrategy):
+    """Playlist sorting: every source/playlist pair is scored in one batch, see score_sort_candidates"""
+    name = 'sort'
+    accept_threshold = SORT_MATCH_THRESHOLD
+    memo_threshold = SORT_MEMO_THRESHOLD  # sort matches below this are used but not memoized
+
+    def source_key(self, title, artist):
+        clean_artist = clean_artist_name(artist).lower() if artist else ''
+        return clean_track_title(title).lower(), clean_artist, bool(artist)
+
+    def score_pairs(self, sources, targets):
+        return score_sort_candidates(sources, targets, self.accept_threshold)
+
+    def score(self, engine, title, artist, album, plex_track, playlist_name=''):
+        score = sort_pair_score(*self.source_key(title, artist), *engine.plex_key(plex_track))
+        return score, score
+
+    def accepts(self, title, combined_score):
+        return combined_score > self.accept_threshold
+
+
+class MatchingEngine:
+    """Track matcher shared by every workflow on one server and library section.
+
+    Owns the library index of the section (and of any sections matched together with it, see
+    match_section_ids), the match memo and a cache of cleaned Plex titles and artists, so
+    tracks an import matched are memo hits for a later sync, sort or merge.
+    Tracks go through cheap tiers first - memo, exact normalized title/artist, bounded title
+    edits - and only the rest get full fuzzy scoring; tier_hits counts where each match came
+    from. Get instances from get_matching_engine().
+    """
+    TIERS = ('memo', 'exact', 'near', 'fuzzy', 'miss')
+
+    def __init__(self, plex_server, section_id, section_ids=None):
+        self.plex_server = plex_server
+        self.section_id = section_id
+        # Selected section first; candidates from it get SECTION_AFFINITY_BONUS when there are several
+        self.section_ids = tuple(section_ids) if section_ids else ((str(section_id),) if section_id is not None else ())
+        self.server_id = getattr(plex_server, 'machineIdentifier', None)
+        self.library_index = None
+        self.match_memo = get_match_memo()
+        self.plex_keys = {}  # (ratingKey, title) -> (cleaned title, cleaned artist or None)
+        self.tier_hits = Counter()
+        self.stats_lock = threading.Lock()
+
+    def load_index(self, progress_callback=None, refresh=True):
+        """Load (and with refresh, bring up to date) the sections' index; None if it can't be built"""
+        if self.section_id is None:
+            return None
+        try:
+            self.library_index = get_library_indexes(self.plex_server, self.section_ids, progress_callback, refresh)
+        except Exception as e:
+            logging.warning(f"Library index unavailable, falling back to Plex searches: {e}")
+            self.library_index = None
+        return self.library_index
+
+    def count(self, tier):
+        with self.stats_lock:
+            self.tier_hits[tier] += 1
+
+    def tier_summary(self, since=None):
+        """'memo 3, exact 40, ...' for the hits since an earlier copy of tier_hits"""
+        with self.stats_lock:
+            hits = self.tier_hits - since if since is not None else Counter(self.tier_hits)
+        return ", ".join(f"{tier} {hits[tier]}" for tier in self.TIERS)
+
+    def lookup(self, track):
+        """Plex track of an earlier accepted match for this source track, or None"""
+        plex_track = self.match_memo.lookup_track(self.plex_server, track, self.section_ids or None, self.library_index)
+        if plex_track is not None:
+            self.count('memo')
+        return plex_track
+
+    def remember(self, track, plex_track):
+        self.match_memo.remember(self.server_id, track, plex_track, getattr(plex_track, 'librarySectionID', None) or self.section_id)
+
+    def save(self):
+        self.match_memo.save_memo()
+
+    def quick_match(self, title, artist, duration_ms=None):
+        """Exact or near-exact (bounded edits) title/artist hit from the library index, or None"""
+        if self.library_index is None:
+            return None
+        plex_track, tier = self.library_index.tiered_match(title, artist, duration_ms)
+        if tier:
+            self.count(tier)
+        return plex_track
+
+    def search_artists(self, library_section, artist):
+        """Look up artists in the library index, falling back to a Plex search"""
+        if self.library_index is not None:
+            return self.library_index.search_artists(artist)
+        return library_section.searchArtists(title=artist)
+
+    def search_tracks(self, library_section, title):
+        """Look up tracks by title in the library index, falling back to a Plex search"""
+        if self.library_index is not None:
+            return self.library_index.search_tracks(title)
+        return library_section.searchTracks(title=title)
+
+    def plex_artist(self, plex_track):
+        """Artist name of a Plex track; grandparentTitle avoids the artist() request where the listing has it"""
+        artist_name = plex_track.originalTitle or getattr(plex_track, 'grandparentTitle', None)
+        if not artist_name and hasattr(plex_track, 'artist'):
+            artist_obj = plex_track.artist()
+            artist_name = artist_obj.title if artist_obj else None
+        return artist_name
+
+    def plex_key(self, plex_track):
+        """Cleaned, lowercased (title, artist or None) of a Plex track, computed once per track"""
+        cache_key = (plex_track.ratingKey, plex_track.title)
+        key = self.plex_keys.get(cache_key)
+        if key is None:
+            title = clean_track_title(plex_track.title).lower() if plex_track.title else ""
+            try:
+                artist_name = self.plex_artist(plex_track)
+            except Exception as e:
+                logging.warning(f"Error reading artist for '{plex_track.title}': {str(e)}")
+                artist_name = None
+            key = self.plex_keys[cache_key] = (title, clean_artist_name(artist_name).lower() if artist_name else None)
+        return key
+
+    def section_affinity(self, plex_track):
+        """SECTION_AFFINITY_BONUS for a track in the selected section when matching spans several"""
+        if len(self.section_ids) < 2:
+            return 0.0
+        return SECTION_AFFINITY_BONUS if str(getattr(plex_track, 'librarySectionID', None)) == self.section_ids[0] else 0.0
+
+    def candidates(self, library_section, title, artist, strategy):
+        """Tracks by the top artist matches whose title fits; a library-wide title search only if the strategy allows it"""
+        all_tracks = []
+        if artist and artist.strip():
+            try:
+                for artist_obj in self.search_artists(library_section, artist)[:3]:
+                    try:
+                        artist_tracks = candidate_tracks(library_section, title, artist_obj)
+                        all_tracks.extend(track for track in artist_tracks if fuzzy_title_match(title, track.title))
+                    except Exception as e:
+                        logging.warning(f"Error searching tracks for artist '{artist_obj.title}': {e}")
+            except Exception as e:
+                logging.warning(f"Artist search failed for '{artist}': {e}")
+        
+        if not all_tracks and strategy.title_search_fallback:
+            log_library_wide_search(title, artist or "Unknown", f"{strategy.name} - title search")
+            all_tracks = self.search_tracks(library_section, title)
+            if len(all_tracks) > 100:
+                logging.debug(f"Too many search results ({len(all_tracks)}) for '{title}', limiting to first 100")
+                all_tracks = all_tracks[:100]
+        
+        seen = set()
+        unique_tracks = []
+        for track in all_tracks:
+            if track.ratingKey not in seen:
+                seen.add(track.ratingKey)
+                unique_tracks.append(track)
+        return unique_tracks
+
+    def score_candidates(self, strategy, title, artist, album, candidates, playlist_name=''):
+        """Score candidates under a strategy.
+
+        Returns the acceptable (track, final score, combined score) triples plus the best
+        scoring track and its score, acceptable or not.
+        """
+        best_match = None
+        best_score = 0
+        acceptable_matches = []
+        for plex_track in candidates:
+            scored = strategy.score(self, title, artist, album, plex_track, playlist_name)
+            if scored is None:
+                continue
+            final_score, combined_score = scored
+            final_score += self.section_affinity(plex_track)
+            if strategy.accepts(title, combined_score):
+                acceptable_matches.append((plex_track, final_score, combined_score))
+            if final_score > best_score:
+                best_score = final_score
+                best_match = plex_track
+        return acceptable_matches, best_match, best_score
+
+    def find_best_match(self, library_section, title, artist, strategy, album='', duration_ms=None):
+        """Exact/near-exact hit, else the best acceptable track from a fuzzy search, or None - no memo"""
+        plex_track = self.quick_match(title, artist, duration_ms)
+        if plex_track is not None:
+            return plex_track
+        if len(title.strip()) < 3:
+            logging.debug(f"Skipping search for very short title: '{title}'")
+            self.count('miss')
+            return None
+        candidates = self.candidates(library_section, title, artist, strategy)
+        acceptable_matches, _, _ = self.score_candidates(strategy, title, artist, album, candidates)
+        if not acceptable_matches:
+            self.count('miss')
+            return None
+        self.count('fuzzy')
+        return max(acceptable_matches, key=lambda match: match[1])[0]
+
+    def match(self, library_section, track, title, artist, strategy, album=''):
+        """Memo, then the exact/near tiers, then a fuzzy search; new matches are memoized"""
+        plex_track = self.lookup(track)
+        if plex_track is None:
+            duration_ms = track.get('duration_ms') if isinstance(track, dict) else None
+            plex_track = self.find_best_match(library_section, title, artist, strategy, album, duration_ms)
+            if plex_track:
+                self.remember(track, plex_track)
+        return plex_track
+
+    def assign(self, strategy, sources, plex_tracks):
+        """Give each (source track, title, artist) at most one of plex_tracks, over the whole list at once.
+
+        Returns {source index: (plex index, score)} and every source's candidate list.
+        """
+        # Tracks matched on an earlier run keep their Plex track without being scored again
+        positions_by_key = {}
+        for j, plex_track in enumerate(plex_tracks):
+            positions_by_key.setdefault(plex_track.ratingKey, []).append(j)
+        
+        assignment = {}
+        taken = set()
+        for i, (track, _, _) in enumerate(sources):
+            rating_key = self.match_memo.lookup(self.server_id, track)
+            for j in positions_by_key.get(rating_key, []):
+                if j not in taken:
+                    assignment[i] = (j, 100.0)
+                    taken.add(j)
+                    break
+        if assignment:
+            logging.info(f"Reused {len(assignment)} memoized matches")
+        
+        # Normalize each remaining side once, then score every pair in one batch
+        rows = [i for i in range(len(sources)) if i not in assignment]
+        columns = [j for j in range(len(plex_tracks)) if j not in taken]
+        scored = strategy.score_pairs(
+            [strategy.source_key(sources[i][1], sources[i][2]) for i in rows],
+            [self.plex_key(plex_tracks[j]) for j in columns]
+        )
+        
+        # Resolve competing matches over the whole playlist instead of first come, first served
+        candidates = [[] for _ in sources]
+        for row, i in enumerate(rows):
+            candidates[i] = [(columns[col], score) for col, score in scored[row]]
+        for row, (col, score) in assign_one_to_one(scored).items():
+            i, j = rows[row], columns[col]
+            assignment[i] = (j, score)
+            if score >= strategy.memo_threshold:
+                self.match_memo.remember(self.server_id, sources[i][0], plex_tracks[j])
+        
+        self.save()
+        return assignment, candidates
+
+
+MATCHING_ENGINES = {}
+MATCHING_ENGINES_LOCK = threading.Lock()
+
+def get_matching_engine(plex_server, section_id):
+    """Shared engine for a server and library section (section_id None for cross-section work).
+
+    The engine also searches the sections configured to be matched together with section_id.
+    """
+    server_id = getattr(plex_server, 'machineIdentifier', None)
+    section_ids = None if section_id is None else match_section_ids(plex_server, section_id)
+    key = (server_id, section_ids)
+    with MATCHING_ENGINES_LOCK:
+        engine = MATCHING_ENGINES.get(key)
+        if engine is None:
+            engine = MATCHING_ENGINES[key] = MatchingEngine(plex_server, section_id, section_ids)
+        else:
+            engine.plex_server = plex_server
+        return engine
+
+
+class LibraryIndexThread(QThread):
+    progress_update = pyqtSignal(str)
+    index_ready = pyqtSignal(str, int)  # section_id, track count
+    error = pyqtSignal(str)
+
+    def __init__(self, plex_server, section_id, parent=None):
+        super().__init__(parent)
+        self.plex_server = plex_server
+        self.section_id = str(section_id)
+
+    def run(self):
+        try:
+            self.progress_update.emit("📚 Loading library index...")
+            library_index = get_library_indexes(
+                self.plex_server, match_section_ids(self.plex_server, self.section_id),
+                progress_callback=self.report_progress
+            )
+            if self.isInterruptionRequested():
+                return
+            # Warm the trigram index so the first manual search doesn't pay for it
+            library_index.ensure_trigram_index()
+            self.index_ready.emit(self.section_id, len(library_index))
+        except InterruptedError:
+            logging.info("Library index build interrupted")
+        except Exception as e:
+            logging.error(f"Error building library index: {str(e)}")
+            self.error.emit(str(e))
+
+    def report_progress(self, done, total):
+        # Called between pages, so a build stops at the next page boundary once interrupted
+        if self.isInterruptionRequested():
+            raise InterruptedError("library index build interrupted")
+        self.progress_update.emit(f"📚 Indexing library: {done}/{total} tracks")
+
 class FetchPlaylistsThread(QThread):
     progress_update = pyqtSignal(str, int)  # message, percentage
     playlists_fetched = pyqtSignal(list)  # playlists list
@@ -254,6 +2610,10 @@ class FetchPlaylistsThread(QThread):
             self.progress_update.emit("Fetching playlist list...", 30)
             all_playlists = self.plex_server.playlists()
             
+            # The listing carries leafCount, duration and updatedAt, so every count is cached from this one call
+            self.progress_update.emit("Caching playlist summaries...", 40)
+            self.playlist_cache.set_playlist_summaries(all_playlists)
+            
             self.progress_update.emit("Filtering playlists...", 50)
             
             # Filter out massive/system playlists
@@ -307,8 +2667,10 @@ class LoadTrackCountThread(QThread):
             
             # Get track count for this specific playlist
             self.progress_update.emit("Counting tracks...", 50)
-            tracks = list(self.playlist.items())
-            track_count = len(tracks)
+            track_count = getattr(self.playlist, 'leafCount', None)
+            if track_count is None:
+                # Only download the items when the playlist metadata has no count
+                track_count = len(self.playlist.items())
             
             self.progress_update.emit("Caching results...", 75)
             # Cache the result - convert ratingKey to string
@@ -326,6 +2688,7 @@ class LoadTrackCountThread(QThread):
 
 class LoadPlaylistTracksThread(QThread):
     progress_update = pyqtSignal(int, int)  # current, total
+    page_loaded = pyqtSignal(list)  # tracks of the page just fetched
     tracks_loaded = pyqtSignal(list)  # tracks list
     error = pyqtSignal(str)
 
@@ -335,23 +2698,24 @@ class LoadPlaylistTracksThread(QThread):
 
     def run(self):
         try:
-            # Emit initial progress
-            self.progress_update.emit(0, 0)
-            
-            # Load tracks with progress tracking
-            tracks = list(self.playlist.items())
-            total_tracks = len(tracks)
+            # leafCount comes with the playlist, so the total is known before the first page
+            total_tracks = int(getattr(self.playlist, 'leafCount', 0) or 0)
+            self.progress_update.emit(0, total_tracks)
             
-            # Emit progress updates
-            for i, track in enumerate(tracks):
-                if i % 10 == 0:  # Update every 10 tracks
-                    self.progress_update.emit(i, total_tracks)
-                # Small delay to make progress visible and keep UI responsive
-                if i % 50 == 0:
-                    self.msleep(10)
-            
-            # Final progress update
-            self.progress_update.emit(total_tracks, total_tracks)
+            # Fetch the playlist a page at a time so rows can be shown as they arrive
+            tracks = []
+            while not self.isInterruptionRequested():
+                page = list(self.playlist.fetchItems(f"{self.playlist.key}/items", container_start=len(tracks),
+                                                     container_size=PLAYLIST_PAGE_SIZE,
+                                                     maxresults=PLAYLIST_PAGE_SIZE))
+                if not page:
+                    break
+                tracks.extend(page)
+                total_tracks = max(total_tracks, len(tracks))
+                self.page_loaded.emit(page)
+                self.progress_update.emit(len(tracks), total_tracks)
+                if len(page) < PLAYLIST_PAGE_SIZE:
+                    break
             
             # Emit the complete tracks list
             self.tracks_loaded.emit(tracks)
@@ -437,15 +2801,24 @@ class BatchTrackCountThread(QThread):
 
     def run(self):
         try:
+            # Summary mode: the listed playlists already carry their counts
+            self.progress_update.emit("Caching playlist summaries...", 0)
+            self.playlist_cache.set_playlist_summaries([playlist for playlist, _ in self.playlists])
+            
+            # Only playlists without a count fall back to downloading their items
+            remaining = [(playlist, count) for playlist, count in self.playlists
+                         if not self.playlist_cache.is_cached(str(playlist.ratingKey))]
             total_playlists = len(self.playlists)
-            completed = 0
+            completed = total_playlists - len(remaining)
+            self.progress_update.emit(f"Loading track counts... ({completed}/{total_playlists})",
+                                      int((completed / total_playlists) * 100) if total_playlists else 100)
             
             # Process playlists in batches to avoid overwhelming the system
-            for i in range(0, total_playlists, self.max_concurrent):
+            for i in range(0, len(remaining), self.max_concurrent):
                 if self.stop_requested:
                     break
                     
-                batch = self.playlists[i:i + self.max_concurrent]
+                batch = remaining[i:i + self.max_concurrent]
                 threads = []
                 
                 # Start threads for this batch
@@ -873,10 +3246,13 @@ class PlaylistEditorDialog(QDialog):
         """Start loading tracks in background thread immediately"""
         self.loading_progress.setValue(10)
         self.loading_detail.setText("Connecting to Plex server...")
+        self.tracks = []
+        self.tracks_table.setRowCount(0)
         
         # Start background thread immediately
         self.load_tracks_thread = LoadPlaylistTracksThread(self.playlist, self)
         self.load_tracks_thread.progress_update.connect(self.update_loading_progress)
+        self.load_tracks_thread.page_loaded.connect(self.on_page_loaded)
         self.load_tracks_thread.tracks_loaded.connect(self.on_tracks_loaded)
         self.load_tracks_thread.error.connect(self.on_tracks_error)
         self.load_tracks_thread.start()
@@ -887,76 +3263,68 @@ class PlaylistEditorDialog(QDialog):
             percentage = int((current / total) * 90) + 10  # 10-100 range
             self.loading_progress.setValue(percentage)
             self.loading_detail.setText(f"Loading track {current} of {total}...")
+            if not self.editor_section.isHidden() and current < total:
+                self.track_count_label.setText(f"⏳ Tracks: {current} of {total} loaded...")
         else:
             # Indeterminate progress
             self.loading_progress.setValue(50)
             self.loading_detail.setText("Loading playlist data...")
-        
-        # Keep UI responsive
-        QApplication.processEvents()
     
-    def on_tracks_loaded(self, tracks):
-        """Handle tracks loaded from background thread with smooth transition"""
+    def on_page_loaded(self, tracks):
+        """Append a page of tracks; the editor opens as soon as the first page is in"""
         try:
-            self.loading_progress.setValue(90)
-            self.loading_detail.setText("Processing tracks...")
-            QApplication.processEvents()
-            
-            self.tracks = tracks
+            self.tracks.extend(tracks)
             self.populate_tracks_table(tracks)
-            
-            # Smooth transition to editor
-            self.loading_progress.setValue(100)
-            self.loading_detail.setText("Ready!")
-            QApplication.processEvents()
-            
-            # Small delay for visual feedback, then switch views
-            QTimer.singleShot(300, self.show_editor)
-                
+            if self.editor_section.isHidden():
+                self.loading_section.setVisible(False)
+                self.editor_section.setVisible(True)
         except Exception as e:
             logging.error(f"Error processing loaded tracks: {str(e)}")
             self.on_tracks_error(str(e))
     
-    def populate_tracks_table(self, tracks):
-        """Populate tracks table efficiently with row numbers"""
-        self.tracks_table.setRowCount(len(tracks))
-        self.track_count_label.setText(f"🎵 Tracks: {len(tracks)}")
-        
-        # Batch processing for better performance
-        batch_size = 50
-        for i in range(0, len(tracks), batch_size):
-            batch = tracks[i:i + batch_size]
-            for j, track in enumerate(batch):
-                row = i + j
-                
-                # Create items for each column
-                title_item = QTableWidgetItem(track.title or "Unknown")
-                artist = track.originalTitle or (track.artist().title if hasattr(track, 'artist') and track.artist() else "Unknown")
-                artist_item = QTableWidgetItem(artist)
-                album = track.album().title if hasattr(track, 'album') and track.album() else "Unknown"
-                album_item = QTableWidgetItem(album)
-                duration = f"{track.duration // 60000}:{(track.duration % 60000) // 1000:02d}" if track.duration else "Unknown"
-                duration_item = QTableWidgetItem(duration)
-                
-                # Make all items read-only
-                title_item.setFlags(title_item.flags() & ~Qt.ItemIsEditable)
-                artist_item.setFlags(artist_item.flags() & ~Qt.ItemIsEditable)
-                album_item.setFlags(album_item.flags() & ~Qt.ItemIsEditable)
-                duration_item.setFlags(duration_item.flags() & ~Qt.ItemIsEditable)
-                
-                # Set items in table
-                self.tracks_table.setItem(row, 0, title_item)
-                self.tracks_table.setItem(row, 1, artist_item)
-                self.tracks_table.setItem(row, 2, album_item)
-                self.tracks_table.setItem(row, 3, duration_item)
-                
-                # Store track object for later use (in the title column)
-                self.tracks_table.item(row, 0).setData(Qt.UserRole, track)
-            
-            # Update progress during batch processing
-            progress = int(((i + len(batch)) / len(tracks)) * 10) + 90  # 90-100 range
-            self.loading_progress.setValue(progress)
-            QApplication.processEvents()  # Keep UI responsive during processing
+    def on_tracks_loaded(self, tracks):
+        """Enable editing once every page is in the table"""
+        self.loading_progress.setValue(100)
+        self.loading_detail.setText("Ready!")
+        self.track_count_label.setText(f"🎵 Tracks: {self.tracks_table.rowCount()}")
+        self.show_editor()
+    
+    def populate_tracks_table(self, tracks):
+        """Append tracks to the table, using the titles that come with each playlist item"""
+        first_row = self.tracks_table.rowCount()
+        self.tracks_table.setRowCount(first_row + len(tracks))
+        search_text = self.search_input.text().lower().strip()
+        
+        for j, track in enumerate(tracks):
+            row = first_row + j
+            
+            # Create items for each column
+            title_item = QTableWidgetItem(track.title or "Unknown")
+            artist = track.originalTitle or getattr(track, 'grandparentTitle', None) or "Unknown"
+            artist_item = QTableWidgetItem(artist)
+            album = getattr(track, 'parentTitle', None) or "Unknown"
+            album_item = QTableWidgetItem(album)
+            duration = f"{track.duration // 60000}:{(track.duration % 60000) // 1000:02d}" if track.duration else "Unknown"
+            duration_item = QTableWidgetItem(duration)
+            
+            # Make all items read-only
+            title_item.setFlags(title_item.flags() & ~Qt.ItemIsEditable)
+            artist_item.setFlags(artist_item.flags() & ~Qt.ItemIsEditable)
+            album_item.setFlags(album_item.flags() & ~Qt.ItemIsEditable)
+            duration_item.setFlags(duration_item.flags() & ~Qt.ItemIsEditable)
+            
+            # Set items in table
+            self.tracks_table.setItem(row, 0, title_item)
+            self.tracks_table.setItem(row, 1, artist_item)
+            self.tracks_table.setItem(row, 2, album_item)
+            self.tracks_table.setItem(row, 3, duration_item)
+            
+            # Store track object for later use (in the title column)
+            self.tracks_table.item(row, 0).setData(Qt.UserRole, track)
+            
+            # Rows that arrive while a search is active follow the current filter
+            if search_text and not any(search_text in value.lower() for value in (track.title or "", artist, album)):
+                self.tracks_table.setRowHidden(row, True)
     
     def show_editor(self):
         """Show the editor interface with smooth transition"""
@@ -1148,6 +3516,8 @@ class PlaylistEditorDialog(QDialog):
         """)
         self.loading_label.setText("❌ Error Loading Tracks")
         self.loading_detail.setText(f"Error: {error_message}")
+        self.editor_section.setVisible(False)
+        self.loading_section.setVisible(True)
         
         # Show retry option
         retry_button = QPushButton("🔄 Retry Loading")
@@ -1237,11 +3607,12 @@ class PlaylistEditorDialog(QDialog):
                 item = self.tracks_table.item(row, 0)  # Title column now
                 if item and item.data(Qt.UserRole):
                     tracks.append(item.data(Qt.UserRole))
-                    
-            if tracks:
-                # Update playlist with new track order
-                self.playlist.removeItems(self.playlist.items())
-                self.playlist.addItems(tracks)
+            
+            # Only deleted and moved items are sent to Plex; the rest keep their playlist item IDs
+            removed, moves = plan_playlist_moves([track.playlistItemID for track in self.tracks],
+                                                 [track.playlistItemID for track in tracks])
+            apply_playlist_moves(self.playlist, removed, moves)
+            logging.info(f"Saved '{self.playlist.title}': {len(removed)} removed, {len(moves)} moved")
                 
             QMessageBox.information(self, "Success", "🎉 Playlist updated successfully!")
             self.accept()
@@ -1256,8 +3627,9 @@ class PlaylistEditorDialog(QDialog):
     def closeEvent(self, event):
         """Handle dialog close event"""
         if self.load_tracks_thread and self.load_tracks_thread.isRunning():
-            self.load_tracks_thread.terminate()
-            self.load_tracks_thread.wait(1000)
+            self.load_tracks_thread.requestInterruption()
+            if not self.load_tracks_thread.wait(1000):
+                self.load_tracks_thread.terminate()
         event.accept()
 
 class PlaylistMergerDialog(QDialog):
@@ -1428,6 +3800,8 @@ class SyncThread(QThread):
         self.deezer_client = deezer.Client()
         self.tidal_client = TidalClient()
         self.stop_requested = False
+        self.strategy = MatchStrategy()
+        self.match_memo = get_match_memo()
 
     def run(self):
         try:
@@ -1442,6 +3816,8 @@ class SyncThread(QThread):
         except Exception as e:
             logging.error(f"Error in sync thread: {str(e)}")
             self.error.emit(str(e))
+        finally:
+            self.match_memo.save_memo()
 
     def sync_playlist(self, playlist_name, config):
         try:
@@ -1458,9 +3834,12 @@ class SyncThread(QThread):
                 
             # Get current tracks in Plex playlist
             plex_tracks = set()
+            playlist_keys = set()
             for track in plex_playlist.items():
-                signature = f"{track.title}_{track.originalTitle or (track.artist().title if hasattr(track, 'artist') and track.artist() else '')}"
+                # Same "Title - Artist" shape as the source tracks so the signatures can actually match
+                signature = f"{track.title} - {track.originalTitle or track.grandparentTitle or ''}"
                 plex_tracks.add(signature.lower())
+                playlist_keys.add(track.ratingKey)
                 
             # Get source tracks
             source_tracks = []
@@ -1479,21 +3858,31 @@ class SyncThread(QThread):
             missing_tracks = []
             library_section = self.plex_server.library.sectionByID(config.get('library_section'))
             
+            # Bring the local library index up to date so new library additions can be matched
+            engine = get_matching_engine(self.plex_server, library_section.key)
+            engine.load_index(refresh=True)
+            tier_hits_before = Counter(engine.tier_hits)
+            
             for i, track_info in enumerate(source_tracks):
                 if self.stop_requested:
                     break
                     
-                track_signature = track_info.lower()
+                track_signature = track_info['display'].lower() if isinstance(track_info, dict) else track_info.lower()
                 if track_signature not in plex_tracks:
-                    # Try to find track in Plex library
-                    plex_track = self.find_best_match(library_section, track_info)
-                    if plex_track:
+                    # Memo, exact and fuzzy matching are shared with import, sort and merge
+                    title, artist = self.parse_track_info(track_info)
+                    plex_track = engine.match(library_section, track_info, title, artist, self.strategy)
+                    if plex_track and plex_track.ratingKey not in playlist_keys:
                         missing_tracks.append(plex_track)
+                        playlist_keys.add(plex_track.ratingKey)
                         
                 progress = int((i + 1) / len(source_tracks) * 100)
                 self.progress_update.emit(f"Checking {playlist_name}... ({i+1}/{len(source_tracks)})", progress)
                 
+            logging.info(f"Match tiers for '{playlist_name}': {engine.tier_summary(tier_hits_before)}")
+            
             # Add missing tracks to playlist
+            missing_tracks = resolve_indexed_tracks(self.plex_server, missing_tracks)
             if missing_tracks:
                 plex_playlist.addItems(missing_tracks)
                 
@@ -1526,7 +3915,7 @@ class SyncThread(QThread):
                     if item['track']:
                         track = item['track']
                         artist_name = track['artists'][0]['name'] if track['artists'] else 'Unknown Artist'
-                        tracks.append(f"{track['name']} - {artist_name}")
+                        tracks.append(source_track_record('spotify', track.get('id'), track['name'], artist_name))
                 
                 tracks_url = tracks_data.get('next')
                 
@@ -1541,7 +3930,7 @@ class SyncThread(QThread):
             playlist = self.deezer_client.get_playlist(playlist_id)
             tracks = []
             for track in playlist.tracks:
-                tracks.append(f"{track.title} - {track.artist.name}")
+                tracks.append(source_track_record('deezer', track.id, track.title, track.artist.name))
             return tracks
         except Exception as e:
             logging.error(f"Error getting Deezer tracks: {str(e)}")
@@ -1553,7 +3942,7 @@ class SyncThread(QThread):
             tracks_data = self.tidal_client.get_playlist_tracks(playlist_uuid)
             tracks = []
             for item in tracks_data['items']:
-                tracks.append(f"{item['title']} - {item['artist']['name']}")
+                tracks.append(source_track_record('tidal', item.get('id'), item['title'], item['artist']['name']))
             return tracks
         except Exception as e:
             logging.error(f"Error getting Tidal tracks: {str(e)}")
@@ -1638,108 +4027,21 @@ class SyncThread(QThread):
             logging.warning(f"Error parsing file path {file_path}: {str(e)}")
             return os.path.splitext(os.path.basename(file_path))[0]
 
-    def find_best_match(self, library_section, track):
+    def find_best_match(self, library_section, track, engine=None):
         try:
             title, artist = self.parse_track_info(track)
-            
-            # Skip very short titles that would cause excessive matches
-            if len(title.strip()) < 3:
-                logging.debug(f"Skipping search for very short title: '{title}'")
-                return None
-            
-            all_tracks = []
-            
-            # Try artist-first search if we have artist info (more efficient)
-            if artist and artist.strip():
-                try:
-                    logging.debug(f"Manual search: Trying artist-first search for '{artist}'")
-                    artist_results = library_section.searchArtists(title=artist)
-                    
-                    if artist_results:
-                        # Found artist(s), search within their tracks
-                        for artist_obj in artist_results[:3]:  # Check top 3 artist matches
-                            try:
-                                artist_tracks = artist_obj.tracks()
-                                logging.debug(f"Manual search: Found {len(artist_tracks)} tracks by '{artist_obj.title}'")
-                                
-                                # Search for title within this artist's tracks
-                                for track_obj in artist_tracks:
-                                    if title.lower() in track_obj.title.lower():
-                                        all_tracks.append(track_obj)
-                                        
-                            except Exception as e:
-                                logging.warning(f"Manual search: Error searching tracks for artist '{artist_obj.title}': {e}")
-                                
-                except Exception as e:
-                    logging.warning(f"Manual search: Artist search failed for '{artist}': {e}")
-            
-            # If artist search didn't yield results or no artist provided, fall back to title search
-            if not all_tracks:
-                # Log this library-wide search
-                self.log_library_wide_search(title, artist or "Unknown", "Manual search dialog - title search")
-                
-                # Limit search results for performance
-                all_tracks = library_section.searchTracks(title=title)
-                if len(all_tracks) > 100:
-                    logging.debug(f"Too many search results ({len(all_tracks)}) for '{title}', limiting to first 100")
-                    all_tracks = all_tracks[:100]
-            
-            best_match = None
-            best_score = 0
-            acceptable_matches = []
-            
-            for plex_track in all_tracks:
-                plex_title = plex_track.title if plex_track.title else ""
-                
-                # Debug: Log the exact track details
-                logging.debug(f"Plex track found: ID={plex_track.ratingKey}, Title='{plex_title}', Artist='{plex_track.originalTitle or (plex_track.artist().title if plex_track.artist() else 'Unknown')}'")
-                
-                # Apply version filtering before scoring
-                if not self.is_acceptable_version_match(title, plex_title):
-                    logging.debug(f"Skipping version mismatch: '{title}' vs '{plex_title}'")
-                    continue
-                
-                title_score = fuzz.token_set_ratio(title.lower(), plex_title.lower())
-                
-                artist_score = 0
-                plex_artist = ""
-                if artist and plex_track.originalTitle:
-                    plex_artist = plex_track.originalTitle
-                    artist_score = fuzz.token_set_ratio(artist.lower(), plex_artist.lower())
-                elif plex_track.artist():
-                    plex_artist = plex_track.artist().title
-                    artist_score = fuzz.token_set_ratio(artist.lower(), plex_artist.lower())
-                
-                # Apply minimum artist score requirement to prevent wrong artist matches
-                if artist and artist_score < 50:  # Minimum 50% artist similarity required
-                    logging.debug(f"Skipping due to low artist match: '{artist}' vs '{plex_artist}' (score: {artist_score})")
-                    continue
-                
-                combined_score = (title_score * 0.7) + (artist_score * 0.3)
-                
-                # Apply preference bonus for remastered versions
-                preference_bonus = self.get_version_preference_bonus(plex_title)
-                final_score = combined_score + preference_bonus
-                
-                if combined_score >= 70:  # Must meet base threshold
-                    acceptable_matches.append((plex_track, final_score, combined_score))
-                
-                if final_score > best_score:
-                    best_score = final_score
-                    best_match = plex_track
-            
-            # Return best match if we found acceptable ones
-            if acceptable_matches:
-                return best_match
-            else:
-                return None
-                
+            if engine is None:
+                engine = get_matching_engine(self.plex_server, library_section.key)
+            return engine.find_best_match(library_section, title, artist, self.strategy)
         except Exception as e:
             logging.error(f"Error finding match for track: {str(e)}")
             return None
 
     def parse_track_info(self, track):
         """Legacy method - now just calls the smart parser"""
+        if isinstance(track, dict):
+            return track['title'], track['artist']
+        
         parsed = self.parse_track_info_smart(track)
         
         # Return title, artist tuple for compatibility
@@ -1754,7 +4056,7 @@ class SyncThread(QThread):
 
 class PlaylistSortingThread(QThread):
     progress_update = pyqtSignal(str, int)
-    sorting_complete = pyqtSignal(str, int, int)  # playlist_name, matched_count, total_count
+    sorting_complete = pyqtSignal(str, int, int, int)  # playlist_name, matched_count, total_count, move_count
     error = pyqtSignal(str)
 
     def __init__(self, playlist, streaming_url, plex_server, parent=None):
@@ -1762,6 +4064,7 @@ class PlaylistSortingThread(QThread):
         self.playlist = playlist
         self.streaming_url = streaming_url
         self.plex_server = plex_server
+        self.strategy = SortMatchStrategy()
 
     def run(self):
         try:
@@ -1790,12 +4093,12 @@ class PlaylistSortingThread(QThread):
             
             self.progress_update.emit("Reordering playlist...", 80)
             
-            # Clear and rebuild playlist in new order
-            self.playlist.removeItems(self.playlist.items())
-            self.playlist.addItems(ordered_tracks)
+            # Move only what is out of order - the playlist never empties and unmatched tracks stay
+            move_count = self.reorder_playlist(plex_tracks, ordered_tracks)
+            logging.info(f"Sorted '{self.playlist.title}' with {move_count} moves for {len(plex_tracks)} items")
             
             self.progress_update.emit("Complete!", 100)
-            self.sorting_complete.emit(self.playlist.title, len(ordered_tracks), len(streaming_tracks))
+            self.sorting_complete.emit(self.playlist.title, len(ordered_tracks), len(streaming_tracks), move_count)
             
         except Exception as e:
             logging.error(f"Error in playlist sorting: {str(e)}")
@@ -1844,7 +4147,7 @@ class PlaylistSortingThread(QThread):
                     if item['track']:
                         track = item['track']
                         artist_name = track['artists'][0]['name'] if track['artists'] else 'Unknown Artist'
-                        tracks.append(f"{track['name']} - {artist_name}")
+                        tracks.append(source_track_record('spotify', track.get('id'), track['name'], artist_name))
                 
                 tracks_url = tracks_data.get('next')
                 
@@ -1853,313 +4156,68 @@ class PlaylistSortingThread(QThread):
             logging.error(f"Error getting Spotify tracks: {str(e)}")
             return []
 
+    def reorder_playlist(self, plex_tracks, ordered_tracks):
+        """Put matched tracks in streaming order within their current slots; returns the move count"""
+        original_ids = [track.playlistItemID for track in plex_tracks]
+        sorted_ids = [track.playlistItemID for track in ordered_tracks]
+        matched = set(sorted_ids)
+        # Unmatched tracks keep their positions, matched slots are refilled in streaming order
+        next_sorted = iter(sorted_ids)
+        target_ids = [next(next_sorted) if item_id in matched else item_id for item_id in original_ids]
+        _, moves = plan_playlist_moves(original_ids, target_ids)
+        apply_playlist_moves(self.playlist, [], moves)
+        return len(moves)
+
     def match_and_order_tracks(self, streaming_tracks, plex_tracks):
         """Match streaming tracks to Plex tracks and return in streaming order"""
         try:
-            ordered_tracks = []
+            assignment, candidates = self.match_tracks(streaming_tracks, plex_tracks)
             
-            for streaming_track in streaming_tracks:
-                # Parse and clean streaming track info
-                if ' - ' in streaming_track:
-                    title, artist = streaming_track.split(' - ', 1)
-                else:
-                    title, artist = streaming_track, ''
-                
-                # ENHANCED: Clean the title to improve matching
-                clean_title = self.clean_track_title(title)
-                
-                # Find best match in Plex tracks
-                best_match = None
-                best_score = 0
-                
-                for plex_track in plex_tracks:
-                    try:
-                        # Clean Plex track title too
-                        clean_plex_title = self.clean_track_title(plex_track.title) if plex_track.title else ""
-                        
-                        # Calculate similarity with cleaned titles
-                        from fuzzywuzzy import fuzz
-                        
-                        # Try multiple matching approaches
-                        title_score = max(
-                            fuzz.ratio(clean_title.lower(), clean_plex_title.lower()),
-                            fuzz.partial_ratio(clean_title.lower(), clean_plex_title.lower()),
-                            fuzz.token_set_ratio(clean_title.lower(), clean_plex_title.lower())
-                        )
-                        
-                        artist_score = 0
-                        if artist:
-                            clean_artist = self.clean_artist_name(artist)
-                            if plex_track.originalTitle:
-                                plex_artist = self.clean_artist_name(plex_track.originalTitle)
-                                artist_score = fuzz.token_set_ratio(clean_artist.lower(), plex_artist.lower())
-                            elif hasattr(plex_track, 'artist') and plex_track.artist():
-                                plex_artist = self.clean_artist_name(plex_track.artist().title)
-                                artist_score = fuzz.token_set_ratio(clean_artist.lower(), plex_artist.lower())
-                        
-                        # Adjust weights - if no artist info, rely more on title
-                        if artist:
-                            combined_score = (title_score * 0.7) + (artist_score * 0.3)
-                        else:
-                            combined_score = title_score  # Pure title matching
-                        
-                        # LOWERED threshold and added logging for debugging
-                        if combined_score > best_score and combined_score > 60:  # Was 70, now 60
-                            best_score = combined_score
-                            best_match = plex_track
-                            
-                    except Exception as e:
-                        logging.warning(f"Error matching track: {str(e)}")
-                        continue
-                
-                if best_match and best_match not in ordered_tracks:
-                    ordered_tracks.append(best_match)
-                    logging.info(f"✅ Matched '{streaming_track}' to '{best_match.title}' (score: {best_score:.1f})")
+            ordered_tracks = []
+            for i, streaming_track in enumerate(streaming_tracks):
+                display = streaming_track['display'] if isinstance(streaming_track, dict) else streaming_track
+                if i in assignment:
+                    j, score = assignment[i]
+                    ordered_tracks.append(plex_tracks[j])
+                    logging.info(f"✅ Matched '{display}' to '{plex_tracks[j].title}' (score: {score:.1f})")
+                elif candidates[i]:
+                    best_score = max(score for _, score in candidates[i])
+                    logging.warning(f"❌ No free match for '{display}' - its candidates went to better matches (best score: {best_score:.1f})")
                 else:
-                    logging.warning(f"❌ No match for '{streaming_track}' (best score: {best_score:.1f})")
+                    logging.warning(f"❌ No match for '{display}'")
             
             return ordered_tracks
             
         except Exception as e:
             logging.error(f"Error matching tracks: {str(e)}")
             return []
-    
-    def is_acceptable_version_match(self, source_title, plex_title):
-        """
-        Check if a Plex track version is acceptable for matching against a source track.
-        Filters out unwanted versions like live recordings, remixes, etc.
-        """
-        import re
-        
-        # Normalize titles for comparison
-        source_lower = source_title.lower().strip()
-        plex_lower = plex_title.lower().strip()
-        
-        # Extract content in parentheses and brackets from both titles
-        source_extras = self.extract_version_info(source_title)
-        plex_extras = self.extract_version_info(plex_title)
-        
-        # If source has no version info, be strict about Plex versions
-        if not source_extras:
-            # Allowed version types even when source has no version info
-            allowed_when_source_clean = [
-                'remaster', 'remastered', 'remastered version', 'remastered edition',
-                'stereo', 'mono', 'original', 'album version', 'single version',
-                'explicit', 'clean', 'radio edit', 'radio version'
-            ]
-            
-            # Check if any Plex version info is problematic
-            for extra in plex_extras:
-                extra_clean = extra.lower().strip()
-                
-                # Check if it's an allowed type - if not, reject it
-                is_allowed = any(allowed in extra_clean for allowed in allowed_when_source_clean)
-                    
-                if not is_allowed:
-                    # Reject ANY version info that's not explicitly allowed
-                    logging.debug(f"Rejecting version: '{plex_title}' (contains '{extra}') for clean source: '{source_title}'")
-                    return False
-                
-                # Allow live versions - they'll get lower preference but still be available
-                # (Removed automatic rejection of live versions)
-                
-                    return False
-                
-                # Allow featuring/with variations (user requested)
-                # if any(feat_term in extra_clean for feat_term in ['feat', 'featuring', 'ft.', 'with']):
-                #     logging.debug(f"Rejecting featuring version: '{plex_title}' for clean source: '{source_title}'")
-                #     return False
-        
-        # If source has version info, match more permissively but still filter obvious mismatches
-        else:
-            # Check for major version type mismatches
-            source_has_live = any('live' in extra.lower() for extra in source_extras)
-            plex_has_live = any('live' in extra.lower() for extra in plex_extras)
-            
-            # Don't match live to non-live or vice versa
-            if source_has_live != plex_has_live:
-                logging.debug(f"Rejecting live/non-live mismatch: '{source_title}' vs '{plex_title}'")
-                return False
-            
-            # Check for remix/version compatibility using STRICT matching (85% similarity required)
-            from fuzzywuzzy import fuzz
-            
-            remix_terms = ['remix', 'mix', 'version', 'edit', 'extended', 'radio', 'club', 'dance', 'house', 'vocal', 'instrumental']
-            
-            source_remixes = [extra.lower() for extra in source_extras if any(term in extra.lower() for term in remix_terms)]
-            plex_remixes = [extra.lower() for extra in plex_extras if any(term in extra.lower() for term in remix_terms)]
-            
-            # If neither has remix info, they're compatible
-            if not source_remixes and not plex_remixes:
-                pass  # Compatible
-            # If only one has remix info, reject (strict matching for remixes)
-            elif bool(source_remixes) != bool(plex_remixes):
-                logging.debug(f"Remix mismatch: source has {source_remixes}, plex has {plex_remixes}")
-                return False
-            # Both have remix info - check similarity (require 85%)
-            elif source_remixes and plex_remixes:
-                best_similarity = 0
-                for source_remix in source_remixes:
-                    for plex_remix in plex_remixes:
-                        similarity = fuzz.ratio(source_remix, plex_remix)
-                        best_similarity = max(best_similarity, similarity)
-                        logging.debug(f"Comparing remix versions: '{source_remix}' vs '{plex_remix}' = {similarity}%")
-                
-                if best_similarity >= 85:
-                    logging.debug(f"Remix versions compatible: {best_similarity}% similarity")
-                else:
-                    logging.debug(f"Remix versions incompatible: only {best_similarity}% similarity (need 85%)")
-                    return False
-        
-        return True
-    
-    def extract_version_info(self, title):
-        """Extract version information from parentheses and brackets in track title"""
-        import re
-        
-        # Find all content in parentheses and brackets
-        patterns = [
-            r'\(([^)]+)\)',  # Content in parentheses
-            r'\[([^\]]+)\]'  # Content in brackets
-        ]
-        
-        extras = []
-        for pattern in patterns:
-            matches = re.findall(pattern, title)
-            extras.extend(matches)
-        
-        return extras
-    
-    def get_version_preference_bonus(self, title):
-        """
-        Give preference bonus to certain track versions.
-        Returns a small bonus score to prefer remastered versions.
+
+    def match_tracks(self, streaming_tracks, plex_tracks):
+        """Assign each streaming track at most one playlist item.
+
+        Returns {streaming index: (plex index, score)} and every streaming track's candidate list.
         """
-        title_lower = title.lower()
-        
-        # Check for penalties first (less preferred versions)
-        penalties = [
-            ('live', -5.0),         # Live versions get penalty but are still available
-            ('concert', -5.0),
-            ('tour', -5.0),
-            ('acoustic', -2.0),     # Acoustic versions get smaller penalty
-            ('demo', -3.0),         # Demo versions get penalty
-        ]
-        
-        penalty = 0.0
-        for keyword, penalty_value in penalties:
-            if keyword in title_lower:
-                penalty = min(penalty, penalty_value)  # Take largest applicable penalty
-        
-        # Preferred version keywords (bonuses)
-        preferred_versions = [
-            ('remaster', 3.0),      # Highest preference
-            ('remastered', 3.0),
-            ('remastered edition', 3.5),
-            ('remastered version', 3.5),
-            ('2021 remaster', 4.0), # Recent remasters get slight extra bonus
-            ('2020 remaster', 4.0),
-            ('2019 remaster', 4.0),
-            ('deluxe', 1.0),        # Lower preference
-            ('deluxe edition', 1.0),
-            ('expanded', 1.0),
-            ('anniversary', 2.0),   # Medium preference
-        ]
-        
-        bonus = 0.0
-        for keyword, bonus_value in preferred_versions:
-            if keyword in title_lower:
-                bonus = max(bonus, bonus_value)  # Take highest applicable bonus
-        
-        return bonus + penalty  # Combine bonus and penalty
+        # The playlist can span sections - the engine keyed by the first item's section shares its caches
+        section_id = getattr(plex_tracks[0], 'librarySectionID', None) if plex_tracks else None
+        engine = get_matching_engine(self.plex_server, section_id)
+        sources = [(track, *self.split_streaming_track(track)) for track in streaming_tracks]
+        return engine.assign(self.strategy, sources, plex_tracks)
+
+    def split_streaming_track(self, streaming_track):
+        """Title and artist of a streaming track record or "Title - Artist" string"""
+        if isinstance(streaming_track, dict):
+            return streaming_track['title'], streaming_track['artist']
+        if ' - ' in streaming_track:
+            return tuple(streaming_track.split(' - ', 1))
+        return streaming_track, ''
 
     def clean_track_title(self, title):
         """Clean track title for better matching"""
-        if not title:
-            return ""
-        
-        import re
-        
-        # Remove common additions that cause matching issues
-        cleaned = title
-        
-        # Remove feat/featuring variations (case insensitive)
-        feat_patterns = [
-            r'\(feat\.?\s+[^)]+\)',     # (feat. Artist)
-            r'\(ft\.?\s+[^)]+\)',      # (ft. Artist)
-            r'\(featuring\s+[^)]+\)',  # (featuring Artist)
-            r'\(with\s+[^)]+\)',       # (with Artist)
-            r'feat\.?\s+.+$',          # feat. Artist (at end)
-            r'ft\.?\s+.+$',            # ft. Artist (at end)
-            r'featuring\s+.+$',        # featuring Artist (at end)
-        ]
-        
-        for pattern in feat_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove extra whitespace and common suffixes
-        cleaned = re.sub(r'\s+', ' ', cleaned)  # Multiple spaces to single
-        cleaned = cleaned.strip(' -()[]')       # Trim common chars
-        
-        return cleaned
+        return clean_track_title(title)
     
     def clean_artist_name(self, artist):
         """Clean artist name for better matching - removes remaster info, years, and featured artists"""
-        if not artist:
-            return ""
-        
-        import re
-        
-        # Remove remaster information and years from artist field
-        # Patterns like "2015 Remaster - Van Halen" -> "Van Halen"
-        remaster_patterns = [
-            r'^\d{4}\s*remaster\s*-\s*',     # "2015 Remaster - " at start
-            r'^\d{4}\s*remastered\s*-\s*',   # "2015 Remastered - " at start
-            r'^\s*remaster\s*-\s*',          # "Remaster - " at start
-            r'^\s*remastered\s*-\s*',        # "Remastered - " at start
-            r'\s*-\s*\d{4}\s*remaster$',     # " - 2015 Remaster" at end
-            r'\s*-\s*\d{4}\s*remastered$',   # " - 2015 Remastered" at end
-            r'\s*-\s*remaster$',             # " - Remaster" at end
-            r'\s*-\s*remastered$',           # " - Remastered" at end
-        ]
-        
-        cleaned = artist
-        for pattern in remaster_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove version information in parentheses/brackets from artist field
-        version_patterns = [
-            r'\s*\([^)]*(?:remaster|remastered|remix|mix|edit|version|deluxe|anniversary|edition)[^)]*\)',
-            r'\s*\[[^\]]*(?:remaster|remastered|remix|mix|edit|version|deluxe|anniversary|edition)[^\]]*\]'
-        ]
-        
-        for pattern in version_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove "feat" mentions from artist field
-        feat_patterns = [
-            r'\s*feat\.?\s+.+$',      # feat. Artist (everything after)
-            r'\s*ft\.?\s+.+$',        # ft. Artist (everything after)
-            r'\s*featuring\s+.+$',    # featuring Artist (everything after)
-            r'\s*with\s+.+$',         # with Artist (everything after)
-            r',\s*feat\.?\s+.+$',     # , feat. Artist
-            r',\s*ft\.?\s+.+$',       # , ft. Artist
-            r',\s*featuring\s+.+$',   # , featuring Artist
-            r',\s*with\s+.+$',        # , with Artist
-        ]
-        
-        for pattern in feat_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Clean up extra spaces and punctuation
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        cleaned = cleaned.strip(' -,&()[]')
-        
-        # If we removed too much and left nothing meaningful, return original
-        if len(cleaned.strip()) < 1:
-            return artist
-            
-        return cleaned
+        return clean_artist_name(artist)
 
 class TimeoutException(Exception):
     pass
@@ -2551,10 +4609,11 @@ class TrackMatchConfirmationDialog(QDialog):
             super().keyPressEvent(event)
 
 class ManualSearchDialog(QDialog):
-    def __init__(self, source_track, library_section, parent=None):
+    def __init__(self, source_track, library_section, parent=None, library_index=None):
         super().__init__(parent)
         self.source_track = source_track
         self.library_section = library_section
+        self.library_index = library_index
         self.selected_track = None
         
         # Parse track info to get title and artist separately
@@ -2564,61 +4623,7 @@ class ManualSearchDialog(QDialog):
         
     def clean_artist_name(self, artist):
         """Clean artist name for better matching - removes remaster info, years, and featured artists"""
-        if not artist:
-            return ""
-        
-        import re
-        
-        # Remove remaster information and years from artist field
-        # Patterns like "2015 Remaster - Van Halen" -> "Van Halen"
-        remaster_patterns = [
-            r'^\d{4}\s*remaster\s*-\s*',     # "2015 Remaster - " at start
-            r'^\d{4}\s*remastered\s*-\s*',   # "2015 Remastered - " at start
-            r'^\s*remaster\s*-\s*',          # "Remaster - " at start
-            r'^\s*remastered\s*-\s*',        # "Remastered - " at start
-            r'\s*-\s*\d{4}\s*remaster$',     # " - 2015 Remaster" at end
-            r'\s*-\s*\d{4}\s*remastered$',   # " - 2015 Remastered" at end
-            r'\s*-\s*remaster$',             # " - Remaster" at end
-            r'\s*-\s*remastered$',           # " - Remastered" at end
-        ]
-        
-        cleaned = artist
-        for pattern in remaster_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove version information in parentheses/brackets from artist field
-        version_patterns = [
-            r'\s*\([^)]*(?:remaster|remastered|remix|mix|edit|version|deluxe|anniversary|edition)[^)]*\)',
-            r'\s*\[[^\]]*(?:remaster|remastered|remix|mix|edit|version|deluxe|anniversary|edition)[^\]]*\]'
-        ]
-        
-        for pattern in version_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove "feat" mentions from artist field
-        feat_patterns = [
-            r'\s*feat\.?\s+.+$',      # feat. Artist (everything after)
-            r'\s*ft\.?\s+.+$',        # ft. Artist (everything after)
-            r'\s*featuring\s+.+$',    # featuring Artist (everything after)
-            r'\s*with\s+.+$',         # with Artist (everything after)
-            r',\s*feat\.?\s+.+$',     # , feat. Artist
-            r',\s*ft\.?\s+.+$',       # , ft. Artist
-            r',\s*featuring\s+.+$',   # , featuring Artist
-            r',\s*with\s+.+$',        # , with Artist
-        ]
-        
-        for pattern in feat_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Clean up extra spaces and punctuation
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        cleaned = cleaned.strip(' -,&()[]')
-        
-        # If we removed too much and left nothing meaningful, return original
-        if len(cleaned.strip()) < 1:
-            return artist
-            
-        return cleaned
+        return clean_artist_name(artist)
         
     def parse_track_info(self, track):
         """Parse track string into title and artist - handles both string and dict formats"""
@@ -2646,168 +4651,15 @@ class ManualSearchDialog(QDialog):
     
     def log_library_wide_search(self, title, artist, reason):
         """Log tracks that cause library-wide searches to a separate file for easy identification"""
-        import datetime
-        
-        log_file = "library_wide_searches.log"
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        log_entry = f"[{timestamp}] LIBRARY-WIDE SEARCH: '{title}' by '{artist}' - Reason: {reason}\n"
-        
-        try:
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
-        except Exception as e:
-            logging.warning(f"Failed to write to library search log: {e}")
+        log_library_wide_search(title, artist, reason)
     
     def fuzzy_title_match(self, search_title, plex_title):
-        """
-        Fuzzy matching for titles to handle common variations like apostrophes, spacing, etc.
-        """
-        import re
-        
-        if not search_title or not plex_title:
-            return False
-        
-        # Normalize both titles for comparison
-        def normalize_title(title):
-            normalized = title.lower().strip()
-            # Remove/normalize apostrophes and quotes
-            normalized = re.sub(r"['`´'']", "", normalized)  # Remove various apostrophe types
-            # Normalize spacing around 'n' (and -> and, n -> n)
-            normalized = re.sub(r'\s+n\s+', ' n ', normalized)
-            # Remove extra whitespace
-            normalized = re.sub(r'\s+', ' ', normalized).strip()
-            return normalized
-        
-        search_normalized = normalize_title(search_title)
-        plex_normalized = normalize_title(plex_title)
-        
-        # Try exact match first
-        if search_normalized == plex_normalized:
-            return True
-        
-        # Try substring match
-        if search_normalized in plex_normalized or plex_normalized in search_normalized:
-            return True
-        
-        # Try fuzzy matching for very similar titles
-        try:
-            from fuzzywuzzy import fuzz
-            similarity = fuzz.ratio(search_normalized, plex_normalized)
-            return similarity >= 85  # High threshold for title matching within artist
-        except ImportError:
-            return False
+        """Fuzzy matching for titles to handle common variations like apostrophes, spacing, etc."""
+        return fuzzy_title_match(search_title, plex_title)
     
     def clean_title_for_search(self, title):
         """Clean title for search by removing both featured artists AND version information"""
-        import re
-        
-        if not title:
-            return ""
-        
-        cleaned = title
-        
-        # NEW: Remove dash and everything after it (until brackets)
-        # This handles titles like "Accidentally In Love - From "Shrek 2" Soundtrack"
-        # Remove "-" and everything after it, but stop at brackets/parentheses
-        dash_already_processed = False
-        if ' - ' in cleaned:
-            # Find the first dash with spaces
-            dash_index = cleaned.find(' - ')
-            if dash_index != -1:
-                # Check if there are brackets/parentheses after the dash
-                remaining_text = cleaned[dash_index:]
-                # Look for opening bracket/parenthesis
-                bracket_match = re.search(r'[()\[\]]', remaining_text)
-                if bracket_match:
-                    # Keep everything up to dash, then everything from the bracket onward
-                    before_dash = cleaned[:dash_index]
-                    bracket_start = dash_index + bracket_match.start()
-                    after_bracket = cleaned[bracket_start:]
-                    cleaned = before_dash + ' ' + after_bracket
-                    dash_already_processed = True  # Skip dash version patterns later
-                else:
-                    # No brackets found, remove everything after dash
-                    cleaned = cleaned[:dash_index]
-                    dash_already_processed = False
-        else:
-            dash_already_processed = False
-
-        # Remove version information in parentheses and brackets
-        version_patterns = [
-            r'\s*\([^)]*(?:remaster|remastered|remix|mix|edit|version|acoustic|live|unplugged|demo|deluxe|anniversary|edition|stereo|mono|explicit|clean|radio|single|album)[^)]*\)',
-            r'\s*\[[^\]]*(?:remaster|remastered|remix|mix|edit|version|acoustic|live|unplugged|demo|deluxe|anniversary|edition|stereo|mono|explicit|clean|radio|single|album)[^\]]*\]'
-        ]
-        
-        for pattern in version_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove semicolon-separated version info first (like "; 2017 Remaster")
-        semicolon_patterns = [
-            r'\s*;\s*(?:\d{4}\s+)?(?:remaster|remastered)(?:\s+\d{4})?.*$',
-            r'\s*;\s*(?:\d{4}\s+)?(?:remastered\s+)?(?:edition|version).*$',
-        ]
-        
-        for pattern in semicolon_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove version information that appears after dashes in the main title
-        # Patterns like "Song Title - Remastered", "Track Name - 2021 Remaster", etc.
-        # Skip if dash was already processed with bracket preservation
-        if not dash_already_processed:
-            dash_version_patterns = [
-                r'\s*-\s*(?:\d{4}\s+)?(?:remaster|remastered)(?:\s+\d{4})?.*$',  # - Remastered, - 2021 Remaster
-                r'\s*-\s*(?:\d{4}\s+)?(?:remastered\s+)?(?:edition|version).*$',  # - Edition, - Version, - 2021 Edition
-                r'\s*-\s*(?:deluxe|anniversary|special)\s*(?:edition|version)?.*$',  # - Deluxe, - Anniversary Edition
-                r'\s*-\s*(?:stereo|mono).*$',  # - Stereo, - Mono
-                r'\s*-\s*(?:explicit|clean).*$',  # - Explicit, - Clean
-                r'\s*-\s*(?:radio|single|album)\s*(?:edit|version)?.*$',  # - Radio Edit, - Single Version
-                r'\s*-\s*live(?:\s+at\s+[^-]*)?.*$',  # - Live, - Live at Venue
-                r'\s*-\s*acoustic.*$',  # - Acoustic
-                r'\s*-\s*unplugged.*$',  # - Unplugged
-                r'\s*-\s*demo.*$',  # - Demo
-            ]
-            
-            for pattern in dash_version_patterns:
-                cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-
-        # Remove featured artist information
-        feat_patterns = [
-            r'\s*\(feat\.?\s+[^)]+\)',      # (feat. Artist)
-            r'\s*\(featuring\s+[^)]+\)',    # (featuring Artist)
-            r'\s*\(ft\.?\s+[^)]+\)',       # (ft. Artist)
-            r'\s*\(with\s+[^)]+\)',        # (with Artist)
-            r'\s*\(f\.\s+[^)]+\)',         # (f. Artist)
-            r'\s*\[feat\.?\s+[^\]]+\]',     # [feat. Artist]
-            r'\s*\[featuring\s+[^\]]+\]',   # [featuring Artist]
-            r'\s*\[ft\.?\s+[^\]]+\]',      # [ft. Artist]
-            r'\s*\[with\s+[^\]]+\]',       # [with Artist]
-            r'\s+feat\.?\s+.*$',           # feat. Artist (everything after)
-            r'\s+featuring\s+.*$',         # featuring Artist (everything after)
-            r'\s+ft\.?\s+.*$',            # ft. Artist (everything after)
-            r'\s+with\s+.*$',             # with Artist (everything after)
-            r'\s+f\.\s+.*$',              # f. Artist (everything after)
-            r',\s*feat\.?\s+.*$',         # , feat. Artist
-            r',\s*featuring\s+.*$',       # , featuring Artist
-            r',\s*ft\.?\s+.*$',          # , ft. Artist
-            r',\s*with\s+.*$',           # , with Artist
-        ]
-        
-        for pattern in feat_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Clean up extra spaces and punctuation
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        cleaned = cleaned.rstrip(' -,&')
-        
-        # Don't remove closing parentheses/brackets that might be part of the song title
-        # Only remove unmatched opening brackets or obvious trailing punctuation
-        
-        # If we removed too much and left nothing meaningful, return original
-        if len(cleaned.strip()) < 2:
-            return title
-            
-        return cleaned
+        return clean_title_for_search(title)
         
     def setup_ui(self):
         # Create readable title from parsed track info
@@ -3052,13 +4904,13 @@ class ManualSearchDialog(QDialog):
                 # Search by artist first to narrow down results
                 try:
                     # Use Plex searchArtists API for better performance
-                    artists = self.library_section.searchArtists(title=artist_text)
+                    artists = self.search_artists(artist_text)
                     artist_tracks = []
                     
                     for artist in artists:
                         try:
-                            # Get tracks from this artist
-                            tracks = artist.tracks()
+                            # Get tracks from this artist - only the title candidates when there is a title
+                            tracks = candidate_tracks(self.library_section, search_text, artist)
                             
                             # If we also have a title filter, apply it
                             if search_text:
@@ -3102,7 +4954,12 @@ class ManualSearchDialog(QDialog):
                         self.status_label.setText(f"🔍 Continuing with library-wide search...")
                         logging.debug("User chose to continue with library-wide search...")
                         
-                        all_library_tracks = self.library_section.searchTracks()
+                        if self.library_index is not None:
+                            # Fuzzy candidates from the trigram index instead of pulling the whole library
+                            artist_tracks.extend(self.library_index.fuzzy_search(search_text, artist_text, limit=100))
+                            all_library_tracks = []
+                        else:
+                            all_library_tracks = self.library_section.searchTracks()
                         
                         for track in all_library_tracks:
                             track_artist = ""
@@ -3127,7 +4984,7 @@ class ManualSearchDialog(QDialog):
                 # For longer titles, do normal title searches
                 # 1. Title search with exact match
                 try:
-                    title_tracks = self.library_section.searchTracks(title=search_text)
+                    title_tracks = self.search_tracks(search_text)
                     all_tracks.extend(title_tracks)
                     logging.debug(f"Exact title search for '{search_text}' found {len(title_tracks)} tracks")
                 except Exception as e:
@@ -3140,7 +4997,7 @@ class ManualSearchDialog(QDialog):
                 # Search with cleaned text (this is the most important search)
                 if clean_search_text != search_text and clean_search_text.strip():
                     try:
-                        clean_tracks = self.library_section.searchTracks(title=clean_search_text)
+                        clean_tracks = self.search_tracks(clean_search_text)
                         all_tracks.extend(clean_tracks)
                         logging.debug(f"Clean title search for '{clean_search_text}' found {len(clean_tracks)} tracks")
                     except Exception as e:
@@ -3153,7 +5010,7 @@ class ManualSearchDialog(QDialog):
                 # Only use first 2 words to prevent too many results
                 for word in search_words[:2]:
                     try:
-                        word_tracks = self.library_section.searchTracks(title=word)
+                        word_tracks = self.search_tracks(word)
                         # Limit word search results to prevent overwhelming results
                         all_tracks.extend(word_tracks[:50])
                         logging.debug(f"Word title search for '{word}' found {len(word_tracks)} tracks (limited to 50)")
@@ -3161,7 +5018,10 @@ class ManualSearchDialog(QDialog):
                         logging.warning(f"Word title search for '{word}' failed: {e}")
             
             # 4. Try searching all tracks and filter manually (as fallback, but not for short titles)
-            if not has_artist_filter and not all_tracks:
+            if not has_artist_filter and not all_tracks and self.library_index is not None:
+                all_tracks = self.library_index.fuzzy_search(search_text, limit=100)
+                logging.debug(f"Trigram search found {len(all_tracks)} candidates for '{search_text}'")
+            elif not has_artist_filter and not all_tracks:
                 try:
                     # Get all tracks and filter manually
                     logging.debug("Trying manual search through all tracks...")
@@ -3299,6 +5159,18 @@ class ManualSearchDialog(QDialog):
             debug_item.setFlags(debug_item.flags() & ~Qt.ItemIsSelectable)
             self.results_list.addItem(debug_item)
             
+    def search_artists(self, artist_text):
+        """Look up artists in the library index, falling back to a Plex search"""
+        if self.library_index is not None:
+            return self.library_index.search_artists(artist_text)
+        return self.library_section.searchArtists(title=artist_text)
+
+    def search_tracks(self, title):
+        """Look up tracks by title in the library index, falling back to a Plex search"""
+        if self.library_index is not None:
+            return self.library_index.search_tracks(title)
+        return self.library_section.searchTracks(title=title)
+
     def on_selection_changed(self):
         """Enable/disable select button based on selection"""
         self.select_btn.setEnabled(len(self.results_list.selectedItems()) > 0)
@@ -3319,44 +5191,7 @@ class ManualSearchDialog(QDialog):
         
     def remove_featured_artists(self, title):
         """Remove featured artist information to focus search on main track title"""
-        import re
-        
-        # More comprehensive patterns for featured artists
-        patterns = [
-            # Parentheses patterns
-            r'\s*\(feat\.?\s+[^)]+\)',      # (feat. Artist) or (feat Artist)
-            r'\s*\(featuring\s+[^)]+\)',    # (featuring Artist)
-            r'\s*\(ft\.?\s+[^)]+\)',       # (ft. Artist) or (ft Artist)
-            r'\s*\(with\s+[^)]+\)',        # (with Artist)
-            r'\s*\(f\.\s+[^)]+\)',         # (f. Artist)
-            
-            # Square brackets patterns
-            r'\s*\[feat\.?\s+[^\]]+\]',     # [feat. Artist]
-            r'\s*\[featuring\s+[^\]]+\]',   # [featuring Artist]
-            r'\s*\[ft\.?\s+[^\]]+\]',      # [ft. Artist]
-            r'\s*\[with\s+[^\]]+\]',       # [with Artist]
-            
-            # Without brackets (more careful to avoid removing main content)
-            r'\s+feat\.?\s+[^-\(\[\n]+$',   # feat. Artist at end of line
-            r'\s+featuring\s+[^-\(\[\n]+$', # featuring Artist at end of line
-            r'\s+ft\.?\s+[^-\(\[\n]+$',    # ft. Artist at end of line
-            r'\s+with\s+[^-\(\[\n]+$',     # with Artist at end of line
-            r'\s+f\.\s+[^-\(\[\n]+$',      # f. Artist at end of line
-        ]
-        
-        cleaned_title = title
-        for pattern in patterns:
-            cleaned_title = re.sub(pattern, '', cleaned_title, flags=re.IGNORECASE)
-        
-        # Clean up extra spaces and punctuation
-        cleaned_title = re.sub(r'\s+', ' ', cleaned_title).strip()
-        cleaned_title = cleaned_title.rstrip(' -,&')
-        
-        # If we removed too much and left nothing meaningful, return original
-        if len(cleaned_title.strip()) < 2:
-            return title
-            
-        return cleaned_title
+        return remove_featured_artists(title)
     
     def show_artist_not_found_dialog(self, artist_name):
         """Show dialog when artist is not found, asking user whether to skip track or continue with library-wide search"""
@@ -3422,6 +5257,99 @@ class ManualSearchDialog(QDialog):
         self.search_input.setFocus()
         self.search_input.selectAll()
 
+class ReviewQueueDialog(QDialog):
+    """Resolve every uncertain track of an import in one table"""
+    REASONS = {
+        'low_confidence': "Low confidence",
+        'artist_not_found': "Artist not found",
+        'no_results': "No results",
+        'no_match': "No match"
+    }
+
+    def __init__(self, review_queue, library_section, parent=None, library_index=None):
+        super().__init__(parent)
+        self.review_queue = review_queue
+        self.library_section = library_section
+        self.library_index = library_index
+        self.setWindowTitle(f"Review Uncertain Matches ({len(review_queue)})")
+        self.setModal(True)
+        self.resize(1000, 600)
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        
+        layout.addWidget(QLabel("These tracks were not matched automatically. Pick a match for each track or leave it on Skip:"))
+        
+        self.table = QTableWidget(len(self.review_queue), 4)
+        self.table.setHorizontalHeaderLabels(["Source Track", "Reason", "Match", ""])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        self.table.setSelectionMode(QAbstractItemView.NoSelection)
+        self.table.verticalHeader().setVisible(False)
+        
+        for row, item in enumerate(self.review_queue):
+            self.table.setItem(row, 0, QTableWidgetItem(item['display']))
+            self.table.setItem(row, 1, QTableWidgetItem(self.REASONS.get(item['reason'], item['reason'])))
+            
+            combo = QComboBox()
+            combo.addItem("⏭️ Skip", None)
+            for plex_track, score in item['candidates']:
+                combo.addItem(f"{self.describe_track(plex_track)} ({score:.0f}%)", plex_track)
+            # Low-confidence tracks come with the matcher's proposal - preselect it
+            if item['reason'] == 'low_confidence' and item['candidates']:
+                combo.setCurrentIndex(1)
+            self.table.setCellWidget(row, 2, combo)
+            
+            search_button = QPushButton("🔍 Search")
+            search_button.clicked.connect(lambda checked, r=row: self.manual_search(r))
+            self.table.setCellWidget(row, 3, search_button)
+        
+        layout.addWidget(self.table)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        skip_all_button = QPushButton("Skip All")
+        skip_all_button.clicked.connect(self.skip_all)
+        button_layout.addWidget(skip_all_button)
+        button_layout.addStretch()
+        
+        self.apply_button = QPushButton("✅ Add Selected Tracks")
+        self.apply_button.clicked.connect(self.accept)
+        button_layout.addWidget(self.apply_button)
+        
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(self.cancel_button)
+        
+        layout.addLayout(button_layout)
+
+    def describe_track(self, plex_track):
+        try:
+            artist = plex_track.originalTitle or (plex_track.artist().title if plex_track.artist() else "Unknown")
+        except Exception:
+            artist = "Unknown"
+        return f"{plex_track.title} - {artist}"
+
+    def manual_search(self, row):
+        item = self.review_queue[row]
+        dialog = ManualSearchDialog(item['track'], self.library_section, self, library_index=self.library_index)
+        if dialog.exec_() == QDialog.Accepted and dialog.selected_track:
+            combo = self.table.cellWidget(row, 2)
+            combo.addItem(f"{self.describe_track(dialog.selected_track)} (manual)", dialog.selected_track)
+            combo.setCurrentIndex(combo.count() - 1)
+
+    def skip_all(self):
+        for row in range(self.table.rowCount()):
+            self.table.cellWidget(row, 2).setCurrentIndex(0)
+
+    def get_resolutions(self):
+        """(queue item, chosen track or None) for every row"""
+        return [(item, self.table.cellWidget(row, 2).currentData()) for row, item in enumerate(self.review_queue)]
+
+
 class SpotifyLoginDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -4547,6 +6475,22 @@ class PlaylistConverterThread(QThread):
         self.user_response = None
         self.response_received = threading.Event()
         self.current_playlist_name = ""  # Store playlist name for context-aware matching
+        self.library_index = None  # Local copy of the section used for matching
+        self.catalogue = None  # Per-playlist artist/album fetch cache, see CataloguePlan
+        self.missing_artists = None  # lowercased source artists not in the library, see report_missing_artists
+        self.engine = get_matching_engine(plex_server, library_section)
+        self.strategy = ImportMatchStrategy()
+        
+        # Review mode: never block on the UI, queue uncertain tracks for one review at the end
+        self.review_mode = False
+        self.review_queue = []
+        self.created_playlist = None
+        self.source_positions = []  # (ratingKey, source position) of each track the playlist was created with
+        
+        # Parallel matching: prompts are shown one track at a time, Plex calls share a per-server budget
+        self.match_context = threading.local()
+        self.interaction_lock = threading.Lock()
+        self.plex_budget = get_plex_request_budget(plex_server)
 
     def run(self):
         try:
@@ -4613,7 +6557,11 @@ class PlaylistConverterThread(QThread):
                 'title': item['title'],
                 'artist': item['artist']['name'],
                 'album': album_name,
-                'display': f"{item['title']} - {item['artist']['name']}"
+                'display': f"{item['title']} - {item['artist']['name']}",
+                'service': 'tidal',
+                'id': str(item['id']) if item.get('id') is not None else None,
+                'duration_ms': (item.get('duration') or 0) * 1000,
+                'isrc': item.get('isrc')
             }
             return track_info
         except Exception as e:
@@ -4723,7 +6671,11 @@ class PlaylistConverterThread(QThread):
                                         'title': track['name'],
                                         'artist': artist_name,
                                         'album': album_name,
-                                        'display': f"{track['name']} - {artist_name}"
+                                        'display': f"{track['name']} - {artist_name}",
+                                        'service': 'spotify',
+                                        'id': track.get('id'),
+                                        'duration_ms': track.get('duration_ms') or 0,
+                                        'isrc': (track.get('external_ids') or {}).get('isrc')
                                     }
                                     tracks.append(track_info)
                                     processed_tracks += 1
@@ -4784,7 +6736,12 @@ class PlaylistConverterThread(QThread):
                 'title': track.title,
                 'artist': track.artist.name,
                 'album': album_name,
-                'display': f"{track.title} - {track.artist.name}"
+                'display': f"{track.title} - {track.artist.name}",
+                'service': 'deezer',
+                'id': str(track.id),
+                'duration_ms': (getattr(track, 'duration', 0) or 0) * 1000,
+                # vars() so a missing ISRC doesn't trigger a per-track API fetch
+                'isrc': vars(track).get('isrc')
             }
             tracks.append(track_info)
             self.progress_update.emit(int(len(tracks) / playlist.nb_tracks * 50))
@@ -4809,20 +6766,84 @@ class PlaylistConverterThread(QThread):
             
             library_section = self.plex_server.library.sectionByID(self.library_section)
             
+            # Match against the local library index instead of querying Plex for every track
+            self.library_index = self.engine.load_index(refresh=True)
+            self.missing_artists = self.report_missing_artists(library_section, tracks, final_name)
+            
+            # Tracks matched by an earlier import, sync or sort skip matching (and confirmation) entirely,
+            # unambiguous exact/near-exact title and artist hits skip fuzzy scoring
+            tier_hits_before = Counter(self.engine.tier_hits)
+            matches = []
+            exact_matches = 0
+            for track in tracks:
+                plex_track = self.engine.lookup(track)
+                if plex_track is None:
+                    plex_track = self.find_exact_match(track)
+                    if plex_track:
+                        exact_matches += 1
+                        self.engine.remember(track, plex_track)
+                matches.append(plex_track)
+            logging.info(f"Matched {exact_matches}/{len(tracks)} tracks on normalized title and artist alone")
+            
+            # Fetch each remaining artist's catalogue once, then fuzzy match the rest in parallel
+            remaining = [i for i, plex_track in enumerate(matches) if plex_track is None]
+            request_budget = None if self.library_index is not None else self.plex_budget
+            self.catalogue = CataloguePlan(library_section, self.lookup_artists, request_budget)
+            self.catalogue.plan([tracks[i] for i in remaining], self.parse_track_info)
+            
+            total_tracks = len(tracks)
+            completed = [total_tracks - len(remaining)]
+            progress_lock = threading.Lock()
+            
+            def match_track(i):
+                try:
+                    plex_track = self.match_with_prompts(library_section, tracks[i], i)
+                    if plex_track:
+                        self.engine.remember(tracks[i], plex_track)
+                    self.engine.count('fuzzy' if plex_track else 'miss')
+                    return plex_track
+                finally:
+                    with progress_lock:
+                        completed[0] += 1
+                        self.progress_update.emit(50 + int(completed[0] / total_tracks * 50))
+            
+            try:
+                workers = max(1, int(get_config_value("match_workers", MATCH_WORKERS)))
+            except (TypeError, ValueError):
+                workers = MATCH_WORKERS
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    future_to_index = {executor.submit(match_track, i): i for i in remaining}
+                    for future in as_completed(future_to_index):
+                        # Results go back into their source slot, so playlist order is preserved
+                        matches[future_to_index[future]] = future.result()
+            finally:
+                self.catalogue = None
+                self.engine.save()
+            
             plex_tracks = []
             not_found_tracks = []
-            total_tracks = len(tracks)
-            for i, track in enumerate(tracks):
-                plex_track = self.find_best_match(library_section, track)
+            self.source_positions = []
+            for position, (track, plex_track) in enumerate(zip(tracks, matches)):
                 if plex_track:
                     plex_tracks.append(plex_track)
+                    self.source_positions.append((plex_track.ratingKey, position))
                 else:
                     not_found_tracks.append(track)
-                self.progress_update.emit(50 + int((i + 1) / total_tracks * 50))
+            self.review_queue.sort(key=lambda item: item['position'] if item['position'] is not None else -1)
+            logging.info(f"Match tiers for '{final_name}': {self.engine.tier_summary(tier_hits_before)}")
+            
+            # Fetch the matched index rows from Plex in a few batched requests
+            plex_tracks = resolve_indexed_tracks(self.plex_server, plex_tracks)
+            
+            self.final_playlist_name = final_name
+            if self.review_queue:
+                logging.info(f"{len(self.review_queue)} uncertain tracks queued for review")
             
             if plex_tracks:
                 # Use the final_name (which might be renamed) instead of original playlist_name
                 plex_playlist = self.plex_server.createPlaylist(final_name, items=plex_tracks)
+                self.created_playlist = plex_playlist
                 
                 # Set the playlist image if available
                 if playlist_image_url:
@@ -4867,7 +6888,7 @@ class PlaylistConverterThread(QThread):
                             headers = {
                                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
                             }
-                            response = requests.post(poster_url, params=params, headers=headers)
+                            response = plex_post(poster_url, params=params, headers=headers)
                             response.raise_for_status()
                             logging.info(f"Successfully set thumbnail for playlist '{final_name}'")
                         except Exception as url_thumb_error:
@@ -4885,6 +6906,9 @@ class PlaylistConverterThread(QThread):
                         logging.warning(f"Not found: {display_track}")
 
                 self.final_playlist_name = final_name
+            elif self.review_queue:
+                # Nothing was certain enough - the playlist is created from the review resolutions
+                logging.info(f"No confident matches for '{final_name}' - playlist creation waits for the review")
             else:
                 raise ValueError("No matching tracks found in your Plex library")
         except Exception as e:
@@ -4893,57 +6917,166 @@ class PlaylistConverterThread(QThread):
 
     def log_library_wide_search(self, title, artist, reason):
         """Log tracks that cause library-wide searches to a separate file for easy identification"""
-        import datetime
-        
-        log_file = "library_wide_searches.log"
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        log_entry = f"[{timestamp}] LIBRARY-WIDE SEARCH: '{title}' by '{artist}' - Reason: {reason}\n"
-        
+        log_library_wide_search(title, artist, reason)
+
+    def search_artists(self, library_section, artist):
+        """Artist lookup, answered from the catalogue plan while a playlist is being matched"""
+        if self.catalogue is not None:
+            return self.catalogue.search_artists(artist)
+        return self.lookup_artists(library_section, artist)
+
+    def report_missing_artists(self, library_section, tracks, playlist_name):
+        """Log the playlist's artists that aren't in the library, in one pass before matching.
+
+        Returns their lowercased names for artist_exists, or None without a library index.
+        """
+        if self.library_index is None:
+            return None
+        checked = set()
+        missing = {}
+        for track in tracks:
+            _, artist, _ = self.parse_track_info(track)
+            key = artist.lower().strip() if artist else ''
+            if not key or key in checked:
+                continue
+            checked.add(key)
+            # Alias table first; only names it doesn't know get the 'contains' search
+            if not self.library_index.has_artist(artist) and not self.lookup_artists(library_section, artist):
+                missing[key] = artist.strip()
+        if missing:
+            logging.warning(f"{len(missing)} artists of '{playlist_name}' are not in the library: {', '.join(sorted(missing.values()))}")
+        return set(missing)
+
+    def artist_exists(self, library_section, artist):
+        """Whether the library has the artist - from the missing-artist report when there is one"""
+        if self.missing_artists is not None:
+            return artist.lower().strip() not in self.missing_artists
+        return bool(self.search_artists(library_section, artist))
+
+    def lookup_artists(self, library_section, artist):
+        """Look up artists in the library index, falling back to a Plex search"""
+        if self.library_index is not None:
+            return self.library_index.search_artists(artist)
+        with self.plex_budget:
+            return library_section.searchArtists(title=artist)
+
+    def match_with_prompts(self, library_section, track, position):
+        """find_best_match for one worker; a track that needs the user keeps the dialogs until it is done"""
+        self.match_context.position = position
+        self.match_context.interacting = False
         try:
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
-        except Exception as e:
-            logging.warning(f"Failed to write to library search log: {e}")
+            return self.find_best_match(library_section, track)
+        finally:
+            if self.match_context.interacting:
+                self.interaction_lock.release()
+            del self.match_context.interacting
+
+    def ask_user(self, signal, *args):
+        """Emit a prompt signal and wait for the answer, one track's prompts at a time"""
+        # Only workers started by match_with_prompts take the lock (interacting is False there)
+        if getattr(self.match_context, 'interacting', None) is False:
+            self.interaction_lock.acquire()
+            self.match_context.interacting = True
+        signal.emit(*args)
+        return self.wait_for_user_response()
+
+    def artist_tracks(self, artist_obj, title=None):
+        """An artist's tracks - only the candidates for title where Plex can filter them"""
+        if self.catalogue is not None:
+            return self.catalogue.tracks_for_artist(artist_obj, title)
+        if isinstance(artist_obj, IndexedArtist) or title is None:
+            return artist_obj.tracks()
+        with self.plex_budget:
+            return candidate_tracks(self.plex_server.library.sectionByID(self.library_section), title, artist_obj)
+
+    def artist_albums(self, artist_obj):
+        return self.catalogue.albums_for_artist(artist_obj) if self.catalogue is not None else artist_obj.albums()
+
+    def album_tracks(self, album_obj, title=None):
+        if self.catalogue is not None:
+            return self.catalogue.tracks_for_album(album_obj)
+        if isinstance(album_obj, IndexedAlbum) or title is None:
+            return album_obj.tracks()
+        with self.plex_budget:
+            return candidate_tracks(self.plex_server.library.sectionByID(self.library_section), title, album_obj=album_obj)
+
+    def queue_for_review(self, track, readable_track, reason, candidates=None):
+        """Record an uncertain track for the end-of-import review instead of prompting now"""
+        if candidates is None:
+            candidates = self.review_candidates(track)
+        self.review_queue.append({
+            'track': track,
+            'display': readable_track,
+            'reason': reason,
+            'position': getattr(self.match_context, 'position', None),
+            'candidates': candidates[:REVIEW_CANDIDATE_COUNT]
+        })
+        logging.info(f"Queued '{readable_track}' for review ({reason}, {len(candidates)} candidates)")
+        return None
 
-    def fuzzy_title_match(self, search_title, plex_title):
-        """
-        Fuzzy matching for titles to handle common variations like apostrophes, spacing, etc.
+    def review_candidates(self, track):
+        """Closest library tracks for a track the matcher found nothing for, best first"""
+        if self.library_index is None:
+            # Without the index this would be a library-wide search - leave it to the manual search
+            return []
+        title, artist, album = self.parse_track_info(track)
+        candidates = []
+        for plex_track in self.library_index.fuzzy_search(title, artist, limit=REVIEW_CANDIDATE_COUNT):
+            plex_artist = plex_track.originalTitle or (plex_track.artist().title if plex_track.artist() else "")
+            score = fuzz.token_set_ratio(title.lower(), plex_track.title.lower()) * 0.7
+            if artist and plex_artist:
+                score += fuzz.token_set_ratio(artist.lower(), plex_artist.lower()) * 0.3
+            candidates.append((plex_track, score))
+        return sorted(candidates, key=lambda c: c[1], reverse=True)
+
+    def apply_review_resolutions(self, resolutions):
+        """Add the tracks picked in the review table with a single addItems (or createPlaylist) call.
+
+        resolutions holds (queue item, chosen track) pairs. Each reviewed track is moved to its
+        position in the source playlist, among the tracks the playlist was created with.
         """
-        import re
-        
-        if not search_title or not plex_title:
-            return False
-        
-        # Normalize both titles for comparison
-        def normalize_title(title):
-            normalized = title.lower().strip()
-            # Remove/normalize apostrophes and quotes
-            normalized = re.sub(r"['`´'']", "", normalized)  # Remove various apostrophe types
-            # Normalize spacing around 'n' (and -> and, n -> n)
-            normalized = re.sub(r'\s+n\s+', ' n ', normalized)
-            # Remove extra whitespace
-            normalized = re.sub(r'\s+', ' ', normalized).strip()
-            return normalized
-        
-        search_normalized = normalize_title(search_title)
-        plex_normalized = normalize_title(plex_title)
-        
-        # Try exact match first
-        if search_normalized == plex_normalized:
-            return True
+        chosen = sorted((item for item in resolutions if item[1] is not None), key=lambda item: item[0]['position'] or 0)
+        if not chosen:
+            return 0
         
-        # Try substring match
-        if search_normalized in plex_normalized or plex_normalized in search_normalized:
-            return True
+        for item, plex_track in chosen:
+            self.engine.remember(item['track'], plex_track)
+        self.engine.save()
         
-        # Try fuzzy matching for very similar titles
-        try:
-            from fuzzywuzzy import fuzz
-            similarity = fuzz.ratio(search_normalized, plex_normalized)
-            return similarity >= 85  # High threshold for title matching within artist
-        except ImportError:
-            return False
+        plex_tracks = resolve_indexed_tracks(self.plex_server, [plex_track for _, plex_track in chosen])
+        if self.created_playlist is not None:
+            self.created_playlist.addItems(plex_tracks)
+            self.move_to_source_order(chosen)
+        else:
+            self.created_playlist = self.plex_server.createPlaylist(self.final_playlist_name, items=plex_tracks)
+        logging.info(f"Added {len(plex_tracks)} reviewed tracks to '{self.final_playlist_name}'")
+        return len(plex_tracks)
+
+    def move_to_source_order(self, chosen):
+        """Move the appended review picks to their source positions with the fewest item moves"""
+        positions = {}
+        for rating_key, position in self.source_positions + [(plex_track.ratingKey, item['position'])
+                                                              for item, plex_track in chosen]:
+            positions.setdefault(rating_key, []).append(position)
+        items = list(self.created_playlist.fetchItems(f"{self.created_playlist.key}/items"))
+        # Duplicates take their positions in playlist order; anything unaccounted for stays at the end
+        item_positions = [positions[item.ratingKey].pop(0) if positions.get(item.ratingKey) else float('inf')
+                          for item in items]
+        ordered = sorted(range(len(items)), key=lambda i: item_positions[i])
+        _, moves = plan_playlist_moves([item.playlistItemID for item in items],
+                                       [items[i].playlistItemID for i in ordered])
+        apply_playlist_moves(self.created_playlist, [], moves)
+        logging.info(f"Placed reviewed tracks in source order with {len(moves)} moves")
+
+    def find_exact_match(self, track):
+        """Exact or near-exact title/artist hit from the library index (matching tiers 1 and 2), or None"""
+        if self.library_index is None or not isinstance(track, dict):
+            return None
+        return self.engine.quick_match(track.get('title'), track.get('artist'), track.get('duration_ms'))
+
+    def fuzzy_title_match(self, search_title, plex_title):
+        """Fuzzy matching for titles to handle common variations like apostrophes, spacing, etc."""
+        return fuzzy_title_match(search_title, plex_title)
 
     def find_best_match(self, library_section, track):
         """Enhanced find_best_match with album-aware matching for short titles"""
@@ -4970,24 +7103,23 @@ class PlaylistConverterThread(QThread):
                 # First, check if the artist exists in the library
                 logging.debug(f"Checking if artist '{artist}' exists in library")
                 try:
-                    artist_results = library_section.searchArtists(title=artist)
-                    if not artist_results:
+                    if not self.artist_exists(library_section, artist):
                         logging.warning(f"Artist '{artist}' not found in library for track '{title}'")
+                        if self.review_mode:
+                            return self.queue_for_review(track, readable_track, "artist_not_found")
                         # Artist doesn't exist - ask user whether to skip or search manually
-                        self.artist_not_found_signal.emit(readable_track, artist, library_section)
-                        user_choice = self.wait_for_user_response()
+                        user_choice = self.ask_user(self.artist_not_found_signal, readable_track, artist, library_section)
                         if user_choice == "skip":
                             logging.info(f"User chose to skip track '{title}' by '{artist}' - artist not found")
                             return None
                         elif user_choice == "search":
                             logging.info(f"User chose manual search for track '{title}' by '{artist}' - artist not found")
-                            self.manual_search_needed.emit(readable_track, library_section)
-                            manual_result = self.wait_for_user_response()
+                            manual_result = self.ask_user(self.manual_search_needed, readable_track, library_section)
                             return manual_result if manual_result != "skip" else None
                         # If user chooses to continue, proceed with normal search logic
                         logging.info(f"Continuing with search despite artist '{artist}' not being found")
                     else:
-                        logging.debug(f"Artist '{artist}' found in library ({len(artist_results)} matches)")
+                        logging.debug(f"Artist '{artist}' found in library")
                 except Exception as e:
                     logging.warning(f"Error checking artist existence for '{artist}': {e}")
                 
@@ -5001,22 +7133,21 @@ class PlaylistConverterThread(QThread):
                     
                     try:
                         # Get the artist object(s) and search their albums
-                        artist_results = library_section.searchArtists(title=artist)
+                        artist_results = self.search_artists(library_section, artist)
                         album_found = False
                         
                         for artist_obj in artist_results[:2]:  # Check top 2 artist matches
                             try:
                                 # Get all albums by this artist
-                                artist_albums = artist_obj.albums()
+                                artist_albums = self.artist_albums(artist_obj)
                                 logging.debug(f"Artist '{artist_obj.title}' has {len(artist_albums)} albums")
                                 
-                                # Look for the specific album
+                                # Look for the specific album - 70 and up is a good album match
                                 matching_albums = []
-                                for artist_album in artist_albums:
-                                    album_similarity = fuzz.token_set_ratio(album.lower(), artist_album.title.lower())
-                                    if album_similarity >= 70:  # Good album match
-                                        matching_albums.append((artist_album, album_similarity))
-                                        logging.debug(f"Found matching album: '{artist_album.title}' (similarity: {album_similarity}%)")
+                                album_titles = [artist_album.title.lower() for artist_album in artist_albums]
+                                for _, album_similarity, i in scoring_backend().extract(album.lower(), album_titles, score_cutoff=70):
+                                    matching_albums.append((artist_albums[i], album_similarity))
+                                    logging.debug(f"Found matching album: '{artist_albums[i].title}' (similarity: {album_similarity}%)")
                                 
                                 if matching_albums:
                                     album_found = True
@@ -5025,13 +7156,13 @@ class PlaylistConverterThread(QThread):
                                     
                                     for album_obj, similarity in sorted(matching_albums, key=lambda x: x[1], reverse=True):
                                         try:
-                                            album_tracks = album_obj.tracks()
+                                            album_tracks = self.album_tracks(album_obj, title)
                                             logging.debug(f"Album '{album_obj.title}' has {len(album_tracks)} tracks")
                                             
-                                            for track in album_tracks:
-                                                if self.fuzzy_title_match(title, track.title):
-                                                    all_search_tracks.append(track)
-                                                    logging.debug(f"Found track in album: '{track.title}' from '{album_obj.title}'")
+                                            for candidate in album_tracks:
+                                                if self.fuzzy_title_match(title, candidate.title):
+                                                    all_search_tracks.append(candidate)
+                                                    logging.debug(f"Found track in album: '{candidate.title}' from '{album_obj.title}'")
                                         except Exception as e:
                                             logging.warning(f"Error searching tracks in album '{album_obj.title}': {e}")
                                     
@@ -5044,13 +7175,13 @@ class PlaylistConverterThread(QThread):
                             
                             for artist_obj in artist_results[:2]:
                                 try:
-                                    artist_tracks = artist_obj.tracks()
-                                    logging.debug(f"Artist '{artist_obj.title}' has {len(artist_tracks)} total tracks")
+                                    artist_tracks = self.artist_tracks(artist_obj, title)
+                                    logging.debug(f"Artist '{artist_obj.title}' has {len(artist_tracks)} candidate tracks")
                                     
-                                    for track in artist_tracks:
-                                        if self.fuzzy_title_match(title, track.title):
-                                            all_search_tracks.append(track)
-                                            logging.debug(f"Found track in artist discography: '{track.title}' by '{artist_obj.title}'")
+                                    for candidate in artist_tracks:
+                                        if self.fuzzy_title_match(title, candidate.title):
+                                            all_search_tracks.append(candidate)
+                                            logging.debug(f"Found track in artist discography: '{candidate.title}' by '{artist_obj.title}'")
                                             
                                 except Exception as e:
                                     logging.warning(f"Error searching all tracks for artist '{artist_obj.title}': {e}")
@@ -5063,16 +7194,16 @@ class PlaylistConverterThread(QThread):
                     logging.debug(f"Step 2: No album info, searching title '{title}' within all artist '{artist}' songs")
                     
                     try:
-                        artist_results = library_section.searchArtists(title=artist)
+                        artist_results = self.search_artists(library_section, artist)
                         for artist_obj in artist_results[:2]:
                             try:
-                                artist_tracks = artist_obj.tracks()
-                                logging.debug(f"Artist '{artist_obj.title}' has {len(artist_tracks)} total tracks")
+                                artist_tracks = self.artist_tracks(artist_obj, title)
+                                logging.debug(f"Artist '{artist_obj.title}' has {len(artist_tracks)} candidate tracks")
                                 
-                                for track in artist_tracks:
-                                    if self.fuzzy_title_match(title, track.title):
-                                        all_search_tracks.append(track)
-                                        logging.debug(f"Found track in artist discography: '{track.title}' by '{artist_obj.title}'")
+                                for candidate in artist_tracks:
+                                    if self.fuzzy_title_match(title, candidate.title):
+                                        all_search_tracks.append(candidate)
+                                        logging.debug(f"Found track in artist discography: '{candidate.title}' by '{artist_obj.title}'")
                                         
                             except Exception as e:
                                 logging.warning(f"Error searching all tracks for artist '{artist_obj.title}': {e}")
@@ -5082,11 +7213,11 @@ class PlaylistConverterThread(QThread):
                 # Deduplicate results
                 seen_tracks = set()
                 unique_tracks = []
-                for track in all_search_tracks:
-                    track_id = getattr(track, 'ratingKey', str(track))
+                for candidate in all_search_tracks:
+                    track_id = getattr(candidate, 'ratingKey', str(candidate))
                     if track_id not in seen_tracks:
                         seen_tracks.add(track_id)
-                        unique_tracks.append(track)
+                        unique_tracks.append(candidate)
                 
                 all_tracks = unique_tracks
                 logging.debug(f"Structured search found {len(all_tracks)} tracks for short title '{title}'")
@@ -5094,14 +7225,16 @@ class PlaylistConverterThread(QThread):
                 # If no results found, trigger manual search
                 if len(all_tracks) == 0:
                     logging.debug(f"No results found for short title '{title}' by '{artist}' - triggering manual search")
-                    self.manual_search_needed.emit(readable_track, library_section)
-                    manual_result = self.wait_for_user_response()
+                    if self.review_mode:
+                        return self.queue_for_review(track, readable_track, "no_results")
+                    manual_result = self.ask_user(self.manual_search_needed, readable_track, library_section)
                     return manual_result if manual_result != "skip" else None
             else:
                 # No artist info, go straight to manual search
                 logging.debug(f"Short title '{title}' with no artist info - triggering manual search")
-                self.manual_search_needed.emit(readable_track, library_section)
-                manual_result = self.wait_for_user_response()
+                if self.review_mode:
+                    return self.queue_for_review(track, readable_track, "no_results")
+                manual_result = self.ask_user(self.manual_search_needed, readable_track, library_section)
                 return manual_result if manual_result != "skip" else None
         else:
             # Normal search for longer titles - use artist-first approach when possible
@@ -5112,39 +7245,36 @@ class PlaylistConverterThread(QThread):
                 # First, check if the artist exists in the library
                 logging.debug(f"Checking if artist '{artist}' exists in library (normal title search)")
                 try:
-                    artist_results = library_section.searchArtists(title=artist)
-                    if not artist_results:
+                    if not self.artist_exists(library_section, artist):
                         logging.warning(f"Artist '{artist}' not found in library for track '{title}' (normal title)")
+                        if self.review_mode:
+                            return self.queue_for_review(track, readable_track, "artist_not_found")
                         # Artist doesn't exist - ask user whether to skip or search manually
-                        self.artist_not_found_signal.emit(readable_track, artist, library_section)
-                        user_choice = self.wait_for_user_response()
+                        user_choice = self.ask_user(self.artist_not_found_signal, readable_track, artist, library_section)
                         if user_choice == "skip":
                             logging.info(f"User chose to skip track '{title}' by '{artist}' - artist not found (normal title)")
                             return None
                         elif user_choice == "search":
                             logging.info(f"User chose manual search for track '{title}' by '{artist}' - artist not found (normal title)")
-                            self.manual_search_needed.emit(readable_track, library_section)
-                            manual_result = self.wait_for_user_response()
+                            manual_result = self.ask_user(self.manual_search_needed, readable_track, library_section)
                             return manual_result if manual_result != "skip" else None
                         # If user chooses to continue, proceed with normal search logic
                         logging.info(f"Continuing with search despite artist '{artist}' not being found (normal title)")
                     else:
-                        logging.debug(f"Artist '{artist}' found in library ({len(artist_results)} matches) - normal title search")
+                        logging.debug(f"Artist '{artist}' found in library - normal title search")
                 except Exception as e:
                     logging.warning(f"Error checking artist existence for '{artist}' (normal title): {e}")
                 
                 try:
                     logging.debug(f"Searching for artist '{artist}' first")
-                    # Use existing artist_results from above check if available
-                    if 'artist_results' not in locals():
-                        artist_results = library_section.searchArtists(title=artist)
+                    artist_results = self.search_artists(library_section, artist)
                     
                     if artist_results:
                         # Found artist(s), search within their tracks
                         for artist_obj in artist_results[:3]:  # Check top 3 artist matches
                             try:
-                                artist_tracks = artist_obj.tracks()
-                                logging.debug(f"Found {len(artist_tracks)} tracks by '{artist_obj.title}'")
+                                artist_tracks = self.artist_tracks(artist_obj, title)
+                                logging.debug(f"Found {len(artist_tracks)} candidate tracks by '{artist_obj.title}'")
                                 
                                 # Search for title within this artist's tracks
                                 clean_title = self.clean_title_for_search(title)
@@ -5159,8 +7289,8 @@ class PlaylistConverterThread(QThread):
                                 
                                 for search_title in search_titles:
                                     matching_tracks = [
-                                        track for track in artist_tracks 
-                                        if self.fuzzy_title_match(search_title, track.title)
+                                        candidate for candidate in artist_tracks 
+                                        if self.fuzzy_title_match(search_title, candidate.title)
                                     ]
                                     all_tracks.extend(matching_tracks)
                                     logging.debug(f"Artist '{artist_obj.title}' title search for '{search_title}' found {len(matching_tracks)} tracks")
@@ -5178,171 +7308,41 @@ class PlaylistConverterThread(QThread):
             # If artist search didn't yield results, trigger manual search instead of library-wide search
             if not all_tracks:
                 logging.debug(f"No artist-specific results found for '{title}' by '{artist}' - triggering manual search")
-                self.manual_search_needed.emit(readable_track, library_section)
-                manual_result = self.wait_for_user_response()
+                if self.review_mode:
+                    return self.queue_for_review(track, readable_track, "no_results")
+                manual_result = self.ask_user(self.manual_search_needed, readable_track, library_section)
                 return manual_result if manual_result != "skip" else None
             
             # Deduplicate
             seen_tracks = set()
             unique_tracks = []
-            for track in all_tracks:
-                track_id = getattr(track, 'ratingKey', str(track))
+            for candidate in all_tracks:
+                track_id = getattr(candidate, 'ratingKey', str(candidate))
                 if track_id not in seen_tracks:
                     seen_tracks.add(track_id)
-                    unique_tracks.append(track)
+                    unique_tracks.append(candidate)
             all_tracks = unique_tracks
             
             logging.debug(f"Total unique tracks after artist-first search: {len(all_tracks)}")
         
-        best_match = None
-        best_score = 0
-        acceptable_matches = []
-        
-        for plex_track in all_tracks:
-            # Calculate similarity score for title
-            plex_title = plex_track.title if plex_track.title else ""
-            
-            # Debug: Log the exact track details
-            logging.debug(f"Plex track found: ID={plex_track.ratingKey}, Title='{plex_title}', Artist='{plex_track.originalTitle or (plex_track.artist().title if plex_track.artist() else 'Unknown')}'")
-            
-            # Clean featured artists from BOTH source and Plex titles for better matching
-            clean_source_title = self.remove_featured_artists_aggressive(title)
-            clean_plex_title = self.remove_featured_artists_aggressive(plex_title)
-            
-            # ALSO apply dash removal from clean_title_for_search to source title for consistency
-            dash_cleaned_source = self.clean_title_for_search(title)
-            
-            logging.debug(f"Comparing: '{dash_cleaned_source}' vs '{clean_plex_title}' (original: '{title}' vs '{plex_title}')")
-            
-            # Check if source has no featured artists but Plex track does - be more strict
-            source_has_feat = title != clean_source_title
-            plex_has_feat = plex_title != clean_plex_title
-            
-            if not source_has_feat and plex_has_feat:
-                # Source is clean but Plex has featured artists - penalize heavily
-                logging.debug(f"Source '{title}' is clean but Plex '{plex_title}' has featured artists - applying penalty")
-                # We'll apply a penalty later in scoring
-            
-            # Apply version filtering before scoring - use dash-cleaned source title
-            if not self.is_acceptable_version_match(dash_cleaned_source, clean_plex_title):
-                logging.debug(f"Skipping version mismatch: '{dash_cleaned_source}' vs '{clean_plex_title}'")
-                continue
-            
-            # Calculate similarity using dash-cleaned source title for better matching
-            title_score = fuzz.token_set_ratio(dash_cleaned_source.lower(), clean_plex_title.lower())
-            
-            # Also calculate with original titles for comparison
-            original_title_score = fuzz.token_set_ratio(title.lower(), plex_title.lower())
-            
-            # Use the better score (clean titles usually match better)
-            if title_score > original_title_score:
-                logging.debug(f"Clean title matching worked better: {title_score} vs {original_title_score}")
-            else:
-                title_score = original_title_score
-                logging.debug(f"Original title matching was better: {original_title_score} vs {title_score}")
-            
-            # Calculate similarity score for artist if available
-            artist_score = 0
-            plex_artist = ""
-            if artist and plex_track.originalTitle:
-                plex_artist = plex_track.originalTitle
-                artist_score = fuzz.token_set_ratio(artist.lower(), plex_artist.lower())
-            elif artist and plex_track.artist():
-                plex_artist = plex_track.artist().title
-                artist_score = fuzz.token_set_ratio(artist.lower(), plex_artist.lower())
-            
-            # Debug logging for exact matches
-            if title_score == 100 and artist_score >= 90:
-                logging.info(f"EXACT MATCH FOUND: '{dash_cleaned_source}' by '{artist}' -> '{clean_plex_title}' by '{plex_artist}' (title: {title_score}, artist: {artist_score})")
-            elif dash_cleaned_source.lower() == clean_plex_title.lower():
-                logging.info(f"PERFECT CLEAN TITLE MATCH: '{dash_cleaned_source}' -> '{clean_plex_title}' (after dash removal and cleaning)")
-            
-            # Apply minimum artist score requirement to prevent wrong artist matches
-            if artist and artist_score < 50:  # Minimum 50% artist similarity required
-                logging.debug(f"Skipping due to low artist match: '{artist}' vs '{plex_artist}' (score: {artist_score})")
-                continue
-            
-            # Apply penalty if source is clean but Plex has featured artists (use original titles for this check)
-            source_has_feat = title != clean_source_title
-            plex_has_feat = plex_title != clean_plex_title
-            
-            if not source_has_feat and plex_has_feat:
-                # Source is clean but Plex has featured artists - penalize heavily
-                logging.debug(f"Source '{title}' is clean but Plex '{plex_title}' has featured artists - applying penalty")
-                # We'll apply a penalty later in scoring
-            
-            # Weighted average of title and artist scores
-            combined_score = (title_score * 0.7) + (artist_score * 0.3)
-            
-            if not source_has_feat and plex_has_feat:
-                # Only apply penalty if it's not an exact title match (use dash-cleaned comparison)
-                if dash_cleaned_source.lower() != clean_plex_title.lower():
-                    penalty = 25  # Heavy penalty for featured artist mismatch
-                    combined_score -= penalty
-                    logging.debug(f"Applied featured artist penalty: -{penalty} points (new score: {combined_score})")
-                else:
-                    logging.debug(f"Exact clean title match - no penalty applied despite featured artist difference")
-            
-            # For short titles, require higher accuracy
-            if is_short_title:
-                # Short titles need exact or near-exact matches
-                if title_score < 95:  # Very strict for short titles
-                    continue
-                # For short titles, require even higher artist accuracy
-                if artist and artist_score < 70:  # Higher threshold for short titles
-                    logging.debug(f"Skipping short title due to insufficient artist match: '{artist}' vs '{plex_artist}' (score: {artist_score})")
-                    continue
-                logging.debug(f"Short title match: '{title}' -> '{plex_title}' (title: {title_score}, artist: {artist_score})")
-            
-            # Apply preference bonus for remastered versions
-            preference_bonus = self.get_version_preference_bonus(plex_title)
-            
-            # Apply album preference bonus if we have album information
-            album_bonus = 0
-            if album and album != 'Unknown Album':
-                plex_album = ""
-                if hasattr(plex_track, 'album') and plex_track.album():
-                    plex_album = plex_track.album().title
-                
-                if plex_album:
-                    # Calculate album similarity
-                    album_similarity = fuzz.token_set_ratio(album.lower(), plex_album.lower())
-                    if album_similarity >= 80:
-                        album_bonus = 5.0  # Strong bonus for correct album
-                        logging.debug(f"Album match bonus: '{album}' -> '{plex_album}' (+{album_bonus} points)")
-                    elif album_similarity >= 60:
-                        album_bonus = 2.0  # Moderate bonus for similar album
-                        logging.debug(f"Album similarity bonus: '{album}' -> '{plex_album}' (+{album_bonus} points)")
-                    else:
-                        # Small bonus for any track by the same artist (better than compilation albums)
-                        album_bonus = 0.5  # Small bonus for artist's own albums vs compilations
-                        logging.debug(f"Artist album bonus: '{album}' vs '{plex_album}' (+{album_bonus} points)")
-            
-            final_score = combined_score + preference_bonus + album_bonus
-            
-            # Adjust threshold based on title length
-            min_threshold = 90 if is_short_title else 60
-            if combined_score >= min_threshold:
-                acceptable_matches.append((plex_track, final_score, combined_score))
-            
-            if final_score > best_score:
-                best_score = final_score
-                best_match = plex_track
+        acceptable_matches, best_match, best_score = self.engine.score_candidates(
+            self.strategy, title, artist, album, all_tracks, self.current_playlist_name)
         
         # Handle different score ranges with preferences
-        if best_score >= 80:
+        if best_score >= self.strategy.confident_score:
             # High confidence - auto accept
             logging.info(f"High confidence match for '{track}' to '{best_match.title}' (score: {best_score:.1f})")
             return best_match
-        elif best_score >= 60 and not self.skip_all_low_matches:
+        elif best_score >= self.strategy.confirm_score and not self.skip_all_low_matches:
             # Medium confidence - ask user
+            if self.review_mode:
+                # Best candidates first, so the review table can preselect the proposed match
+                candidates = sorted(((match, score) for match, score, _ in acceptable_matches), key=lambda c: c[1], reverse=True)
+                return self.queue_for_review(track, readable_track, "low_confidence", candidates or [(best_match, best_score)])
             logging.info(f"Medium confidence match for '{track}' to '{best_match.title}' (score: {best_score:.1f}) - asking user")
             
             # Emit signal to main thread for user confirmation
-            self.track_match_confirmation_needed.emit(readable_track, best_match, best_score)
-            
-            # Wait for user response
-            user_choice = self.wait_for_user_response()
+            user_choice = self.ask_user(self.track_match_confirmation_needed, readable_track, best_match, best_score)
             
             if user_choice == "use":
                 logging.info(f"User approved match for '{track}' to '{best_match.title}'")
@@ -5357,80 +7357,25 @@ class PlaylistConverterThread(QThread):
             elif user_choice == "search":
                 # User wants to manually search - emit signal for manual search
                 logging.info(f"User requested manual search for '{readable_track}'")
-                self.manual_search_needed.emit(readable_track, library_section)
-                # Wait for manual search result
-                manual_result = self.wait_for_user_response()
+                manual_result = self.ask_user(self.manual_search_needed, readable_track, library_section)
                 return manual_result if manual_result != "skip" else None
-        elif best_score >= 60 and self.skip_all_low_matches:
+        elif best_score >= self.strategy.confirm_score and self.skip_all_low_matches:
             # User previously chose to skip all low matches
             logging.info(f"Skipping low confidence match for '{track}' (score: {best_score:.1f}) - user chose skip all")
             return None
         else:
             # No match found - offer manual search
             logging.warning(f"No match found for '{readable_track}' - offering manual search")
+            if self.review_mode:
+                return self.queue_for_review(track, readable_track, "no_match")
             if not self.skip_all_low_matches:
-                self.manual_search_needed.emit(readable_track, library_section)
-                manual_result = self.wait_for_user_response()
+                manual_result = self.ask_user(self.manual_search_needed, readable_track, library_section)
                 return manual_result if manual_result != "skip" else None
             return None
 
     def clean_artist_name(self, artist):
         """Clean artist name for better matching - removes remaster info, years, and featured artists"""
-        if not artist:
-            return ""
-        
-        import re
-        
-        # Remove remaster information and years from artist field
-        # Patterns like "2015 Remaster - Van Halen" -> "Van Halen"
-        remaster_patterns = [
-            r'^\d{4}\s*remaster\s*-\s*',     # "2015 Remaster - " at start
-            r'^\d{4}\s*remastered\s*-\s*',   # "2015 Remastered - " at start
-            r'^\s*remaster\s*-\s*',          # "Remaster - " at start
-            r'^\s*remastered\s*-\s*',        # "Remastered - " at start
-            r'\s*-\s*\d{4}\s*remaster$',     # " - 2015 Remaster" at end
-            r'\s*-\s*\d{4}\s*remastered$',   # " - 2015 Remastered" at end
-            r'\s*-\s*remaster$',             # " - Remaster" at end
-            r'\s*-\s*remastered$',           # " - Remastered" at end
-        ]
-        
-        cleaned = artist
-        for pattern in remaster_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove version information in parentheses/brackets from artist field
-        version_patterns = [
-            r'\s*\([^)]*(?:remaster|remastered|remix|mix|edit|version|deluxe|anniversary|edition)[^)]*\)',
-            r'\s*\[[^\]]*(?:remaster|remastered|remix|mix|edit|version|deluxe|anniversary|edition)[^\]]*\]'
-        ]
-        
-        for pattern in version_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove "feat" mentions from artist field
-        feat_patterns = [
-            r'\s*feat\.?\s+.+$',      # feat. Artist (everything after)
-            r'\s*ft\.?\s+.+$',        # ft. Artist (everything after)
-            r'\s*featuring\s+.+$',    # featuring Artist (everything after)
-            r'\s*with\s+.+$',         # with Artist (everything after)
-            r',\s*feat\.?\s+.+$',     # , feat. Artist
-            r',\s*ft\.?\s+.+$',       # , ft. Artist
-            r',\s*featuring\s+.+$',   # , featuring Artist
-            r',\s*with\s+.+$',        # , with Artist
-        ]
-        
-        for pattern in feat_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Clean up extra spaces and punctuation
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        cleaned = cleaned.strip(' -,&()[]')
-        
-        # If we removed too much and left nothing meaningful, return original
-        if len(cleaned.strip()) < 1:
-            return artist
-            
-        return cleaned
+        return clean_artist_name(artist)
 
     def parse_track_info(self, track):
         # Handle new structured format with album info
@@ -5458,379 +7403,27 @@ class PlaylistConverterThread(QThread):
     
     def remove_featured_artists(self, title):
         """Remove featured artist information to focus search on main track title"""
-        import re
-        
-        # More comprehensive patterns for featured artists
-        patterns = [
-            # Parentheses patterns
-            r'\s*\(feat\.?\s+[^)]+\)',      # (feat. Artist) or (feat Artist)
-            r'\s*\(featuring\s+[^)]+\)',    # (featuring Artist)
-            r'\s*\(ft\.?\s+[^)]+\)',       # (ft. Artist) or (ft Artist)
-            r'\s*\(with\s+[^)]+\)',        # (with Artist)
-            r'\s*\(f\.\s+[^)]+\)',         # (f. Artist)
-            
-            # Square brackets patterns
-            r'\s*\[feat\.?\s+[^\]]+\]',     # [feat. Artist]
-            r'\s*\[featuring\s+[^\]]+\]',   # [featuring Artist]
-            r'\s*\[ft\.?\s+[^\]]+\]',      # [ft. Artist]
-            r'\s*\[with\s+[^\]]+\]',       # [with Artist]
-            
-            # Without brackets (more careful to avoid removing main content)
-            r'\s+feat\.?\s+[^-\(\[\n]+$',   # feat. Artist at end of line
-            r'\s+featuring\s+[^-\(\[\n]+$', # featuring Artist at end of line
-            r'\s+ft\.?\s+[^-\(\[\n]+$',    # ft. Artist at end of line
-            r'\s+with\s+[^-\(\[\n]+$',     # with Artist at end of line
-            r'\s+f\.\s+[^-\(\[\n]+$',      # f. Artist at end of line
-        ]
-        
-        cleaned_title = title
-        for pattern in patterns:
-            cleaned_title = re.sub(pattern, '', cleaned_title, flags=re.IGNORECASE)
-        
-        # Clean up extra spaces and punctuation
-        cleaned_title = re.sub(r'\s+', ' ', cleaned_title).strip()
-        cleaned_title = cleaned_title.rstrip(' -,&')
-        
-        # If we removed too much and left nothing meaningful, return original
-        if len(cleaned_title.strip()) < 2:
-            return title
-            
-        return cleaned_title
+        return remove_featured_artists(title)
     
     def remove_featured_artists_aggressive(self, title):
         """Aggressively remove featured artist information, preserving remix info in parentheses"""
-        import re
-        
-        # First, preserve remix/version info in parentheses by temporarily replacing it
-        # Use non-greedy matching and be more specific
-        remix_patterns = [
-            r'\([^)]*(?:remix|mix|edit|version|remaster|acoustic|live|unplugged|demo)[^)]*\)',
-            r'\[[^\]]*(?:remix|mix|edit|version|remaster|acoustic|live|unplugged|demo)[^\]]*\]'
-        ]
-        
-        preserved_versions = []
-        temp_title = title
-        
-        # Extract and preserve version info
-        for i, pattern in enumerate(remix_patterns):
-            matches = re.findall(pattern, temp_title, flags=re.IGNORECASE)
-            for match in matches:
-                placeholder = f"__PRESERVED_VERSION_{i}_{len(preserved_versions)}__"
-                preserved_versions.append(match)
-                temp_title = temp_title.replace(match, placeholder)
-        
-        # Now aggressively remove featured artist patterns
-        patterns = [
-            # Parentheses patterns (but not the preserved ones)
-            r'\s*\(feat\.?\s+[^)]+\)',      # (feat. Artist) or (feat Artist)
-            r'\s*\(featuring\s+[^)]+\)',    # (featuring Artist)
-            r'\s*\(ft\.?\s+[^)]+\)',       # (ft. Artist) or (ft Artist)
-            r'\s*\(with\s+[^)]+\)',        # (with Artist)
-            r'\s*\(f\.\s+[^)]+\)',         # (f. Artist)
-            
-            # Square brackets patterns
-            r'\s*\[feat\.?\s+[^\]]+\]',     # [feat. Artist]
-            r'\s*\[featuring\s+[^\]]+\]',   # [featuring Artist]
-            r'\s*\[ft\.?\s+[^\]]+\]',      # [ft. Artist]
-            r'\s*\[with\s+[^\]]+\]',       # [with Artist]
-            
-            # Without brackets - AGGRESSIVE removal of everything after feat.
-            r'\s+feat\.?\s+.*$',           # feat. Artist (everything after)
-            r'\s+featuring\s+.*$',         # featuring Artist (everything after)
-            r'\s+ft\.?\s+.*$',            # ft. Artist (everything after)
-            r'\s+with\s+.*$',             # with Artist (everything after)
-            r'\s+f\.\s+.*$',              # f. Artist (everything after)
-            
-            # Handle comma-separated featured artists
-            r',\s*feat\.?\s+.*$',         # , feat. Artist
-            r',\s*featuring\s+.*$',       # , featuring Artist
-            r',\s*ft\.?\s+.*$',          # , ft. Artist
-            r',\s*with\s+.*$',           # , with Artist
-        ]
-        
-        cleaned_title = temp_title
-        for pattern in patterns:
-            cleaned_title = re.sub(pattern, '', cleaned_title, flags=re.IGNORECASE)
-        
-        # Restore preserved version info
-        for i, version in enumerate(preserved_versions):
-            # Find the correct placeholder for this version
-            for j in range(len(remix_patterns)):
-                placeholder = f"__PRESERVED_VERSION_{j}_{i}__"
-                if placeholder in cleaned_title:
-                    cleaned_title = cleaned_title.replace(placeholder, version)
-                    break
-        
-        # Clean up extra spaces and punctuation
-        cleaned_title = re.sub(r'\s+', ' ', cleaned_title).strip()
-        cleaned_title = cleaned_title.rstrip(' -,&')
-        
-        # If we removed too much and left nothing meaningful, return original
-        if len(cleaned_title.strip()) < 2:
-            return title
-            
-        return cleaned_title
+        return remove_featured_artists_aggressive(title)
     
     def clean_title_for_search(self, title):
-        """Clean title for search by removing both featured artists AND version information"""
-        import re
-        
-        if not title:
-            return ""
-        
-        cleaned = title
-        
-        # NEW: Remove dash and everything after it (until brackets)
-        # This handles titles like "Accidentally In Love - From "Shrek 2" Soundtrack"
-        # Remove "-" and everything after it, but stop at brackets/parentheses
-        if ' - ' in cleaned:
-            # Find the first dash with spaces
-            dash_index = cleaned.find(' - ')
-            if dash_index != -1:
-                # Check if there are brackets/parentheses after the dash
-                remaining_text = cleaned[dash_index:]
-                # Look for opening bracket/parenthesis
-                bracket_match = re.search(r'[()\[\]]', remaining_text)
-                if bracket_match:
-                    # Keep everything up to dash, then everything from the bracket onward
-                    before_dash = cleaned[:dash_index]
-                    bracket_start = dash_index + bracket_match.start()
-                    after_bracket = cleaned[bracket_start:]
-                    cleaned = before_dash + ' ' + after_bracket
-                else:
-                    # No brackets found, remove everything after dash
-                    cleaned = cleaned[:dash_index]
-        
-        # Remove version information in parentheses and brackets
-        version_patterns = [
-            r'\\s*\\([^)]*(?:remaster|remastered|remix|mix|edit|version|acoustic|live|unplugged|demo|deluxe|anniversary|edition|stereo|mono|explicit|clean|radio|single|album)[^)]*\\)',
-            r'\\s*\\[[^\\]]*(?:remaster|remastered|remix|mix|edit|version|acoustic|live|unplugged|demo|deluxe|anniversary|edition|stereo|mono|explicit|clean|radio|single|album)[^\\]]*\\]'
-        ]
-        
-        for pattern in version_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove semicolon-separated version info first (like "; 2017 Remaster")
-        semicolon_patterns = [
-            r'\s*;\s*(?:\d{4}\s+)?(?:remaster|remastered)(?:\s+\d{4})?.*$',
-            r'\s*;\s*(?:\d{4}\s+)?(?:remastered\s+)?(?:edition|version).*$',
-        ]
-        
-        for pattern in semicolon_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove version information that appears after dashes in the main title
-        # Patterns like "Song Title - Remastered", "Track Name - 2021 Remaster", etc.
-        dash_version_patterns = [
-            r'\s*-\s*(?:\d{4}\s+)?(?:remaster|remastered)(?:\s+\d{4})?.*$',  # - Remastered, - 2021 Remaster
-            r'\s*-\s*(?:\d{4}\s+)?(?:remastered\s+)?(?:edition|version).*$',  # - Edition, - Version, - 2021 Edition
-            r'\s*-\s*(?:deluxe|anniversary|special)\s*(?:edition|version)?.*$',  # - Deluxe, - Anniversary Edition
-            r'\s*-\s*(?:stereo|mono).*$',  # - Stereo, - Mono
-            r'\s*-\s*(?:explicit|clean).*$',  # - Explicit, - Clean
-            r'\s*-\s*(?:radio|single|album)\s*(?:edit|version)?.*$',  # - Radio Edit, - Single Version
-            r'\s*-\s*live(?:\s+at\s+[^-]*)?.*$',  # - Live, - Live at Venue
-            r'\s*-\s*acoustic.*$',  # - Acoustic
-            r'\s*-\s*unplugged.*$',  # - Unplugged
-            r'\s*-\s*demo.*$',  # - Demo
-        ]
-        
-        for pattern in dash_version_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove featured artist information
-        feat_patterns = [
-            r'\s*\(feat\.?\s+[^)]+\)',      # (feat. Artist)
-            r'\s*\(featuring\s+[^)]+\)',    # (featuring Artist)
-            r'\s*\(ft\.?\s+[^)]+\)',       # (ft. Artist)
-            r'\s*\(with\s+[^)]+\)',        # (with Artist)
-            r'\s*\(f\.\s+[^)]+\)',         # (f. Artist)
-            r'\s*\[feat\.?\s+[^\]]+\]',     # [feat. Artist]
-            r'\s*\[featuring\s+[^\]]+\]',   # [featuring Artist]
-            r'\s*\[ft\.?\s+[^\]]+\]',      # [ft. Artist]
-            r'\s*\[with\s+[^\]]+\]',       # [with Artist]
-            r'\s+feat\.?\s+.*$',           # feat. Artist (everything after)
-            r'\s+featuring\s+.*$',         # featuring Artist (everything after)
-            r'\s+ft\.?\s+.*$',            # ft. Artist (everything after)
-            r'\s+with\s+.*$',             # with Artist (everything after)
-            r'\s+f\.\s+.*$',              # f. Artist (everything after)
-            r',\s*feat\.?\s+.*$',         # , feat. Artist
-            r',\s*featuring\s+.*$',       # , featuring Artist
-            r',\s*ft\.?\s+.*$',          # , ft. Artist
-            r',\s*with\s+.*$',           # , with Artist
-        ]
-        
-        for pattern in feat_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Clean up extra spaces and punctuation
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        cleaned = cleaned.rstrip(' -,&')
-        
-        # Don't remove closing parentheses/brackets that might be part of the song title
-        # Only remove unmatched opening brackets or obvious trailing punctuation
-        
-        # If we removed too much and left nothing meaningful, return original
-        if len(cleaned.strip()) < 2:
-            return title
-            
-        return cleaned
+        """Clean title for search, keeping bracketed version tags for the version filter"""
+        return clean_title_for_search(title, keep_version_tags=True)
     
     def is_acceptable_version_match(self, source_title, plex_title):
-        """
-        Check if a Plex track version is acceptable for matching against a source track.
-        Now strict - only allows explicitly permitted versions when source is clean.
-        """
-        import re
-        
-        # Extract content in parentheses and brackets from both titles
-        source_extras = self.extract_version_info(source_title)
-        plex_extras = self.extract_version_info(plex_title)
-        
-        # Be strict when source has no version info - only allow explicitly permitted versions
-        if not source_extras:
-            # Allowed version types even when source has no version info
-            allowed_when_source_clean = [
-                'remaster', 'remastered', 'remastered version', 'remastered edition',
-                'stereo', 'mono', 'original', 'album version', 'single version',
-                'explicit', 'clean', 'radio edit', 'radio version',
-                # Soundtrack and compilation variants (common after dash removal)
-                'soundtrack', 'from', 'motion picture', 'movie', 'film',
-                'ost', 'original soundtrack', 'original motion picture soundtrack'
-            ]
-            
-            # Check if any Plex version info is problematic
-            for extra in plex_extras:
-                extra_clean = extra.lower().strip()
-                
-                # Check if it's an allowed type - if not, reject it
-                is_allowed = any(allowed in extra_clean for allowed in allowed_when_source_clean)
-                
-                if not is_allowed:
-                    # Reject ANY version info that's not explicitly allowed
-                    logging.debug(f"Rejecting version: '{plex_title}' (contains '{extra}') for clean source: '{source_title}'")
-                    return False
-                
-                # Allow featuring/with variations (user requested)
-                # if any(feat_term in extra_clean for feat_term in ['feat', 'featuring', 'ft.', 'with']):
-                #     logging.debug(f"Rejecting featuring version: '{plex_title}' for clean source: '{source_title}'")
-                #     return False
-        
-        # If source has version info, match more permissively but still filter obvious mismatches
-        else:
-            # Check for major version type mismatches
-            source_has_live = any('live' in extra.lower() for extra in source_extras)
-            plex_has_live = any('live' in extra.lower() for extra in plex_extras)
-            
-            # Don't match live to non-live or vice versa
-            if source_has_live != plex_has_live:
-                logging.debug(f"Rejecting live/non-live mismatch: '{source_title}' vs '{plex_title}'")
-                return False
-            
-            # Check for remix/version compatibility using STRICT matching (85% similarity required)
-            from fuzzywuzzy import fuzz
-            
-            remix_terms = ['remix', 'mix', 'version', 'edit', 'extended', 'radio', 'club', 'dance', 'house', 'vocal', 'instrumental']
-            
-            source_remixes = [extra.lower() for extra in source_extras if any(term in extra.lower() for term in remix_terms)]
-            plex_remixes = [extra.lower() for extra in plex_extras if any(term in extra.lower() for term in remix_terms)]
-            
-            # If neither has remix info, they're compatible
-            if not source_remixes and not plex_remixes:
-                pass  # Compatible
-            # If only one has remix info, reject (strict matching for remixes)
-            elif bool(source_remixes) != bool(plex_remixes):
-                logging.debug(f"Remix mismatch: source has {source_remixes}, plex has {plex_remixes}")
-                return False
-            # Both have remix info - check similarity (require 85%)
-            elif source_remixes and plex_remixes:
-                best_similarity = 0
-                for source_remix in source_remixes:
-                    for plex_remix in plex_remixes:
-                        similarity = fuzz.ratio(source_remix, plex_remix)
-                        best_similarity = max(best_similarity, similarity)
-                        logging.debug(f"Comparing remix versions: '{source_remix}' vs '{plex_remix}' = {similarity}%")
-                
-                if best_similarity >= 85:
-                    logging.debug(f"Remix versions compatible: {best_similarity}% similarity")
-                else:
-                    logging.debug(f"Remix versions incompatible: only {best_similarity}% similarity (need 85%)")
-                    return False
-        
-        return True
+        """Check if a Plex track version is acceptable for matching against a source track"""
+        return is_acceptable_version_match(source_title, plex_title, self.strategy.allowed_versions)
     
     def extract_version_info(self, title):
         """Extract version information from parentheses and brackets in track title"""
-        import re
-        
-        # Find all content in parentheses and brackets
-        patterns = [
-            r'\(([^)]+)\)',  # Content in parentheses
-            r'\[([^\]]+)\]'  # Content in brackets
-        ]
-        
-        extras = []
-        for pattern in patterns:
-            matches = re.findall(pattern, title)
-            extras.extend(matches)
-        
-        return extras
+        return extract_version_info(title)
     
     def get_version_preference_bonus(self, title):
-        """
-        Give preference bonus to certain track versions.
-        Returns a small bonus score to prefer remastered versions.
-        """
-        title_lower = title.lower()
-        # Check if playlist is specifically acoustic/unplugged themed
-        playlist_is_acoustic = any(term in self.current_playlist_name for term in ['acoustic', 'unplugged', 'mtv unplugged'])
-        
-        # Check for penalties first (less preferred versions)
-        penalties = [
-            ('live', -5.0),         # Live versions get penalty but are still available
-            ('concert', -5.0),
-            ('tour', -5.0),
-            ('demo', -3.0),         # Demo versions get penalty
-        ]
-        
-        # Only penalize acoustic/unplugged if the playlist isn't specifically acoustic
-        if not playlist_is_acoustic:
-            penalties.extend([
-                ('acoustic', -2.0),     # Acoustic versions get penalty
-                ('unplugged', -3.0),    # Unplugged versions get penalty
-            ])
-        else:
-            # If playlist IS acoustic, give bonus to acoustic versions
-            if 'acoustic' in title_lower:
-                return 2.0  # Bonus for acoustic in acoustic playlist
-            if 'unplugged' in title_lower:
-                return 3.0  # Bonus for unplugged in unplugged playlist
-        
-        penalty = 0.0
-        for keyword, penalty_value in penalties:
-            if keyword in title_lower:
-                penalty = min(penalty, penalty_value)  # Take largest applicable penalty
-        
-        # Preferred version keywords (bonuses)
-        preferred_versions = [
-            ('remaster', 3.0),      # Highest preference
-            ('remastered', 3.0),
-            ('remastered edition', 3.5),
-            ('remastered version', 3.5),
-            ('2021 remaster', 4.0), # Recent remasters get slight extra bonus
-            ('2020 remaster', 4.0),
-            ('2019 remaster', 4.0),
-            ('deluxe', 1.0),        # Lower preference
-            ('deluxe edition', 1.0),
-            ('expanded', 1.0),
-            ('anniversary', 2.0),   # Medium preference
-        ]
-        
-        bonus = 0.0
-        for keyword, bonus_value in preferred_versions:
-            if keyword in title_lower:
-                bonus = max(bonus, bonus_value)  # Take highest applicable bonus
-        
-        return bonus + penalty  # Combine bonus and penalty
+        """Preference bonus for remastered versions, aware of acoustic/unplugged playlists"""
+        return get_version_preference_bonus(title, self.current_playlist_name)
 
 class ModernButton(QPushButton):
     def __init__(self, *args, **kwargs):
@@ -5856,6 +7449,7 @@ class PlexPlaylistManager(QMainWindow):
         self.export_thread = None  # Add export thread tracking
         self.backup_thread = None  # Add backup thread tracking
         self.batch_track_count_thread = None  # Add batch track count thread
+        self.library_index_thread = None  # Builds the local library index in the background
         self.loading_dialog = None
         self.playlist_cache = PlaylistCache()  # Initialize cache system
         self.track_count_threads = {}  # Keep track of background track count loading
@@ -6487,7 +8081,8 @@ class PlexPlaylistManager(QMainWindow):
     def handle_manual_search(self, source_track, library_section):
         """Handle manual search dialog on main thread"""
         try:
-            dialog = ManualSearchDialog(source_track, library_section, self)
+            library_index = getattr(self.converter_thread, 'library_index', None) if hasattr(self, 'converter_thread') else None
+            dialog = ManualSearchDialog(source_track, library_section, self, library_index=library_index)
             
             if dialog.exec_() == QDialog.Accepted and dialog.selected_track:
                 # User selected a track
@@ -6675,12 +8270,13 @@ class PlexPlaylistManager(QMainWindow):
         if self.loading_dialog:
             self.loading_dialog.update_progress(message, percentage)
     
-    def on_sorting_complete(self, playlist_name, matched_count, total_count):
+    def on_sorting_complete(self, playlist_name, matched_count, total_count, move_count):
         """Handle sorting completion"""
         self.hide_loading()
         QMessageBox.information(self, "Sorting Complete", 
                               f"✅ Sorted '{playlist_name}' successfully!\n\n"
-                              f"Matched {matched_count} out of {total_count} tracks from streaming service.")
+                              f"Matched {matched_count} out of {total_count} tracks from streaming service.\n"
+                              f"Reordered with {move_count} move(s); unmatched tracks kept their place.")
         self.fetch_playlists()  # Refresh playlist list
     
     def on_sorting_error(self, error_message):
@@ -7080,6 +8676,31 @@ class PlexPlaylistManager(QMainWindow):
             }
         """)
         streaming_layout.addWidget(self.add_to_sync_checkbox)
+        
+        self.review_queue_checkbox = QCheckBox("📋 Review uncertain matches at the end (unattended import)")
+        self.review_queue_checkbox.setToolTip("Don't stop for confirmations during the import - uncertain tracks are listed for review once it finishes")
+        self.review_queue_checkbox.setStyleSheet("""
+            QCheckBox {
+                font-weight: bold;
+                color: #00bcd4;
+                padding: 5px;
+            }
+            QCheckBox::indicator {
+                width: 18px;
+                height: 18px;
+            }
+            QCheckBox::indicator:unchecked {
+                border: 2px solid #00bcd4;
+                background-color: transparent;
+                border-radius: 3px;
+            }
+            QCheckBox::indicator:checked {
+                border: 2px solid #00bcd4;
+                background-color: #00bcd4;
+                border-radius: 3px;
+            }
+        """)
+        streaming_layout.addWidget(self.review_queue_checkbox)
     
         self.import_playlist_button = QPushButton("Import Playlist to Plex")
         self.import_playlist_button.clicked.connect(self.import_streaming_playlist)
@@ -8226,18 +9847,21 @@ Last Analyzed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         
             if token:
                 # Use the provided token to connect directly
-                self.plex_server = PlexServer(base_url, token)
+                self.plex_server = connect_plex_server(base_url, token)
             else:
                 # Authenticate with username and password to get the token
-                account = MyPlexAccount(username, password)
+                account = MyPlexAccount(username, password, session=get_plex_session(), timeout=PLEX_REQUEST_TIMEOUT)
                 token = account.authenticationToken
                 self.token_input.setText(token)
-                self.plex_server = PlexServer(base_url, token)
+                self.plex_server = connect_plex_server(base_url, token)
         
+            # Sections to match across are resolved again for the new connection
+            clear_match_section_ids()
             self.populate_library_sections()
             self.populate_sync_playlist_combo()
             self.statusBar().showMessage("Successfully connected to Plex.")
             self.save_config()
+            self.start_library_index_build()
         except Exception as e:
             logging.error(f"Error connecting to Plex: {str(e)}", exc_info=True)
             QMessageBox.critical(self, "Connection Error", f"Error connecting to Plex: {str(e)}")
@@ -8262,6 +9886,22 @@ Last Analyzed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             logging.error(f"Error populating library sections: {str(e)}", exc_info=True)
             QMessageBox.warning(self, "Section Error", f"Error loading library sections: {str(e)}")
 
+    def start_library_index_build(self):
+        """Load or build the local index of the selected music section in the background"""
+        section_id = self.section_combo.currentData()
+        if not self.plex_server or not section_id:
+            return
+        if self.library_index_thread and self.library_index_thread.isRunning():
+            return
+        self.library_index_thread = LibraryIndexThread(self.plex_server, section_id, self)
+        self.library_index_thread.progress_update.connect(lambda message: self.statusBar().showMessage(message))
+        self.library_index_thread.index_ready.connect(self.on_library_index_ready)
+        self.library_index_thread.error.connect(lambda error: logging.warning(f"Library index build failed: {error}"))
+        self.library_index_thread.start()
+
+    def on_library_index_ready(self, section_id, track_count):
+        self.statusBar().showMessage(f"📚 Library index ready: {track_count} tracks")
+
     def populate_sync_playlist_combo(self):
         """Populate the sync playlist combo box"""
         try:
@@ -8456,7 +10096,7 @@ Last Analyzed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             url = f"http://{plex_server}:{plex_port}/playlists/upload"
             params = {'sectionID': library_section_id, 'path': path, 'X-Plex-Token': plex_token}
             
-            response = requests.post(url, params=params)
+            response = plex_post(url, params=params)
             response.raise_for_status()
             
             self.statusBar().showMessage(f"'{playlist_name}' imported successfully.")
@@ -8492,9 +10132,17 @@ Last Analyzed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             
             # Get existing tracks in playlist
             existing_tracks = set()
+            existing_keys = set()
             for track in existing_playlist.items():
                 signature = f"{track.title}_{track.originalTitle or (track.artist().title if hasattr(track, 'artist') and track.artist() else '')}"
                 existing_tracks.add(signature.lower())
+                existing_keys.add(track.ratingKey)
+            
+            # Same engine (index, memo, caches) as import, sync and sort. This runs on the UI thread,
+            # so reuse the index start_library_index_build keeps current rather than refreshing here
+            engine = get_matching_engine(self.plex_server, library_section_id)
+            if engine.library_index is None:
+                engine.load_index(refresh=False)
             
             # Find new tracks to add
             tracks_to_add = []
@@ -8502,10 +10150,12 @@ Last Analyzed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
                 track_signature = track_info.lower()
                 if track_signature not in existing_tracks:
                     # Try to find track in Plex library
-                    plex_track = self.find_best_match_for_merge(library_section, track_info)
-                    if plex_track:
+                    plex_track = self.find_best_match_for_merge(library_section, track_info, engine)
+                    if plex_track and plex_track.ratingKey not in existing_keys:
                         tracks_to_add.append(plex_track)
+                        existing_keys.add(plex_track.ratingKey)
             
+            tracks_to_add = resolve_indexed_tracks(self.plex_server, tracks_to_add)
             if tracks_to_add:
                 existing_playlist.addItems(tracks_to_add)
                 QMessageBox.information(self, "Merge Complete", 
@@ -8520,96 +10170,25 @@ Last Analyzed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             logging.error(f"Error merging playlist: {str(e)}")
             QMessageBox.critical(self, "Merge Error", f"Failed to merge playlist: {str(e)}")
     
-    def find_best_match_for_merge(self, library_section, track):
-        """Find best match for a track during merge operation"""
+    def find_best_match_for_merge(self, library_section, track, engine=None):
+        """Find best match for a track during merge operation, with the merge's engine when given"""
         try:
             title, artist = self.parse_track_info(track)
-            
-            # Skip very short titles that would cause excessive matches
-            if len(title.strip()) < 3:
-                logging.debug(f"Skipping search for very short title: '{title}'")
-                return None
-            
-            # Use artist-first search approach for better efficiency
-            all_tracks = []
-            
-            # If we have artist info, search within artist's tracks first
-            if artist and artist.strip():
-                try:
-                    logging.debug(f"Merge: Searching for artist '{artist}' first")
-                    artist_results = library_section.searchArtists(title=artist)
-                    
-                    if artist_results:
-                        # Found artist(s), search within their tracks
-                        for artist_obj in artist_results[:3]:  # Check top 3 artist matches
-                            try:
-                                artist_tracks = artist_obj.tracks()
-                                logging.debug(f"Merge: Found {len(artist_tracks)} tracks by '{artist_obj.title}'")
-                                
-                                # Search for title within this artist's tracks
-                                matching_tracks = [
-                                    track for track in artist_tracks 
-                                    if self.fuzzy_title_match(title, track.title)
-                                ]
-                                all_tracks.extend(matching_tracks)
-                                logging.debug(f"Merge: Artist '{artist_obj.title}' title search found {len(matching_tracks)} tracks")
-                                
-                            except Exception as e:
-                                logging.warning(f"Merge: Error searching tracks for artist '{artist_obj.title}': {e}")
-                                
-                    else:
-                        logging.debug(f"Merge: No artist found for '{artist}', skipping library-wide search")
-                        # Don't fall back to expensive library-wide search for merge operations
-                        
-                except Exception as e:
-                    logging.warning(f"Merge: Artist search failed for '{artist}': {e}")
-            
-            # If artist search didn't yield results, return None instead of library-wide search
-            if not all_tracks:
-                logging.debug(f"Merge: No artist-specific results found for '{title}' by '{artist}' - returning None")
-                return None
-            
-            best_match = None
-            best_score = 0
-            
-            for plex_track in all_tracks:
-                plex_title = plex_track.title if plex_track.title else ""
-                
-                # Debug: Log the exact track details
-                logging.debug(f"Plex track found (merge): ID={plex_track.ratingKey}, Title='{plex_title}', Artist='{plex_track.originalTitle or (plex_track.artist().title if plex_track.artist() else 'Unknown')}'")
-                
-                # Apply version filtering before scoring
-                if not self.is_acceptable_version_match(title, plex_title):
-                    logging.debug(f"Skipping version mismatch during merge: '{title}' vs '{plex_title}'")
-                    continue
-                
-                title_score = fuzz.token_set_ratio(title.lower(), plex_title.lower())
-                
-                artist_score = 0
-                if artist and plex_track.originalTitle:
-                    artist_score = fuzz.token_set_ratio(artist.lower(), plex_track.originalTitle.lower())
-                elif hasattr(plex_track, 'artist') and plex_track.artist():
-                    artist_score = fuzz.token_set_ratio(artist.lower(), plex_track.artist().title.lower())
-                
-                combined_score = (title_score * 0.7) + (artist_score * 0.3)
-                
-                # Apply preference bonus for remastered versions
-                preference_bonus = self.get_version_preference_bonus(plex_title)
-                final_score = combined_score + preference_bonus
-                
-                if final_score > best_score and combined_score >= 70:  # Must meet base threshold
-                    best_score = final_score
-                    best_match = plex_track
-            
-            if best_match:
-                return best_match
-            else:
-                return None
-                
+            if engine is None:
+                engine = get_matching_engine(self.plex_server, library_section.key)
+            return engine.find_best_match(library_section, title, artist, MergeMatchStrategy())
         except Exception as e:
             logging.error(f"Error finding match for track: {str(e)}")
             return None
 
+    def clean_artist_name(self, artist):
+        """Clean artist name for better matching - removes remaster info, years, and featured artists"""
+        return clean_artist_name(artist)
+
+    def fuzzy_title_match(self, search_title, plex_title):
+        """Fuzzy matching for titles to handle common variations like apostrophes, spacing, etc."""
+        return fuzzy_title_match(search_title, plex_title)
+
     def parse_track_info(self, track):
         """Parse track info into title and artist - handles both string and dict formats"""
         # Handle new structured format with album info
@@ -8634,112 +10213,6 @@ Last Analyzed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         
         return '', ''
     
-    def is_acceptable_version_match(self, source_title, plex_title):
-        """
-        Check if a Plex track version is acceptable for matching against a source track.
-        Filters out unwanted versions like live recordings, remixes, etc.
-        """
-        import re
-        
-        # Normalize titles for comparison
-        source_lower = source_title.lower().strip()
-        plex_lower = plex_title.lower().strip()
-        
-        # Extract content in parentheses and brackets from both titles
-        source_extras = self.extract_version_info(source_title)
-        plex_extras = self.extract_version_info(plex_title)
-        
-        # If source has no version info, be strict about Plex versions
-        if not source_extras:
-            # Allowed version types even when source has no version info
-            allowed_when_source_clean = [
-                'remaster', 'remastered', 'remastered version', 'remastered edition',
-                'stereo', 'mono', 'original', 'album version', 'single version',
-                'explicit', 'clean', 'radio edit', 'radio version'
-            ]
-            
-            # Check if any Plex version info is problematic
-            for extra in plex_extras:
-                extra_clean = extra.lower().strip()
-                
-                # Check if it's an allowed type - if not, reject it
-                is_allowed = any(allowed in extra_clean for allowed in allowed_when_source_clean)
-                    
-                if not is_allowed:
-                    # Reject ANY version info that's not explicitly allowed
-                    logging.debug(f"Rejecting version: '{plex_title}' (contains '{extra}') for clean source: '{source_title}'")
-                    return False
-                
-                # Allow live versions - they'll get lower preference but still be available
-                # (Removed automatic rejection of live versions)
-                
-                    return False
-                
-                # Allow featuring/with variations (user requested)
-                # if any(feat_term in extra_clean for feat_term in ['feat', 'featuring', 'ft.', 'with']):
-                #     logging.debug(f"Rejecting featuring version: '{plex_title}' for clean source: '{source_title}'")
-                #     return False
-        
-        # If source has version info, match more permissively but still filter obvious mismatches
-        else:
-            # Check for major version type mismatches
-            source_has_live = any('live' in extra.lower() for extra in source_extras)
-            plex_has_live = any('live' in extra.lower() for extra in plex_extras)
-            
-            # Don't match live to non-live or vice versa
-            if source_has_live != plex_has_live:
-                logging.debug(f"Rejecting live/non-live mismatch: '{source_title}' vs '{plex_title}'")
-                return False
-            
-            # Check for remix/version compatibility using STRICT matching (85% similarity required)
-            from fuzzywuzzy import fuzz
-            
-            remix_terms = ['remix', 'mix', 'version', 'edit', 'extended', 'radio', 'club', 'dance', 'house', 'vocal', 'instrumental']
-            
-            source_remixes = [extra.lower() for extra in source_extras if any(term in extra.lower() for term in remix_terms)]
-            plex_remixes = [extra.lower() for extra in plex_extras if any(term in extra.lower() for term in remix_terms)]
-            
-            # If neither has remix info, they're compatible
-            if not source_remixes and not plex_remixes:
-                pass  # Compatible
-            # If only one has remix info, reject (strict matching for remixes)
-            elif bool(source_remixes) != bool(plex_remixes):
-                logging.debug(f"Remix mismatch: source has {source_remixes}, plex has {plex_remixes}")
-                return False
-            # Both have remix info - check similarity (require 85%)
-            elif source_remixes and plex_remixes:
-                best_similarity = 0
-                for source_remix in source_remixes:
-                    for plex_remix in plex_remixes:
-                        similarity = fuzz.ratio(source_remix, plex_remix)
-                        best_similarity = max(best_similarity, similarity)
-                        logging.debug(f"Comparing remix versions: '{source_remix}' vs '{plex_remix}' = {similarity}%")
-                
-                if best_similarity >= 85:
-                    logging.debug(f"Remix versions compatible: {best_similarity}% similarity")
-                else:
-                    logging.debug(f"Remix versions incompatible: only {best_similarity}% similarity (need 85%)")
-                    return False
-        
-        return True
-    
-    def extract_version_info(self, title):
-        """Extract version information from parentheses and brackets in track title"""
-        import re
-        
-        # Find all content in parentheses and brackets
-        patterns = [
-            r'\(([^)]+)\)',  # Content in parentheses
-            r'\[([^\]]+)\]'  # Content in brackets
-        ]
-        
-        extras = []
-        for pattern in patterns:
-            matches = re.findall(pattern, title)
-            extras.extend(matches)
-        
-        return extras
-
     def export_selected_playlists(self):
         selected_items = [self.playlist_listwidget.item(i) for i in range(self.playlist_listwidget.count()) 
                           if self.playlist_listwidget.item(i).checkState() == Qt.Checked]
@@ -8926,6 +10399,7 @@ Last Analyzed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             # STORE THE SYNC MANAGER INFO
             self.converter_thread.original_url = playlist_url
             self.converter_thread.add_to_sync = self.add_to_sync_checkbox.isChecked()
+            self.converter_thread.review_mode = self.review_queue_checkbox.isChecked()
             
             # NEW: Connect the track match confirmation signal
             self.converter_thread.track_match_confirmation_needed.connect(self.handle_track_match_confirmation)
@@ -9004,6 +10478,9 @@ Last Analyzed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         self.streaming_progress.setVisible(False)
         self.statusBar().showMessage("Playlist conversion completed successfully.")
         
+        if getattr(self.converter_thread, 'review_queue', None):
+            self.review_queued_matches(self.converter_thread)
+        
         # Check if we should add to sync manager
         if hasattr(self.converter_thread, 'add_to_sync') and self.converter_thread.add_to_sync:
             try:
@@ -9031,6 +10508,21 @@ Last Analyzed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         # Refresh playlist list
         self.fetch_playlists()
 
+    def review_queued_matches(self, converter):
+        """Let the user resolve the tracks a review-mode import queued, then add them in one go"""
+        try:
+            library_section = self.plex_server.library.sectionByID(converter.library_section)
+            dialog = ReviewQueueDialog(converter.review_queue, library_section, self, library_index=converter.library_index)
+            if dialog.exec_() != QDialog.Accepted:
+                self.statusBar().showMessage(f"Review skipped - {len(converter.review_queue)} tracks were not added")
+                return
+            
+            added = converter.apply_review_resolutions(dialog.get_resolutions())
+            self.statusBar().showMessage(f"✅ Added {added} reviewed tracks to '{converter.final_playlist_name}'")
+        except Exception as e:
+            logging.error(f"Error applying reviewed matches: {str(e)}")
+            QMessageBox.warning(self, "Review Error", f"Failed to add the reviewed tracks:\n{str(e)}")
+
     def conversion_error(self, error_msg):
         self.streaming_progress.setVisible(False)
         logging.error(f"Conversion error: {error_msg}")
@@ -9325,6 +10817,11 @@ Last Analyzed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             if self.batch_track_count_thread and self.batch_track_count_thread.isRunning():
                 self.batch_track_count_thread.stop()
                 self.batch_track_count_thread.wait(3000)
+            
+            if self.library_index_thread and self.library_index_thread.isRunning():
+                # Never terminate - the thread may be saving the index to disk
+                self.library_index_thread.requestInterruption()
+                self.library_index_thread.wait()
                 
             if hasattr(self, 'duplicates_thread') and self.duplicates_thread.isRunning():
                 self.duplicates_thread.terminate()
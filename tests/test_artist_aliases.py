@@ -0,0 +1,59 @@
+"""
+Artist alias table of LibraryIndex: band names stay whole, collaboration credits are split.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import main  # noqa: E402
+
+
+def library(*tracks):
+    """In-memory index from (album artist, track artist credit) pairs, one track each"""
+    library_index = main.LibraryIndex('test', 'test')
+    rows = {}
+    artist_keys = {}
+    for rating_key, (album_artist, credit) in enumerate(tracks, start=1):
+        row = dict.fromkeys(main.LibraryIndex.FIELDS, '')
+        row.update({'ratingKey': rating_key, 'title': f"Song {rating_key}", 'original_title': credit,
+                    'album_artist': album_artist, 'album': 'Album', 'duration': 200000,
+                    'artist_key': artist_keys.setdefault(album_artist, 100 + len(artist_keys)),
+                    'album_key': rating_key, 'index': 1, 'added_at': 0, 'updated_at': 0})
+        rows[rating_key] = row
+    library_index.rows = rows
+    library_index.rebuild_lookups()
+    return library_index
+
+
+def names(artists):
+    return [artist.title for artist in artists]
+
+
+def test_band_names_are_not_split():
+    library_index = library(('Earth, Wind & Fire', 'Earth, Wind & Fire'),
+                            ('Belle and Sebastian', 'Belle and Sebastian'),
+                            ('Florence + the Machine', 'Florence + the Machine'))
+    assert not library_index.has_artist('Sebastian')
+    assert not library_index.has_artist('Wind')
+    assert not library_index.has_artist('Machine')
+    assert names(library_index.search_artists('Earth Wind and Fire')) == []
+    assert names(library_index.search_artists('Earth, Wind & Fire')) == ['Earth, Wind & Fire']
+
+
+def test_contains_scan_still_runs_for_credit_only_names():
+    # "Sebastian" is credited on a compilation track, and is also part of a real album artist's name
+    library_index = library(('Various Artists', 'Sebastian'), ('Sebastian Tellier', 'Sebastian Tellier'))
+    assert names(library_index.search_artists('Sebastian')) == ['Sebastian Tellier', 'Various Artists']
+
+
+def test_collaboration_credits_are_split():
+    library_index = library(('Daft Punk', 'Daft Punk feat. Pharrell Williams'))
+    assert library_index.has_artist('Pharrell Williams')
+    assert names(library_index.search_artists('Pharrell Williams')) == ['Daft Punk']
+
+
+def test_list_credits_split_only_between_known_artists():
+    library_index = library(('Simon', 'Simon'), ('Garfunkel', 'Garfunkel'), ('Various Artists', 'Simon, Garfunkel'))
+    assert set(names(library_index.search_artists('Simon, Garfunkel'))) >= {'Simon', 'Garfunkel'}
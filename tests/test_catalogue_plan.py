@@ -0,0 +1,116 @@
+"""
+CataloguePlan: every artist, discography and named album of the source playlist is fetched
+from Plex once, up front.
+"""
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import main  # noqa: E402
+
+
+class FakeAlbum:
+    def __init__(self, rating_key, title, calls):
+        self.ratingKey = rating_key
+        self.title = title
+        self.calls = calls
+
+    def tracks(self):
+        self.calls.append(('album tracks', self.title))
+        return [f"{self.title} track"]
+
+
+class FakeArtist:
+    def __init__(self, rating_key, title, album_titles, calls):
+        self.ratingKey = rating_key
+        self.title = title
+        self.calls = calls
+        self.album_list = [FakeAlbum(rating_key * 10 + i, album_title, calls)
+                           for i, album_title in enumerate(album_titles)]
+
+    def tracks(self):
+        self.calls.append(('artist tracks', self.title))
+        return []
+
+    def albums(self):
+        self.calls.append(('albums', self.title))
+        return self.album_list
+
+
+def source(title, artist, album):
+    return {'title': title, 'artist': artist, 'album': album}
+
+
+def parse(track):
+    return track['title'], track['artist'], track['album']
+
+
+def test_plan_prefetches_named_albums_once():
+    calls = []
+    artist = FakeArtist(1, 'Radiohead', ['OK Computer', 'Kid A', 'Amnesiac'], calls)
+    plan = main.CataloguePlan('section', lambda section, name: [artist])
+    plan.plan([source('Airbag', 'Radiohead', 'OK Computer'),
+               source('Lucky', 'Radiohead', 'OK Computer'),
+               source('Idioteque', 'Radiohead', 'Kid A')], parse)
+
+    assert ('album tracks', 'OK Computer') in calls
+    assert ('album tracks', 'Kid A') in calls
+    assert ('album tracks', 'Amnesiac') not in calls
+
+    # The match loop now reads from the cache without going back to Plex
+    fetched = len(calls)
+    ok_computer, kid_a = artist.album_list[:2]
+    assert plan.tracks_for_album(ok_computer) == ['OK Computer track']
+    assert plan.tracks_for_album(kid_a) == ['Kid A track']
+    assert plan.albums_for_artist(artist) is artist.album_list
+    assert len(calls) == fetched
+
+
+def test_plan_skips_albums_when_source_has_none():
+    calls = []
+    artist = FakeArtist(1, 'Radiohead', ['OK Computer'], calls)
+    plan = main.CataloguePlan('section', lambda section, name: [artist])
+    plan.plan([source('Airbag', 'Radiohead', 'Unknown Album')], parse)
+    assert calls == []
+
+
+def test_concurrent_misses_fetch_once():
+    calls = []
+
+    class SlowArtist(FakeArtist):
+        def albums(self):
+            time.sleep(0.05)
+            return super().albums()
+
+    artist = SlowArtist(1, 'Radiohead', ['OK Computer'], calls)
+    plan = main.CataloguePlan('section', lambda section, name: [artist])
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: plan.albums_for_artist(artist), range(8)))
+    assert calls == [('albums', 'Radiohead')]
+    assert all(result is artist.album_list for result in results)
+
+
+def test_failed_fetch_is_retried():
+    attempts = []
+    lock = threading.Lock()
+
+    def search(section, name):
+        with lock:
+            attempts.append(name)
+            if len(attempts) == 1:
+                raise ConnectionError('timed out')
+        return ['artist']
+
+    plan = main.CataloguePlan('section', search)
+    with pytest.raises(ConnectionError):
+        plan.search_artists('Radiohead')
+    assert plan.search_artists('Radiohead') == ['artist']
+    assert plan.search_artists('radiohead ') == ['artist']
+    assert len(attempts) == 2
@@ -0,0 +1,58 @@
+"""
+LibraryIndex.save replaces the index file in one step, so a failed or interrupted save keeps
+the previous index.
+"""
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import main  # noqa: E402
+
+
+@pytest.fixture
+def index_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, 'LIBRARY_INDEX_FILE', str(tmp_path / 'library_index_{section_id}.json'))
+    return tmp_path / 'library_index_1.json'
+
+
+def library(*titles):
+    library_index = main.LibraryIndex('1', 'server')
+    rows = {}
+    for rating_key, title in enumerate(titles, start=1):
+        row = dict.fromkeys(main.LibraryIndex.FIELDS, '')
+        row.update({'ratingKey': rating_key, 'title': title, 'album_artist': 'Artist', 'album': 'Album',
+                    'duration': 200000, 'artist_key': 1, 'album_key': 1, 'index': rating_key,
+                    'added_at': 0, 'updated_at': 0})
+        rows[rating_key] = row
+    library_index.rows = rows
+    library_index.built_at = 1
+    library_index.rebuild_lookups()
+    return library_index
+
+
+def test_save_round_trips_without_leftovers(index_file):
+    library('One', 'Two').save()
+    assert os.listdir(index_file.parent) == [index_file.name]
+
+    loaded = main.LibraryIndex('1', 'server')
+    assert loaded.load()
+    assert sorted(row['title'] for row in loaded.rows.values()) == ['One', 'Two']
+
+
+def test_failed_save_keeps_previous_index(index_file, monkeypatch):
+    library('One').save()
+    before = index_file.read_text(encoding='utf-8')
+
+    def broken_dump(data, f, **kwargs):
+        f.write('{"version":')
+        raise OSError('disk full')
+
+    monkeypatch.setattr(main.json, 'dump', broken_dump)
+    library('One', 'Two').save()
+    assert index_file.read_text(encoding='utf-8') == before
+    assert json.loads(before)['rows']
@@ -0,0 +1,58 @@
+"""
+Near-match tier of LibraryIndex.tiered_match: a few edits are a misspelling of the same title,
+never a different song by the same artist.
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import main  # noqa: E402
+
+
+def library(*titles, artist='The Beatles'):
+    """In-memory index holding one track per title by the same artist"""
+    library_index = main.LibraryIndex('test', 'test')
+    rows = {}
+    for rating_key, title in enumerate(titles, start=1):
+        row = dict.fromkeys(main.LibraryIndex.FIELDS, '')
+        row.update({'ratingKey': rating_key, 'title': title, 'album_artist': artist, 'album': 'Album',
+                    'duration': 200000, 'artist_key': 1, 'album_key': 1, 'index': rating_key,
+                    'added_at': 0, 'updated_at': 0})
+        rows[rating_key] = row
+    library_index.rows = rows
+    library_index.rebuild_lookups()
+    return library_index
+
+
+@pytest.mark.parametrize('source_title, library_title', [
+    ('Part I', 'Part II'),
+    ('Chapter IV', 'Chapter V'),
+    ('She Loves You', 'He Loves You'),
+    ('Love Song', 'Lover Song'),
+])
+def test_different_song_is_not_a_near_hit(source_title, library_title):
+    library_index = library(library_title)
+    assert library_index.tiered_match(source_title, 'The Beatles') == (None, None)
+
+
+def test_misspelled_word_is_a_near_hit():
+    library_index = library('Yesterday Once More')
+    plex_track, tier = library_index.tiered_match('Yesterdya Once More', 'The Beatles')
+    assert tier == 'near'
+    assert plex_track.title == 'Yesterday Once More'
+
+
+def test_edits_spread_over_two_words_are_not_a_near_hit():
+    library_index = library('Strawberry Fields Forever')
+    assert library_index.tiered_match('Strawbery Field Forever', 'The Beatles') == (None, None)
+
+
+def test_near_hit_needs_an_acceptable_version():
+    # One edit inside one word, but it turns a studio title into a live one
+    library_index = library('Yesterday Once More (Live)')
+    assert library_index.tiered_match('Yesterday Once More (Lve)', 'The Beatles') == (None, None)
+    assert library_index.tiered_match('Yesterdya Once More (Live)', 'The Beatles')[1] == 'near'
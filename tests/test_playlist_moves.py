@@ -0,0 +1,123 @@
+"""
+Minimal-edit playlist saves: plan_playlist_moves must reproduce the edited order with the
+fewest item moves, applied the way Plex does (each move puts an item right after another).
+"""
+import os
+import random
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import main  # noqa: E402
+
+
+def apply_plan(original_ids, removed, moves):
+    """Replay an edit script on a list like Plex's item delete and move endpoints"""
+    items = [item_id for item_id in original_ids if item_id not in set(removed)]
+    for item_id, after_id in moves:
+        items.remove(item_id)
+        items.insert(0 if after_id is None else items.index(after_id) + 1, item_id)
+    return items
+
+
+def lis_length(values):
+    """Longest strictly increasing subsequence length, quadratic reference version"""
+    best = []
+    for i, value in enumerate(values):
+        best.append(1 + max([best[j] for j in range(i) if values[j] < value], default=0))
+    return max(best, default=0)
+
+
+def test_empty_playlist():
+    assert main.plan_playlist_moves([], []) == ([], [])
+    assert main.longest_increasing_run([]) == []
+
+
+def test_deletions_only():
+    removed, moves = main.plan_playlist_moves([1, 2, 3, 4, 5], [1, 3, 5])
+    assert removed == [2, 4]
+    assert moves == []
+
+
+def test_single_moved_row():
+    edited = [1, 2, 5, 3, 4, 6]
+    removed, moves = main.plan_playlist_moves([1, 2, 3, 4, 5, 6], edited)
+    assert removed == []
+    assert moves == [(5, 2)]
+    assert apply_plan([1, 2, 3, 4, 5, 6], removed, moves) == edited
+
+
+def test_move_to_top():
+    removed, moves = main.plan_playlist_moves([1, 2, 3], [3, 1, 2])
+    assert moves == [(3, None)]
+
+
+def test_reversal_keeps_one_item():
+    original = list(range(1, 9))
+    edited = original[::-1]
+    removed, moves = main.plan_playlist_moves(original, edited)
+    assert len(moves) == len(original) - 1
+    assert apply_plan(original, removed, moves) == edited
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_random_edits_reproduce_the_order_with_fewest_moves(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        original = list(range(100, 100 + rng.randint(0, 40)))
+        edited = [item_id for item_id in original if rng.random() > 0.2]
+        if rng.random() < 0.3:
+            rng.shuffle(edited)
+        elif edited:
+            edited.insert(rng.randrange(len(edited)), edited.pop(rng.randrange(len(edited))))
+        removed, moves = main.plan_playlist_moves(original, edited)
+        assert apply_plan(original, removed, moves) == edited
+        positions = [original.index(item_id) for item_id in edited]
+        assert len(main.longest_increasing_run(positions)) == lis_length(positions)
+        assert len(moves) == len(edited) - lis_length(positions)
+
+
+class FakeItem:
+    def __init__(self, playlist_item_id):
+        self.playlistItemID = playlist_item_id
+
+
+class FakeServer:
+    """Records the item requests apply_playlist_moves sends"""
+    class _session:
+        put = 'PUT'
+        delete = 'DELETE'
+
+    def __init__(self):
+        self.requests = []
+
+    def query(self, key, method=None):
+        self.requests.append((method, key))
+
+
+class FakePlaylist:
+    key = '/playlists/7'
+
+    def __init__(self):
+        self._server = FakeServer()
+
+
+def test_sort_keeps_unmatched_items_in_place():
+    playlist = FakePlaylist()
+    thread = main.PlaylistSortingThread(playlist, 'https://example.invalid/playlist', None)
+    plex_tracks = [FakeItem(item_id) for item_id in range(1, 9)]
+    # Items 3 and 6 did not match the streaming playlist; the rest are wanted as 8, 1, 2, 4, 5, 7
+    ordered_tracks = [plex_tracks[i - 1] for i in (8, 1, 2, 4, 5, 7)]
+
+    move_count = thread.reorder_playlist(plex_tracks, ordered_tracks)
+
+    moves = [(key.split('/')[4], key.partition('after=')[2] or None) for _, key in playlist._server.requests]
+    # Matched slots become 8, 1, 2, 4, 5, 7 around the fixed 3 and 6: eight items, five already in order
+    assert move_count == len(moves) == 3
+    assert all(method == 'PUT' for method, _ in playlist._server.requests)
+    result = apply_plan(list(range(1, 9)), [], [(int(item_id), after_id and int(after_id)) for item_id, after_id in moves])
+    assert result == [8, 1, 3, 2, 4, 6, 5, 7]
+    assert result.index(3) == 2 and result.index(6) == 5
@@ -0,0 +1,55 @@
+"""
+End-of-import review queue: every queued item must carry the source track it was queued for.
+
+Runs the import matcher in review mode against the offline benchmark library (see
+tools/benchmark_matching.py), so nothing talks to Plex or a streaming service.
+"""
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tools'))
+
+
+@pytest.fixture
+def converter(tmp_path, monkeypatch):
+    # The match memo and index files are written to the working directory
+    monkeypatch.chdir(tmp_path)
+    from PyQt5.QtCore import QCoreApplication
+    app = QCoreApplication.instance() or QCoreApplication([])
+    import main
+    import benchmark_matching as bench
+
+    with open(bench.DEFAULT_CORPUS, encoding='utf-8') as f:
+        corpus = json.load(f)
+    library_index = bench.build_library(main, corpus, 2000, 1)
+    section = bench.BenchmarkSection(library_index)
+    thread = main.PlaylistConverterThread('review', section._server, section.key)
+    thread.library_index = bench.prime_engine(main, library_index, section).library_index
+    thread.review_mode = True
+    yield thread, section, bench.source_tracks(corpus)
+    app.processEvents()
+
+
+def test_queued_item_is_the_source_track(converter):
+    thread, section, tracks = converter
+    for position, track in enumerate(tracks):
+        thread.match_context.position = position
+        if thread.find_exact_match(track) is None:
+            thread.find_best_match(section, track)
+
+    assert thread.review_queue
+    suggested = 0
+    for item in thread.review_queue:
+        assert item['track'] is tracks[item['position']]
+        assert isinstance(item['track'], dict)
+        if item['reason'] in ('no_match', 'no_results'):
+            # Candidates are looked up from the source title, not from a library track
+            expected = [candidate.ratingKey for candidate, _ in thread.review_candidates(item['track'])]
+            assert [candidate.ratingKey for candidate, _ in item['candidates']] == expected
+            suggested += bool(expected)
+    assert suggested
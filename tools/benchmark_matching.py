@@ -0,0 +1,365 @@
+"""
+Offline benchmark for Syncra's track matchers.
+
+Runs the recorded corpus in benchmark_corpus.json against a synthetic music section
+(the corpus library padded with generated filler artists) and reports speed and
+accuracy for every matcher:
+
+    sync     SyncThread.find_best_match
+    import   PlaylistConverterThread (exact fast path, catalogue plan, find_best_match)
+    sort     PlaylistSortingThread.match_tracks (one batch for the whole playlist)
+    merge    PlexPlaylistManager.find_best_match_for_merge
+
+Nothing talks to Plex or a streaming service: the section is an in-memory LibraryIndex
+and the match memo / index files go to a throwaway directory. Prompts the import
+matcher would show are answered automatically (see --confirm).
+
+Usage:
+    python tools/benchmark_matching.py
+    python tools/benchmark_matching.py --library-size 50000 --repeat 3 --by-case
+    python tools/benchmark_matching.py --json results.json
+"""
+import argparse
+import collections
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CORPUS = os.path.join(ROOT, 'tools', 'benchmark_corpus.json')
+MATCHERS = ('sync', 'import', 'sort', 'merge')
+
+FILLER_SYLLABLES = ['ka', 'lo', 'mi', 'ra', 'ven', 'tor', 'sil', 'an', 'dre', 'mo', 'shi', 'el', 'ber', 'nu', 'ox', 'phe']
+FILLER_WORDS = ['love', 'night', 'fire', 'heart', 'dream', 'city', 'rain', 'light', 'gold', 'river', 'stone', 'blue',
+                'summer', 'home', 'run', 'wild', 'echo', 'shadow', 'ocean', 'star', 'road', 'time', 'girl', 'song']
+FILLER_SUFFIXES = ['', '', '', '', ' (Live)', ' - Remastered', ' (Remix)', ' (Acoustic)', ' (feat. Someone Else)']
+
+
+class ErrorCounter(logging.Handler):
+    """Counts ERROR records so matchers that fail internally don't look like clean misses"""
+    def __init__(self):
+        super().__init__(level=logging.ERROR)
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 1
+
+
+class BenchmarkServer:
+    """Just enough of a PlexServer for the matchers - nothing is fetched"""
+    machineIdentifier = 'benchmark'
+    _baseurl = 'http://benchmark.invalid'
+    _token = ''
+
+    def fetchItem(self, key):
+        raise LookupError(f"Benchmark server has no item {key}")
+
+
+class BenchmarkSection:
+    """Music section stand-in answering searches from the synthetic library index"""
+    def __init__(self, library_index):
+        self.library_index = library_index
+        self.key = library_index.section_id
+        self._server = BenchmarkServer()
+
+    def searchArtists(self, title=None, **kwargs):
+        return self.library_index.search_artists(title)
+
+    def searchTracks(self, title=None, **kwargs):
+        return self.library_index.search_tracks(title)
+
+
+def filler_name(rng, words):
+    return ' '.join(''.join(rng.choice(FILLER_SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+                    for _ in range(words))
+
+
+def build_library(main, corpus, library_size, seed):
+    """Corpus library plus generated filler tracks, as an in-memory LibraryIndex"""
+    rng = random.Random(seed)
+    library_index = main.LibraryIndex('benchmark', 'benchmark')
+    rows = {}
+    for entry in corpus['library']:
+        row = dict.fromkeys(main.LibraryIndex.FIELDS, '')
+        row.update(entry)
+        row['added_at'] = row['updated_at'] = 0
+        rows[row['ratingKey']] = row
+
+    rating_key = 1000000
+    artist_key = 2000000
+    album_key = 3000000
+    while len(rows) < library_size:
+        artist_key += 1
+        artist = filler_name(rng, rng.randint(1, 2))
+        for _ in range(rng.randint(1, 4)):
+            album_key += 1
+            album = ' '.join(rng.choice(FILLER_WORDS) for _ in range(rng.randint(1, 3))).title()
+            for index in range(1, rng.randint(6, 14)):
+                rating_key += 1
+                title = ' '.join(rng.choice(FILLER_WORDS) for _ in range(rng.randint(1, 4))).title()
+                rows[rating_key] = {
+                    'ratingKey': rating_key, 'title': title + rng.choice(FILLER_SUFFIXES), 'original_title': '',
+                    'album_artist': artist, 'album': album, 'duration': rng.randint(120, 420) * 1000,
+                    'file': '', 'artist_key': artist_key, 'album_key': album_key, 'index': index,
+                    'added_at': 0, 'updated_at': 0
+                }
+
+    library_index.rows = rows
+    library_index.built_at = time.time()
+    library_index.rebuild_lookups()
+    return library_index
+
+
+def source_tracks(corpus):
+    """Corpus tracks as the structured records the streaming fetchers produce"""
+    tracks = []
+    for entry in corpus['tracks']:
+        track = {key: entry.get(key) for key in ('title', 'artist', 'album', 'service', 'id', 'duration_ms', 'isrc')}
+        track['display'] = f"{entry['title']} - {entry['artist']}"
+        tracks.append(track)
+    return tracks
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def prime_engine(main, library_index, section):
+    """Register the section's shared matching engine with the synthetic index already loaded"""
+    engine = main.get_matching_engine(section._server, section.key)
+    engine.library_index = library_index
+    return engine
+
+
+def run_sync(main, library_index, section, tracks, options):
+    thread = main.SyncThread({}, section._server)
+    engine = prime_engine(main, library_index, section)
+    results = []
+    for track in tracks:
+        plex_track, elapsed = timed(thread.find_best_match, section, track, engine)
+        results.append((plex_track, elapsed))
+    return results, 0.0
+
+
+def run_import(main, library_index, section, tracks, options):
+    thread = main.PlaylistConverterThread('benchmark', section._server, section.key)
+    thread.library_index = prime_engine(main, library_index, section).library_index
+    # Answer prompts immediately instead of waiting on the UI
+    thread.track_match_confirmation_needed.connect(lambda *args: thread.set_user_response(options.confirm))
+    thread.manual_search_needed.connect(lambda *args: thread.set_user_response('skip'))
+    thread.artist_not_found_signal.connect(lambda *args: thread.set_user_response('skip'))
+
+    # Same order as create_plex_playlist: exact/near tiers for every track, then plan and score the rest
+    results = [timed(thread.find_exact_match, track) for track in tracks]
+    remaining = [track for track, (plex_track, _) in zip(tracks, results) if plex_track is None]
+    thread.catalogue = main.CataloguePlan(section, thread.lookup_artists)
+    _, plan_time = timed(thread.catalogue.plan, remaining, thread.parse_track_info)
+
+    for i, track in enumerate(tracks):
+        plex_track, elapsed = results[i]
+        if plex_track is None:
+            plex_track, match_time = timed(thread.find_best_match, section, track)
+            thread.engine.count('fuzzy' if plex_track else 'miss')
+            results[i] = (plex_track, elapsed + match_time)
+    thread.catalogue = None
+    return results, plan_time
+
+
+def run_sort(main, library_index, section, tracks, options, corpus):
+    thread = main.PlaylistSortingThread(None, 'benchmark', section._server)
+    # The playlist being sorted holds every expected track, shuffled, plus a few decoys
+    rng = random.Random(options.seed)
+    keys = [entry['expected'] for entry in corpus['tracks'] if entry['expected']]
+    decoys = [key for key in library_index.rows if key not in set(keys)]
+    keys += rng.sample(decoys, min(len(decoys), len(keys) // 5))
+    rng.shuffle(keys)
+    playlist = [library_index.get_track(key) for key in keys]
+
+    (assignment, _), elapsed = timed(thread.match_tracks, tracks, playlist)
+    per_track = elapsed / len(tracks) if tracks else 0.0
+    results = []
+    for i in range(len(tracks)):
+        plex_track = playlist[assignment[i][0]] if i in assignment else None
+        results.append((plex_track, per_track))
+    return results, 0.0
+
+
+def run_merge(main, library_index, section, tracks, options):
+    # The merge matcher lives on the main window; borrow its methods without building any UI
+    methods = {name: value for name, value in vars(main.PlexPlaylistManager).items()
+               if callable(value) and not name.startswith('__')}
+    host = type('MergeHost', (), methods)()
+    host.plex_server = section._server
+    engine = prime_engine(main, library_index, section)
+    results = []
+    for track in tracks:
+        plex_track, elapsed = timed(host.find_best_match_for_merge, section, track, engine)
+        results.append((plex_track, elapsed))
+    return results, 0.0
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def score(corpus, results):
+    """Precision/recall of the predicted ratingKeys, overall and per corpus case"""
+    def empty():
+        return {'tp': 0, 'fp': 0, 'fn': 0}
+
+    totals = empty()
+    cases = {}
+    misses = []
+    for entry, (plex_track, _) in zip(corpus['tracks'], results):
+        predicted = getattr(plex_track, 'ratingKey', None)
+        expected = entry['expected']
+        outcome = 'tp' if predicted is not None and predicted == expected else None
+        for counts in (totals, cases.setdefault(entry['case'], empty())):
+            if outcome:
+                counts['tp'] += 1
+                continue
+            if predicted is not None:
+                counts['fp'] += 1
+            if expected is not None:
+                counts['fn'] += 1
+        if not outcome and (predicted is not None or expected is not None):
+            misses.append((entry, predicted))
+    return totals, cases, misses
+
+
+def ratio(numerator, denominator):
+    return numerator / denominator if denominator else 1.0
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Offline speed/accuracy benchmark for Syncra's track matchers")
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS, help="Corpus JSON (default: tools/benchmark_corpus.json)")
+    parser.add_argument('--library-size', type=int, default=20000, help="Pad the synthetic section to this many tracks")
+    parser.add_argument('--matchers', default=','.join(MATCHERS), help=f"Comma separated subset of {', '.join(MATCHERS)}")
+    parser.add_argument('--repeat', type=int, default=1, help="Run every matcher this many times and keep the fastest run")
+    parser.add_argument('--confirm', choices=['use', 'skip'], default='use',
+                        help="Answer to medium-confidence prompts in the import matcher")
+    parser.add_argument('--seed', type=int, default=1, help="Seed for the filler library and sort playlist")
+    parser.add_argument('--by-case', action='store_true', help="Also print precision/recall per corpus case")
+    parser.add_argument('--show-misses', action='store_true', help="List every wrong or missing match")
+    parser.add_argument('--json', help="Write the results to this file as JSON")
+    parser.add_argument('--log-level', default='CRITICAL', help="Log level for the matchers' own logging")
+    options = parser.parse_args()
+
+    with open(options.corpus, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+
+    # Root stays at ERROR or below so the error counter sees failures even when they aren't printed
+    log_level = getattr(logging, options.log_level.upper())
+    console = logging.StreamHandler()
+    console.setLevel(log_level)
+    console.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+    errors = ErrorCounter()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(min(log_level, logging.ERROR))
+    root_logger.addHandler(console)
+    root_logger.addHandler(errors)
+
+    sys.path.insert(0, ROOT)
+    import main
+
+    runners = {'sync': run_sync, 'import': run_import, 'merge': run_merge,
+               'sort': lambda *args: run_sort(*args, corpus)}
+    selected = [name.strip() for name in options.matchers.split(',') if name.strip()]
+    unknown = [name for name in selected if name not in runners]
+    if unknown:
+        parser.error(f"Unknown matcher(s): {', '.join(unknown)}")
+
+    report = {'corpus': os.path.basename(options.corpus), 'tracks': len(corpus['tracks']), 'matchers': {}}
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir:
+        # Match memo and index files land here instead of next to the user's real ones
+        os.chdir(work_dir)
+        try:
+            library_index, build_time = timed(build_library, main, corpus, options.library_size, options.seed)
+            section = BenchmarkSection(library_index)
+            tracks = source_tracks(corpus)
+            report['library_tracks'] = len(library_index)
+            print(f"Synthetic section: {len(library_index)} tracks, {len(library_index.artists)} artists "
+                  f"(built in {build_time:.2f}s); corpus: {len(tracks)} source tracks\n")
+
+            for name in selected:
+                best = None
+                for _ in range(max(1, options.repeat)):
+                    # Every run starts from an empty match memo
+                    main.MATCH_MEMO = None
+                    if os.path.exists(main.MATCH_MEMO_FILE):
+                        os.remove(main.MATCH_MEMO_FILE)
+                    errors.count = 0
+                    engine = main.get_matching_engine(section._server, section.key)
+                    tier_hits_before = collections.Counter(engine.tier_hits)
+                    results, setup_time = runners[name](main, library_index, section, tracks, options)
+                    total_time = setup_time + sum(elapsed for _, elapsed in results)
+                    tiers = dict(engine.tier_hits - tier_hits_before)
+                    if best is None or total_time < best[1]:
+                        best = (results, total_time, errors.count, tiers)
+                results, total_time, error_count, tiers = best
+                latencies = [elapsed for _, elapsed in results]
+                totals, cases, misses = score(corpus, results)
+                report['matchers'][name] = {
+                    'tracks_per_second': ratio(len(results), total_time),
+                    'p50_ms': percentile(latencies, 0.50) * 1000,
+                    'p99_ms': percentile(latencies, 0.99) * 1000,
+                    'precision': ratio(totals['tp'], totals['tp'] + totals['fp']),
+                    'recall': ratio(totals['tp'], totals['tp'] + totals['fn']),
+                    'errors': error_count,
+                    'tiers': tiers,
+                    'cases': {case: {'precision': ratio(c['tp'], c['tp'] + c['fp']),
+                                     'recall': ratio(c['tp'], c['tp'] + c['fn'])} for case, c in cases.items()},
+                    'misses': [{'title': entry['title'], 'artist': entry['artist'], 'case': entry['case'],
+                                'expected': entry['expected'], 'predicted': predicted} for entry, predicted in misses]
+                }
+        finally:
+            os.chdir(original_cwd)
+
+    print(f"{'matcher':<8} {'tracks/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'precision':>10} {'recall':>8} {'errors':>7}")
+    for name, result in report['matchers'].items():
+        batch = '*' if name == 'sort' else ' '
+        print(f"{name:<8} {result['tracks_per_second']:>10.1f} {result['p50_ms']:>8.2f}{batch} {result['p99_ms']:>8.2f}{batch} "
+              f"{result['precision']:>10.3f} {result['recall']:>8.3f} {result['errors']:>7}")
+    if 'sort' in report['matchers']:
+        print("* sort matches the whole playlist in one batch - latency is the batch time per track")
+
+    tiered = {name: result['tiers'] for name, result in report['matchers'].items() if result['tiers']}
+    if tiered:
+        print("\nMatch tiers (tracks resolved by each tier of the shared engine):")
+        for name, tiers in tiered.items():
+            print(f"  {name:<8} " + ", ".join(f"{tier} {tiers.get(tier, 0)}" for tier in main.MatchingEngine.TIERS))
+
+    if options.by_case:
+        for name, result in report['matchers'].items():
+            print(f"\n{name}:")
+            for case, values in sorted(result['cases'].items()):
+                print(f"  {case:<12} precision {values['precision']:.3f}  recall {values['recall']:.3f}")
+
+    if options.show_misses:
+        by_key = {row['ratingKey']: row for row in corpus['library']}
+        for name, result in report['matchers'].items():
+            print(f"\n{name} misses:")
+            for miss in result['misses']:
+                predicted = by_key.get(miss['predicted'], {}).get('title', miss['predicted'])
+                expected = by_key.get(miss['expected'], {}).get('title', miss['expected'])
+                print(f"  [{miss['case']}] {miss['title']} - {miss['artist']}: expected {expected!r}, got {predicted!r}")
+
+    if options.json:
+        with open(options.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {options.json}")
+
+
+if __name__ == '__main__':
+    main_benchmark()